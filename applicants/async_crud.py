@@ -0,0 +1,41 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
+from applicants.models import Applicant, ResumeParseJob, ParseJobStatus
+from applicants.schemas import ApplicantCreate
+from applicants import crud
+from typing import Dict, Any
+
+# Async versions of applicants.crud. Writes run the sync functions through run_sync
+# so the search index, principal cache and matching hooks stay in one place.
+
+async def create_applicant(db: AsyncSession, applicant: ApplicantCreate, user_id: int, resume_text: str = None, skills: list = None, parsed_data: Dict[str, Any] = None, resume_path: str = None):
+    return await db.run_sync(lambda session: crud.create_applicant(session, applicant, user_id, resume_text, skills, parsed_data, resume_path))
+
+async def get_applicants(db: AsyncSession, skip: int = 0, limit: int = 100):
+    result = await db.execute(select(Applicant).offset(skip).limit(limit))
+    return result.scalars().all()
+
+async def get_applicant(db: AsyncSession, applicant_id: int):
+    return await db.get(Applicant, applicant_id)
+
+async def get_applicant_details(db: AsyncSession, applicant_id: int):
+    """get_applicant with the deferred resume text and parsed details loaded in the same query"""
+    result = await db.execute(select(Applicant).options(undefer_group("resume"), undefer_group("parsed")).filter(Applicant.id == applicant_id))
+    return result.scalars().first()
+
+async def get_applicant_by_user_id(db: AsyncSession, user_id: int):
+    result = await db.execute(select(Applicant).filter(Applicant.user_id == user_id))
+    return result.scalars().first()
+
+async def update_applicant_resume(db: AsyncSession, applicant_id: int, resume_text: str, skills: list, parsed_data: Dict[str, Any] = None, name: str = None, email: str = None):
+    return await db.run_sync(lambda session: crud.update_applicant_resume(session, applicant_id, resume_text, skills, parsed_data, name, email))
+
+async def delete_applicant(db: AsyncSession, applicant_id: int):
+    return await db.run_sync(lambda session: crud.delete_applicant(session, applicant_id))
+
+async def create_parse_job(db: AsyncSession, applicant_id: int, resume_path: str, status: ParseJobStatus = ParseJobStatus.queued):
+    return await db.run_sync(lambda session: crud.create_parse_job(session, applicant_id, resume_path, status))
+
+async def get_parse_job(db: AsyncSession, job_id: str):
+    return await db.get(ResumeParseJob, job_id)
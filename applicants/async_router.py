@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from database import get_async_db
+from auth.router import get_current_user
+from auth.models import User
+from applicants import schemas, async_crud
+
+# Routes migrated to the async data path, mounted ahead of applicants.router when USE_ASYNC_DB is on
+router = APIRouter()
+
+@router.get("/", response_model=List[schemas.ApplicantSummary])
+async def list_applicants(
+    skip: int = 0, 
+    limit: int = 100,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """List applicants - companies see all, applicants see only their own"""
+    if current_user.role.value == "company":
+        return await async_crud.get_applicants(db, skip=skip, limit=limit)
+    elif current_user.role.value == "applicant":
+        # Return only the current user's applicant profile
+        if current_user.applicant_id is None:
+            return []
+        applicant = await async_crud.get_applicant(db, applicant_id=current_user.applicant_id)
+        return [applicant] if applicant else []
+    else:
+        raise HTTPException(status_code=403, detail="Not authorized")
@@ -0,0 +1,280 @@
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from core.config import settings
+from database import SessionLocal
+from applicants.models import Applicant, BulkImportJob, ParseJobStatus
+from applicants import search
+from applicants.parse_cache import content_hash, get_cached_parse, store_parse
+from matching import sync as matching_sync
+
+# Bulk import of resume PDFs from a ZIP archive or a directory. Files are copied
+# to uploads/, parsed in a process pool (parse cache hits skip the pool), and the
+# applicants are inserted INSERT_BATCH_SIZE at a time, one transaction per batch;
+# when a batch fails its rows are retried one by one, so only the bad ones fail.
+# The in-memory matching state only changes once a batch has committed, and API
+# workers in other processes notice imports (including CLI ones) through the
+# match_versions counters.
+#
+# Imports run as bulk_import_jobs rows. Each one starts a parser pool as wide as
+# the machine, so only one may be queued or running at a time across every API
+# worker and CLI run: the unique "active" column admits a single active row. An
+# import whose heartbeat is older than BULK_IMPORT_STALE_SECONDS is taken to have
+# died with its process and gives up its slot.
+
+INSERT_BATCH_SIZE = 500
+HEARTBEAT_INTERVAL_SECONDS = 10
+
+class ImportInProgress(Exception):
+    """Another bulk import is queued or running"""
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def _init_worker():
+    # Import workers already run in their own processes, parse in-process there
+    settings.RESUME_PARSER_POOL_SIZE = 0
+
+def _parse_file(path: str):
+    from applicants.parser import parse_resume
+    try:
+        return parse_resume(path), None
+    except Exception as e:
+        return None, str(e)
+
+def _store_copy(source, upload_dir: str) -> str:
+    """Copy a file object to a new uploads/ file in chunks, enforcing the per-resume size limit"""
+    path = os.path.join(upload_dir, f"{uuid.uuid4()}.pdf")
+    copied = 0
+    with open(path, "wb") as target:
+        for chunk in iter(lambda: source.read(settings.UPLOAD_CHUNK_SIZE), b""):
+            copied += len(chunk)
+            if copied > settings.MAX_RESUME_UPLOAD_BYTES:
+                target.close()
+                os.remove(path)
+                raise ValueError(f"File exceeds the {settings.MAX_RESUME_UPLOAD_BYTES} byte limit")
+            target.write(chunk)
+    return path
+
+def collect_resumes(source_path: str, upload_dir: str = "uploads") -> Tuple[List[Tuple[str, str]], List[Dict[str, Any]]]:
+    """Copy the PDFs of a ZIP archive or directory to upload_dir.
+
+    Returns ([(file name, stored path)], [failure report entries]).
+    """
+    stored, failures = [], []
+    if zipfile.is_zipfile(source_path):
+        with zipfile.ZipFile(source_path) as archive:
+            for member in archive.infolist():
+                if member.is_dir():
+                    continue
+                if not member.filename.lower().endswith(".pdf"):
+                    failures.append({"file": member.filename, "status": "skipped", "error": "Not a PDF file"})
+                    continue
+                try:
+                    with archive.open(member) as source:
+                        stored.append((member.filename, _store_copy(source, upload_dir)))
+                except Exception as e:
+                    failures.append({"file": member.filename, "status": "failed", "error": str(e)})
+    elif os.path.isdir(source_path):
+        for root, _, files in os.walk(source_path):
+            for name in sorted(files):
+                relative_name = os.path.relpath(os.path.join(root, name), source_path)
+                if not name.lower().endswith(".pdf"):
+                    failures.append({"file": relative_name, "status": "skipped", "error": "Not a PDF file"})
+                    continue
+                try:
+                    with open(os.path.join(root, name), "rb") as source:
+                        stored.append((relative_name, _store_copy(source, upload_dir)))
+                except Exception as e:
+                    failures.append({"file": relative_name, "status": "failed", "error": str(e)})
+    else:
+        raise ValueError(f"{source_path} is neither a ZIP archive nor a directory")
+    return stored, failures
+
+def import_resumes(db: Session, source_path: str, user_id: int, workers: int = 0, upload_dir: str = "uploads",
+                   heartbeat: Callable[[], None] = lambda: None) -> Dict[str, Any]:
+    """Import every PDF under source_path as an applicant owned by user_id and report per file.
+
+    heartbeat is called as files are parsed and batches are stored.
+    """
+    stored, report = collect_resumes(source_path, upload_dir)
+
+    # Parse cache hits are applied directly, everything else goes to the pool
+    parsed: Dict[str, Any] = {}
+    digests: Dict[str, str] = {}
+    to_parse = []
+    for _, path in stored:
+        digests[path] = content_hash(path)
+        cached = get_cached_parse(db, digests[path])
+        if cached is not None:
+            parsed[path] = (cached, None)
+        else:
+            to_parse.append(path)
+
+    if to_parse:
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=_init_worker) as pool:
+            for path, outcome in zip(to_parse, pool.map(_parse_file, to_parse, chunksize=max(1, len(to_parse) // (workers * 4)))):
+                parsed[path] = outcome
+                if outcome[0] is not None:
+                    store_parse(db, digests[path], outcome[0])
+                heartbeat()
+
+    batch: List[Tuple[str, Dict[str, Any]]] = []
+
+    def store(rows: List[Tuple[str, Dict[str, Any]]]) -> List[int]:
+        applicants = [Applicant(**fields) for _, fields in rows]
+        db.add_all(applicants)
+        db.flush()
+        search.index_applicants(db, applicants)
+        applicant_ids = [applicant.id for applicant in applicants]
+        matching_sync.applicants_changed(db, applicants)
+        return applicant_ids
+
+    def fail(file_name: str, fields: Dict[str, Any], error: Exception):
+        if os.path.exists(fields["resume_path"]):
+            os.remove(fields["resume_path"])
+        report.append({"file": file_name, "status": "failed", "error": f"Error saving applicant: {str(error)}"})
+
+    def flush_batch():
+        try:
+            applicant_ids = store(batch)
+        except Exception:
+            db.rollback()
+            # Find the offending rows: retry one by one so the rest still import
+            for file_name, fields in batch:
+                try:
+                    (applicant_id,) = store([(file_name, fields)])
+                except Exception as e:
+                    db.rollback()
+                    fail(file_name, fields, e)
+                else:
+                    report.append({"file": file_name, "status": "imported", "applicant_id": applicant_id})
+        else:
+            for (file_name, _), applicant_id in zip(batch, applicant_ids):
+                report.append({"file": file_name, "status": "imported", "applicant_id": applicant_id})
+        batch.clear()
+        heartbeat()
+
+    for file_name, path in stored:
+        result, error = parsed[path]
+        if result is None:
+            os.remove(path)
+            report.append({"file": file_name, "status": "failed", "error": f"Error processing resume: {error}"})
+            continue
+        resume_text, skills, parsed_data = result
+        batch.append((file_name, dict(
+            user_id=user_id,
+            name=parsed_data.get('name') or os.path.splitext(os.path.basename(file_name))[0],
+            email=parsed_data.get('email') or "",
+            resume_text=resume_text,
+            skills=skills or [],
+            phone=parsed_data.get('mobile_number'),
+            education=parsed_data.get('education', []),
+            experience=parsed_data.get('experience', []),
+            company_names=parsed_data.get('company_names', []),
+            designations=parsed_data.get('designation', []),
+            degrees=parsed_data.get('degree', []),
+            college_names=parsed_data.get('college_name', []),
+            total_experience=parsed_data.get('total_experience', 0.0),
+            resume_path=path
+        )))
+        if len(batch) >= INSERT_BATCH_SIZE:
+            flush_batch()
+    if batch:
+        flush_batch()
+
+    return {
+        "total_files": len(report),
+        "imported": sum(1 for entry in report if entry["status"] == "imported"),
+        "failed": sum(1 for entry in report if entry["status"] == "failed"),
+        "skipped": sum(1 for entry in report if entry["status"] == "skipped"),
+        "files": report
+    }
+
+def _release_stale_jobs(db: Session):
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.BULK_IMPORT_STALE_SECONDS)
+    for job in db.query(BulkImportJob).filter(BulkImportJob.active.is_(True), BulkImportJob.heartbeat_at < cutoff):
+        job.status = ParseJobStatus.failed
+        job.error = "Import was interrupted"
+        job.active = None
+        job.finished_at = datetime.utcnow()
+    db.commit()
+
+def import_in_progress(db: Session) -> bool:
+    """Whether an import holds the slot (a hint, create_import_job decides)"""
+    return db.query(BulkImportJob.id).filter(BulkImportJob.active.is_(True)).first() is not None
+
+def create_import_job(db: Session, user_id: int, source_name: Optional[str] = None) -> BulkImportJob:
+    """Claim the import slot with a queued job; raises ImportInProgress when another import holds it"""
+    _release_stale_jobs(db)
+    job = BulkImportJob(id=uuid.uuid4().hex, user_id=user_id, source_name=source_name, active=True)
+    db.add(job)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise ImportInProgress()
+    db.refresh(job)
+    return job
+
+def get_import_job(db: Session, job_id: str) -> Optional[BulkImportJob]:
+    return db.query(BulkImportJob).filter(BulkImportJob.id == job_id).first()
+
+def run_import_job(job_id: str, source_path: str, workers: int = 0, upload_dir: str = "uploads") -> Dict[str, Any]:
+    """Run a queued import, record its report on the job and release the slot; returns the report"""
+    # Job status commits on its own session, independent of the batch transactions
+    with SessionLocal() as status_db, SessionLocal() as db:
+        job = get_import_job(status_db, job_id)
+        job.status = ParseJobStatus.running
+        job.started_at = job.heartbeat_at = datetime.utcnow()
+        status_db.commit()
+        last_beat = time.monotonic()
+
+        def heartbeat():
+            nonlocal last_beat
+            if time.monotonic() - last_beat >= HEARTBEAT_INTERVAL_SECONDS:
+                job.heartbeat_at = datetime.utcnow()
+                status_db.commit()
+                last_beat = time.monotonic()
+
+        try:
+            result = import_resumes(db, source_path, job.user_id, workers, upload_dir, heartbeat=heartbeat)
+        except Exception as e:
+            db.rollback()
+            job.status = ParseJobStatus.failed
+            job.error = str(e)
+            raise
+        else:
+            job.status = ParseJobStatus.completed
+            job.report = result
+            return result
+        finally:
+            job.active = None
+            job.finished_at = datetime.utcnow()
+            status_db.commit()
+
+def _run_submitted(job_id: str, source_path: str):
+    try:
+        run_import_job(job_id, source_path)
+    except Exception as e:
+        print(f"Error running bulk import {job_id}: {e}")
+    finally:
+        if os.path.exists(source_path):
+            os.remove(source_path)
+
+def submit_import_job(job_id: str, source_path: str):
+    """Run a queued import in the background; source_path is removed once it finishes"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bulk-import")
+    _executor.submit(_run_submitted, job_id, source_path)
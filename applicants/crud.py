@@ -1,9 +1,14 @@
 
-from sqlalchemy.orm import Session
-from applicants.models import Applicant
+from sqlalchemy.orm import Session, undefer_group
+from applicants.models import Applicant, ResumeParseJob, ParseJobStatus
 from applicants.schemas import ApplicantCreate
+from applicants import search
+from auth.principal import principal_cache
+from matching import sync as matching_sync
 from typing import Dict, Any
+from datetime import datetime
 import os
+import uuid
 
 def create_applicant(db: Session, applicant: ApplicantCreate, user_id: int, resume_text: str = None, skills: list = None, parsed_data: Dict[str, Any] = None, resume_path: str = None):
     parsed_data = parsed_data or {}
@@ -25,8 +30,12 @@ def create_applicant(db: Session, applicant: ApplicantCreate, user_id: int, resu
         resume_path=resume_path
     )
     db.add(db_applicant)
+    db.flush()
+    search.index_applicant(db, db_applicant)
     db.commit()
+    principal_cache.invalidate(user_id)
     db.refresh(db_applicant)
+    matching_sync.applicant_changed(db, db_applicant)
     return db_applicant
 
 def get_applicants(db: Session, skip: int = 0, limit: int = 100):
@@ -35,14 +44,22 @@ def get_applicants(db: Session, skip: int = 0, limit: int = 100):
 def get_applicant(db: Session, applicant_id: int):
     return db.query(Applicant).filter(Applicant.id == applicant_id).first()
 
+def get_applicant_details(db: Session, applicant_id: int):
+    """get_applicant with the deferred resume text and parsed details loaded in the same query"""
+    return db.query(Applicant).options(undefer_group("resume"), undefer_group("parsed")).filter(Applicant.id == applicant_id).first()
+
 def get_applicant_by_user_id(db: Session, user_id: int):
     return db.query(Applicant).filter(Applicant.user_id == user_id).first()
 
-def update_applicant_resume(db: Session, applicant_id: int, resume_text: str, skills: list, parsed_data: Dict[str, Any] = None):
+def update_applicant_resume(db: Session, applicant_id: int, resume_text: str, skills: list, parsed_data: Dict[str, Any] = None, name: str = None, email: str = None):
     parsed_data = parsed_data or {}
     
     db_applicant = db.query(Applicant).filter(Applicant.id == applicant_id).first()
     if db_applicant:
+        if name:
+            db_applicant.name = name
+        if email:
+            db_applicant.email = email
         db_applicant.resume_text = resume_text
         db_applicant.skills = skills
         db_applicant.phone = parsed_data.get('mobile_number')
@@ -53,8 +70,10 @@ def update_applicant_resume(db: Session, applicant_id: int, resume_text: str, sk
         db_applicant.degrees = parsed_data.get('degree', [])
         db_applicant.college_names = parsed_data.get('college_name', [])
         db_applicant.total_experience = parsed_data.get('total_experience', 0.0)
+        search.index_applicant(db, db_applicant)
         db.commit()
         db.refresh(db_applicant)
+        matching_sync.applicant_changed(db, db_applicant)
     return db_applicant
 
 def delete_applicant(db: Session, applicant_id: int):
@@ -67,7 +86,24 @@ def delete_applicant(db: Session, applicant_id: int):
             except OSError:
                 pass  # File might already be deleted or permission issues
         
+        matching_sync.applicant_deleted(db, applicant_id)
+        search.remove_applicant(db, applicant_id)
+        db.query(ResumeParseJob).filter(ResumeParseJob.applicant_id == applicant_id).delete()
+        user_id = db_applicant.user_id
         db.delete(db_applicant)
         db.commit()
+        principal_cache.invalidate(user_id)
         return True
     return False
+
+def create_parse_job(db: Session, applicant_id: int, resume_path: str, status: ParseJobStatus = ParseJobStatus.queued):
+    db_job = ResumeParseJob(id=uuid.uuid4().hex, applicant_id=applicant_id, resume_path=resume_path, status=status)
+    if status == ParseJobStatus.completed:
+        db_job.started_at = db_job.finished_at = datetime.utcnow()
+    db.add(db_job)
+    db.commit()
+    db.refresh(db_job)
+    return db_job
+
+def get_parse_job(db: Session, job_id: str):
+    return db.query(ResumeParseJob).filter(ResumeParseJob.id == job_id).first()
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, JSON, ForeignKey, Float, DateTime
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, JSON, ForeignKey, Float, DateTime, Enum, Boolean
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
 from database import Base
+import enum
 
 class Applicant(Base):
     __tablename__ = "applicants"
@@ -12,14 +13,15 @@ class Applicant(Base):
     email = Column(String, index=True)
     phone = Column(String, nullable=True)
     resume_path = Column(String, nullable=True)
-    resume_text = Column(String, nullable=True)
+    # Heavy columns are deferred: plain queries skip them and they load per group on first access
+    resume_text = deferred(Column(String, nullable=True), group="resume")
     skills = Column(JSON, nullable=True, default=list)
-    education = Column(JSON, nullable=True, default=list)
-    experience = Column(JSON, nullable=True, default=list)
-    company_names = Column(JSON, nullable=True, default=list)
-    designations = Column(JSON, nullable=True, default=list)
-    degrees = Column(JSON, nullable=True, default=list)
-    college_names = Column(JSON, nullable=True, default=list)
+    education = deferred(Column(JSON, nullable=True, default=list), group="parsed")
+    experience = deferred(Column(JSON, nullable=True, default=list), group="parsed")
+    company_names = deferred(Column(JSON, nullable=True, default=list), group="parsed")
+    designations = deferred(Column(JSON, nullable=True, default=list), group="parsed")
+    degrees = deferred(Column(JSON, nullable=True, default=list), group="parsed")
+    college_names = deferred(Column(JSON, nullable=True, default=list), group="parsed")
     total_experience = Column(Float, nullable=True, default=0.0)
     created_at = Column(DateTime, default=datetime.utcnow)
 
@@ -27,4 +29,48 @@ class Applicant(Base):
     user = relationship("User", back_populates="applicant_profile")
     interviews = relationship("Interview", back_populates="applicant")
     offers = relationship("OfferLetter", back_populates="applicant")
-    applications = relationship("JobApplication", back_populates="applicant")
\ No newline at end of file
+    applications = relationship("JobApplication", back_populates="applicant")
+
+class ParseJobStatus(enum.Enum):
+    queued = "queued"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+
+class ResumeParseJob(Base):
+    __tablename__ = "resume_parse_jobs"
+
+    id = Column(String, primary_key=True)
+    applicant_id = Column(Integer, ForeignKey("applicants.id"), nullable=False, index=True)
+    resume_path = Column(String, nullable=False)
+    status = Column(Enum(ParseJobStatus), default=ParseJobStatus.queued, nullable=False, index=True)
+    error = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+class BulkImportJob(Base):
+    __tablename__ = "bulk_import_jobs"
+
+    id = Column(String, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    source_name = Column(String, nullable=True)
+    status = Column(Enum(ParseJobStatus), default=ParseJobStatus.queued, nullable=False, index=True)
+    # True while queued or running, NULL afterwards: the unique constraint admits one active import
+    active = Column(Boolean, nullable=True, unique=True)
+    report = Column(JSON, nullable=True)
+    error = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, default=datetime.utcnow)
+
+class ResumeParseCache(Base):
+    __tablename__ = "resume_parse_cache"
+
+    content_hash = Column(String(64), primary_key=True)  # SHA-256 of the PDF bytes
+    resume_text = Column(String, nullable=True)
+    skills = Column(JSON, nullable=True, default=list)
+    parsed_data = Column(JSON, nullable=True, default=dict)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_used_at = Column(DateTime, default=datetime.utcnow, index=True)
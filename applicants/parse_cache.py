@@ -0,0 +1,72 @@
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from core.config import settings
+from applicants.models import ResumeParseCache
+
+# parse_resume results keyed by the SHA-256 of the PDF, so re-uploads of the
+# same file skip PyPDF2 and pyresparser entirely. The table holds at most
+# RESUME_PARSE_CACHE_MAX_ENTRIES rows; the least recently used are evicted.
+
+ParseResult = Tuple[str, List[str], Dict[str, Any]]
+
+def content_hash(pdf_path: str) -> str:
+    """SHA-256 of a stored resume, read in UPLOAD_CHUNK_SIZE chunks"""
+    hasher = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(settings.UPLOAD_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def cache_enabled() -> bool:
+    return settings.RESUME_PARSE_CACHE_MAX_ENTRIES > 0
+
+def get_cached_parse(db: Session, digest: str) -> Optional[ParseResult]:
+    """Cached (text, skills, parsed_data) for the content hash, if any"""
+    if not cache_enabled():
+        return None
+    entry = db.get(ResumeParseCache, digest)
+    if entry is None:
+        return None
+    entry.last_used_at = datetime.utcnow()
+    result = (entry.resume_text, list(entry.skills or []), dict(entry.parsed_data or {}))
+    db.commit()
+    return result
+
+def store_parse(db: Session, digest: str, result: ParseResult):
+    if not cache_enabled():
+        return
+    resume_text, skills, parsed_data = result
+    now = datetime.utcnow()
+    try:
+        db.merge(ResumeParseCache(
+            content_hash=digest,
+            resume_text=resume_text,
+            skills=skills,
+            parsed_data=parsed_data,
+            created_at=now,
+            last_used_at=now
+        ))
+        db.commit()
+    except IntegrityError:
+        # Another worker stored the same file first
+        db.rollback()
+        return
+    evict(db)
+
+def evict(db: Session):
+    """Drop the least recently used entries beyond the size bound"""
+    excess = db.query(func.count(ResumeParseCache.content_hash)).scalar() - settings.RESUME_PARSE_CACHE_MAX_ENTRIES
+    if excess <= 0:
+        return
+    oldest = (
+        db.query(ResumeParseCache.content_hash)
+        .order_by(ResumeParseCache.last_used_at, ResumeParseCache.content_hash)
+        .limit(excess)
+        .subquery()
+    )
+    db.query(ResumeParseCache).filter(ResumeParseCache.content_hash.in_(oldest.select())).delete(synchronize_session=False)
+    db.commit()
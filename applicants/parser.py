@@ -1,60 +1,52 @@
 
 import PyPDF2
 import re
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union, Iterator
 from io import BytesIO
 import tempfile
 import os
+import importlib.util
+from core.config import settings
+from applicants.skill_extractor import get_skill_extractor
+from applicants import parser_pool
 
-# Try to import pyresparser, fallback to basic parsing if not available
-try:
-    from pyresparser import ResumeParser
-    PYRESPARSER_AVAILABLE = True
-except ImportError:
-    PYRESPARSER_AVAILABLE = False
+# pyresparser is only looked up here, it is imported on first use (or in the parser pool workers)
+PYRESPARSER_AVAILABLE = importlib.util.find_spec("pyresparser") is not None
+if not PYRESPARSER_AVAILABLE:
     print("Warning: pyresparser not available, using basic parsing")
 
-def extract_text_from_pdf(pdf_bytes: bytes) -> str:
-    """Extract text from PDF resume"""
+def _pdf_source(pdf: Union[str, bytes]):
+    """PyPDF2 reads a path directly, raw bytes are wrapped in a stream"""
+    return BytesIO(pdf) if isinstance(pdf, bytes) else pdf
+
+def iter_pdf_text(pdf: Union[str, bytes], max_pages: int = 0, max_chars: int = 0) -> Iterator[str]:
+    """Yield the text of a PDF page by page, stopping after max_pages pages or max_chars characters (0 = no limit)"""
+    pdf_reader = PyPDF2.PdfReader(_pdf_source(pdf))
+    remaining = max_chars
+    for page_number, page in enumerate(pdf_reader.pages):
+        if max_pages and page_number >= max_pages:
+            return
+        page_text = page.extract_text() or ""
+        if max_chars:
+            page_text = page_text[:remaining]
+            remaining -= len(page_text)
+        yield page_text
+        if max_chars and remaining <= 0:
+            return
+
+def extract_text_from_pdf(pdf: Union[str, bytes]) -> str:
+    """Extract text from PDF resume (a file path or the raw bytes), within the PDF_MAX_PAGES/PDF_MAX_CHARS limits"""
     try:
-        pdf_reader = PyPDF2.PdfReader(BytesIO(pdf_bytes))
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-        return text
+        return "".join(iter_pdf_text(pdf, settings.PDF_MAX_PAGES, settings.PDF_MAX_CHARS))
     except Exception as e:
         raise Exception(f"Error extracting text from PDF: {str(e)}")
 
+skill_extractor = get_skill_extractor(settings.SKILL_DICTIONARY_PATH)
+SKILL_KEYWORDS = skill_extractor.skills
+
 def extract_skills_from_text_basic(text: str) -> List[str]:
-    """Basic skill extraction using keyword matching (fallback method)"""
-    skill_keywords = [
-        # Programming languages
-        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust',
-        'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql', 'html', 'css',
-        
-        # Frameworks and libraries
-        'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring', 'laravel',
-        'fastapi', 'bootstrap', 'jquery', 'tensorflow', 'pytorch', 'pandas', 'numpy',
-        
-        # Databases
-        'mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle', 'sql server',
-        
-        # Tools and technologies
-        'git', 'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'jenkins', 'linux', 'windows',
-        'jira', 'agile', 'scrum', 'ci/cd', 'devops', 'microservices', 'rest api', 'graphql',
-        
-        # Soft skills
-        'leadership', 'communication', 'teamwork', 'problem solving', 'project management',
-        'analytical', 'creative', 'adaptable', 'detail oriented'
-    ]
-    
-    text_lower = text.lower()
-    found_skills = []
-    for skill in skill_keywords:
-        if skill.lower() in text_lower:
-            found_skills.append(skill.title())
-    
-    return list(set(found_skills))
+    """Basic skill extraction using dictionary matching on word boundaries (fallback method)"""
+    return [skill.title() for skill in skill_extractor.extract(text)]
 
 def extract_contact_info_basic(text: str) -> Dict[str, Optional[str]]:
     """Basic contact information extraction"""
@@ -78,17 +70,26 @@ def extract_contact_info_basic(text: str) -> Dict[str, Optional[str]]:
     
     return contact_info
 
-def parse_resume_with_pyresparser(pdf_bytes: bytes) -> Dict[str, Any]:
-    """Parse resume using the advanced ResumeParser library"""
+def parse_resume_with_pyresparser(pdf: Union[str, bytes]) -> Dict[str, Any]:
+    """Parse resume using the advanced ResumeParser library, in the parser pool when enabled"""
+    if parser_pool.pool_enabled():
+        return parser_pool.parse(pdf)
+    return parse_with_pyresparser_local(pdf)
+
+def parse_with_pyresparser_local(pdf: Union[str, bytes]) -> Dict[str, Any]:
+    """Run ResumeParser in the current process"""
+    from pyresparser import ResumeParser
     try:
-        # Create a temporary file to save the PDF
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            temp_file.write(pdf_bytes)
-            temp_file_path = temp_file.name
+        temp_file_path = None
+        if isinstance(pdf, bytes):
+            # ResumeParser needs a file, so save raw bytes to a temporary one
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
+                temp_file.write(pdf)
+                temp_file_path = temp_file.name
         
         try:
             # Parse the resume using ResumeParser
-            data = ResumeParser(temp_file_path).get_extracted_data()
+            data = ResumeParser(temp_file_path or pdf).get_extracted_data()
             
             # Clean up and format the extracted data
             parsed_data = {
@@ -109,24 +110,24 @@ def parse_resume_with_pyresparser(pdf_bytes: bytes) -> Dict[str, Any]:
             
         finally:
             # Clean up the temporary file
-            if os.path.exists(temp_file_path):
+            if temp_file_path and os.path.exists(temp_file_path):
                 os.unlink(temp_file_path)
                 
     except Exception as e:
         raise Exception(f"Error parsing resume with ResumeParser: {str(e)}")
 
-def parse_resume(pdf_bytes: bytes) -> tuple[str, List[str], Dict[str, Any]]:
+def parse_resume(pdf: Union[str, bytes]) -> tuple[str, List[str], Dict[str, Any]]:
     """
-    Parse resume PDF and extract text, skills, and additional information
+    Parse resume PDF (a file path or the raw bytes) and extract text, skills, and additional information
     Returns: (text, skills, parsed_data)
     """
     # Always extract text using PyPDF2
-    text = extract_text_from_pdf(pdf_bytes)
+    text = extract_text_from_pdf(pdf)
     
     # Try advanced parsing first, fallback to basic if needed
     if PYRESPARSER_AVAILABLE:
         try:
-            parsed_data = parse_resume_with_pyresparser(pdf_bytes)
+            parsed_data = parse_resume_with_pyresparser(pdf)
             
             # Use parsed skills if available, otherwise fallback
             skills = parsed_data.get('skills', [])
@@ -0,0 +1,141 @@
+import multiprocessing
+import multiprocessing.pool
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional, Set, Union
+from core.config import settings
+
+# pyresparser pulls in spaCy and NLTK, so it is only imported inside these
+# long-lived worker processes. Each worker imports it once in its initializer
+# and runs ResumeParser over a small generated resume, which loads the spaCy
+# pipelines and NLTK data from disk before the first real parse; it then serves
+# many parses. The API processes never import it. Workers are plain
+# multiprocessing.Pool processes, so a hung parse is ended with terminate().
+
+_pool: Optional[multiprocessing.pool.Pool] = None
+_pool_lock = threading.Lock()
+_stats_lock = threading.Lock()
+_stats = {"started_at": None, "warm_up_error": None, "parsed": 0, "failed": 0}
+_ready_pids: Set[int] = set()
+
+# Worker-side state
+_worker_ready_at: Optional[float] = None
+_worker_error: Optional[str] = None
+
+WARM_UP_LINES = ["Sample Applicant", "sample.applicant@example.com", "Skills: Python, SQL, Communication"]
+
+def pool_enabled() -> bool:
+    return settings.RESUME_PARSER_POOL_SIZE > 0
+
+def _write_warm_up_resume(path: str):
+    from reportlab.pdfgen import canvas
+    pdf = canvas.Canvas(path)
+    for line_number, line in enumerate(WARM_UP_LINES):
+        pdf.drawString(72, 720 - 14 * line_number, line)
+    pdf.save()
+
+def _init_worker():
+    global _worker_ready_at, _worker_error
+    started = time.monotonic()
+    path = None
+    try:
+        from pyresparser import ResumeParser
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
+            path = temp_file.name
+        _write_warm_up_resume(path)
+        ResumeParser(path).get_extracted_data()
+        _worker_ready_at = time.monotonic() - started
+    except Exception as e:
+        _worker_error = str(e)
+    finally:
+        if path and os.path.exists(path):
+            os.unlink(path)
+
+def _warm_up_worker() -> Dict[str, Any]:
+    return {"pid": os.getpid(), "load_seconds": _worker_ready_at, "error": _worker_error}
+
+def _parse_in_worker(pdf: Union[str, bytes]) -> Dict[str, Any]:
+    from applicants.parser import parse_with_pyresparser_local
+    return parse_with_pyresparser_local(pdf)
+
+def get_pool() -> multiprocessing.pool.Pool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = multiprocessing.get_context("spawn").Pool(
+                processes=settings.RESUME_PARSER_POOL_SIZE,
+                initializer=_init_worker
+            )
+            _stats["started_at"] = time.time()
+            _ready_pids.clear()
+        return _pool
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool.join()
+            _pool = None
+
+def _discard_pool(pool: multiprocessing.pool.Pool):
+    """Kill the pool's workers, including one stuck in a parse, so the next parse starts a fresh pool"""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.terminate()
+
+def warm_up():
+    """Start every worker and have it load the models, without blocking the caller"""
+    pool = get_pool()
+
+    def on_ready(result):
+        with _stats_lock:
+            if result["error"]:
+                _stats["warm_up_error"] = result["error"]
+            else:
+                _ready_pids.add(result["pid"])
+
+    def on_error(error):
+        with _stats_lock:
+            _stats["warm_up_error"] = str(error)
+
+    for _ in range(settings.RESUME_PARSER_POOL_SIZE):
+        pool.apply_async(_warm_up_worker, callback=on_ready, error_callback=on_error)
+
+def parse(pdf: Union[str, bytes]) -> Dict[str, Any]:
+    """Run the pyresparser backend in a pool worker"""
+    pool = get_pool()
+    try:
+        result = pool.apply_async(_parse_in_worker, (pdf,)).get(timeout=settings.RESUME_PARSER_TIMEOUT_SECONDS)
+    except multiprocessing.TimeoutError:
+        # The worker is hung in this parse, or died and took the task with it;
+        # terminate the pool rather than leave it occupied (other parses in
+        # flight on it fail and are reported) and start a fresh one
+        _discard_pool(pool)
+        with _stats_lock:
+            _stats["failed"] += 1
+        warm_up()
+        raise
+    except Exception:
+        with _stats_lock:
+            _stats["failed"] += 1
+        raise
+    with _stats_lock:
+        _stats["parsed"] += 1
+    return result
+
+def health() -> Dict[str, Any]:
+    from applicants.parser import PYRESPARSER_AVAILABLE
+    return {
+        "backend": "pyresparser" if PYRESPARSER_AVAILABLE else "basic",
+        "pool_size": settings.RESUME_PARSER_POOL_SIZE if PYRESPARSER_AVAILABLE else 0,
+        "pool_started": _pool is not None,
+        "workers_ready": len(_ready_pids),
+        "warm_up_error": _stats["warm_up_error"],
+        "parsed": _stats["parsed"],
+        "failed": _stats["failed"]
+    }
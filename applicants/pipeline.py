@@ -0,0 +1,110 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional
+from core.config import settings
+from database import SessionLocal
+from applicants import crud
+from applicants.models import ResumeParseJob, ParseJobStatus
+from applicants.parser import parse_resume
+from applicants.parse_cache import content_hash, get_cached_parse, store_parse
+
+# Uploads are parsed off the request path: the route stores the file and a
+# resume_parse_jobs row, and a fixed number of worker threads work through
+# the queue. Job rows survive restarts, so unfinished jobs are picked up again
+# by resume_pending_jobs() at startup.
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_in_flight = 0
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.RESUME_PARSE_WORKERS, thread_name_prefix="resume-parse")
+        return _executor
+
+def shutdown_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+def is_saturated() -> bool:
+    """True when the queue already holds RESUME_PARSE_MAX_PENDING jobs (a hint, enqueue decides)"""
+    return _in_flight >= settings.RESUME_PARSE_MAX_PENDING
+
+def enqueue(job_id: str, enforce_limit: bool = True) -> bool:
+    """Queue a parse job; returns False without queueing it when RESUME_PARSE_MAX_PENDING are pending"""
+    global _in_flight
+    with _executor_lock:
+        if enforce_limit and _in_flight >= settings.RESUME_PARSE_MAX_PENDING:
+            return False
+        _in_flight += 1
+    get_executor().submit(_run_job, job_id)
+    return True
+
+def _run_job(job_id: str):
+    global _in_flight
+    try:
+        run_parse_job(job_id)
+    except Exception as e:
+        print(f"Error running resume parse job {job_id}: {e}")
+    finally:
+        with _executor_lock:
+            _in_flight -= 1
+
+def run_parse_job(job_id: str):
+    """Parse a stored resume and write the results to its applicant"""
+    with SessionLocal() as db:
+        job = crud.get_parse_job(db, job_id)
+        if job is None:
+            return
+        job.status = ParseJobStatus.running
+        job.started_at = datetime.utcnow()
+        db.commit()
+
+        try:
+            digest = content_hash(job.resume_path)
+            result = get_cached_parse(db, digest)
+            if result is None:
+                result = parse_resume(job.resume_path)
+                store_parse(db, digest, result)
+            resume_text, skills, parsed_data = result
+            applicant = crud.update_applicant_resume(
+                db,
+                applicant_id=job.applicant_id,
+                resume_text=resume_text,
+                skills=skills,
+                parsed_data=parsed_data,
+                name=parsed_data.get('name'),
+                email=parsed_data.get('email')
+            )
+            if applicant is None:
+                raise Exception("Applicant no longer exists")
+            status, error = ParseJobStatus.completed, None
+        except Exception as e:
+            db.rollback()
+            status, error = ParseJobStatus.failed, f"Error processing resume: {str(e)}"
+
+        # The applicant (and with it this job) may have been deleted meanwhile
+        job = crud.get_parse_job(db, job_id)
+        if job is not None:
+            job.status = status
+            job.error = error
+            job.finished_at = datetime.utcnow()
+            db.commit()
+
+def resume_pending_jobs() -> int:
+    """Re-queue jobs left queued or running by a previous process"""
+    with SessionLocal() as db:
+        job_ids = [
+            job_id for (job_id,) in db.query(ResumeParseJob.id)
+            .filter(ResumeParseJob.status.in_([ParseJobStatus.queued, ParseJobStatus.running]))
+            .order_by(ResumeParseJob.created_at)
+        ]
+    for job_id in job_ids:
+        enqueue(job_id, enforce_limit=False)
+    return len(job_ids)
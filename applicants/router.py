@@ -1,19 +1,115 @@
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from starlette.concurrency import run_in_threadpool
+import hashlib
 import os
 import uuid
+import zipfile
 
 from database import get_db
+from core.config import settings
 from auth.router import get_current_user, require_role
 from auth.models import User
 from applicants import schemas, crud
-from applicants.parser import parse_resume
+from applicants import pipeline, parser_pool
+from applicants.models import ParseJobStatus
+from applicants.parse_cache import get_cached_parse
+from applicants import bulk_import
+from applicants.search import search_applicants
 
 router = APIRouter()
 
-@router.post("/", response_model=schemas.Applicant)
+async def _save_upload(upload: UploadFile, path: str, max_bytes: Optional[int] = None) -> str:
+    """Copy an upload to path in fixed-size chunks and return its SHA-256.
+
+    Uploads over max_bytes (MAX_RESUME_UPLOAD_BYTES by default) are rejected
+    with 413 as soon as the limit is crossed, and the partial file is removed.
+    """
+    max_bytes = max_bytes or settings.MAX_RESUME_UPLOAD_BYTES
+    if upload.size is not None and upload.size > max_bytes:
+        raise HTTPException(status_code=413, detail=f"Upload exceeds the {max_bytes} byte limit")
+    
+    hasher = hashlib.sha256()
+    size = 0
+    try:
+        # File I/O runs on the threadpool so a slow disk never stalls the event loop
+        buffer = await run_in_threadpool(open, path, "wb")
+        try:
+            while True:
+                chunk = await upload.read(settings.UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise HTTPException(status_code=413, detail=f"Upload exceeds the {max_bytes} byte limit")
+                hasher.update(chunk)
+                await run_in_threadpool(buffer.write, chunk)
+        finally:
+            await run_in_threadpool(buffer.close)
+    except HTTPException:
+        os.remove(path)
+        raise
+    except Exception as e:
+        if os.path.exists(path):
+            os.remove(path)
+        raise HTTPException(status_code=500, detail=f"Error saving resume: {str(e)}")
+    return hasher.hexdigest()
+
+def _discard_registration(db: Session, applicant, resume_path: str):
+    """Undo a failed registration: the applicant (if already created) and the stored resume"""
+    db.rollback()
+    if applicant is not None:
+        crud.delete_applicant(db, applicant.id)
+    if os.path.exists(resume_path):
+        os.remove(resume_path)
+
+def _register(db: Session, user_id: int, name: str, email: str, resume_path: str, digest: str):
+    """Create the applicant and its parse job for a stored resume (runs on the threadpool)"""
+    applicant = None
+    try:
+        # A resume that was parsed before is applied right away
+        cached = get_cached_parse(db, digest)
+        if cached is not None:
+            resume_text, skills, parsed_data = cached
+            applicant_data = schemas.ApplicantCreate(
+                name=parsed_data.get('name') or name,
+                email=parsed_data.get('email') or email
+            )
+            applicant = crud.create_applicant(
+                db=db,
+                applicant=applicant_data,
+                user_id=user_id,
+                resume_text=resume_text,
+                skills=skills,
+                parsed_data=parsed_data,
+                resume_path=resume_path
+            )
+            return crud.create_parse_job(db, applicant_id=applicant.id, resume_path=resume_path, status=ParseJobStatus.completed)
+        
+        # Create the applicant profile now, parsed fields are filled in when the job finishes
+        applicant_data = schemas.ApplicantCreate(name=name, email=email)
+        applicant = crud.create_applicant(
+            db=db,
+            applicant=applicant_data,
+            user_id=user_id,
+            resume_path=resume_path
+        )
+        parse_job = crud.create_parse_job(db, applicant_id=applicant.id, resume_path=resume_path)
+        
+        # The saturation check in the route is only a hint; enqueue admits atomically
+        if not pipeline.enqueue(parse_job.id):
+            raise HTTPException(status_code=503, detail="Too many resumes are being processed, please try again later")
+        return parse_job
+    except HTTPException:
+        _discard_registration(db, applicant, resume_path)
+        raise
+    except Exception as e:
+        _discard_registration(db, applicant, resume_path)
+        raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
+
+@router.post("/", response_model=schemas.ResumeParseJob, status_code=202)
 async def register_applicant(
     name: str = Form(...),
     email: str = Form(...),
@@ -21,9 +117,9 @@ async def register_applicant(
     current_user: User = Depends(require_role("applicant")),
     db: Session = Depends(get_db)
 ):
-    """Register applicant and upload resume PDF"""
+    """Register applicant and upload resume PDF, the resume is parsed in the background"""
     # Check if applicant already exists for this user
-    existing_applicant = crud.get_applicant_by_user_id(db, user_id=current_user.id)
+    existing_applicant = await run_in_threadpool(crud.get_applicant_by_user_id, db, user_id=current_user.id)
     if existing_applicant:
         raise HTTPException(status_code=400, detail="Applicant profile already exists")
     
@@ -31,39 +127,83 @@ async def register_applicant(
     if not resume.filename.endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Only PDF files are allowed")
     
+    if pipeline.is_saturated():
+        raise HTTPException(status_code=503, detail="Too many resumes are being processed, please try again later")
+    
+    # Create unique filename for resume
+    file_extension = os.path.splitext(resume.filename)[1]
+    unique_filename = f"{uuid.uuid4()}{file_extension}"
+    resume_path = os.path.join("uploads", unique_filename)
+    
+    # Stream the resume to local storage, hashing it on the way (removes the file on failure)
+    digest = await _save_upload(resume, resume_path)
+    
+    # The database writes block, keep them off the event loop
+    return await run_in_threadpool(_register, db, current_user.id, name, email, resume_path, digest)
+
+@router.post("/bulk-import", response_model=schemas.BulkImportJob, status_code=202)
+async def bulk_import_applicants(
+    archive: UploadFile = File(...),
+    current_user: User = Depends(require_role("company")),
+    db: Session = Depends(get_db)
+):
+    """Import a ZIP archive of resume PDFs as applicant profiles in the background, see GET /bulk-import/{job_id}"""
+    if not archive.filename.lower().endswith('.zip'):
+        raise HTTPException(status_code=400, detail="Only ZIP archives are allowed")
+    
+    # Only a hint to save the upload, create_import_job claims the slot atomically
+    if await run_in_threadpool(bulk_import.import_in_progress, db):
+        raise HTTPException(status_code=409, detail="Another bulk import is in progress, please try again later")
+    
+    archive_path = os.path.join("uploads", f"{uuid.uuid4()}.zip")
+    await _save_upload(archive, archive_path, max_bytes=settings.BULK_IMPORT_MAX_BYTES)
+    if not await run_in_threadpool(zipfile.is_zipfile, archive_path):
+        os.remove(archive_path)
+        raise HTTPException(status_code=400, detail="The upload is not a valid ZIP archive")
     try:
-        # Create unique filename for resume
-        file_extension = os.path.splitext(resume.filename)[1]
-        unique_filename = f"{uuid.uuid4()}{file_extension}"
-        resume_path = os.path.join("uploads", unique_filename)
-        
-        # Save resume file to local storage
-        resume_bytes = await resume.read()
-        with open(resume_path, "wb") as buffer:
-            buffer.write(resume_bytes)
-        
-        # Parse resume
-        resume_text, skills, parsed_data = parse_resume(resume_bytes)
-        
-        # Use parsed name and email if not provided or if parsed data is better
-        parsed_name = parsed_data.get('name', name) if parsed_data.get('name') else name
-        parsed_email = parsed_data.get('email', email) if parsed_data.get('email') else email
-        
-        # Create applicant profile
-        applicant_data = schemas.ApplicantCreate(name=parsed_name, email=parsed_email)
-        return crud.create_applicant(
-            db=db, 
-            applicant=applicant_data, 
-            user_id=current_user.id,
-            resume_text=resume_text,
-            skills=skills,
-            parsed_data=parsed_data,
-            resume_path=resume_path
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
+        job = await run_in_threadpool(bulk_import.create_import_job, db, current_user.id, archive.filename)
+    except bulk_import.ImportInProgress:
+        os.remove(archive_path)
+        raise HTTPException(status_code=409, detail="Another bulk import is in progress, please try again later")
+    
+    bulk_import.submit_import_job(job.id, archive_path)
+    return job
+
+@router.get("/bulk-import/{job_id}", response_model=schemas.BulkImportJob)
+def get_bulk_import(
+    job_id: str,
+    current_user: User = Depends(require_role("company")),
+    db: Session = Depends(get_db)
+):
+    """Get the status of a bulk import, with the per-file report once it has finished"""
+    job = bulk_import.get_import_job(db, job_id)
+    if job is None or job.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Bulk import not found")
+    return job
 
-@router.get("/", response_model=List[schemas.Applicant])
+@router.get("/parser/health")
+def get_parser_health(current_user: User = Depends(require_role("company"))):
+    """Resume parser backend and worker pool status"""
+    return parser_pool.health()
+
+@router.get("/parse-jobs/{job_id}", response_model=schemas.ResumeParseJob)
+def get_parse_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get the status of a resume parsing job"""
+    parse_job = crud.get_parse_job(db, job_id=job_id)
+    if parse_job is None:
+        raise HTTPException(status_code=404, detail="Parse job not found")
+    
+    if current_user.role.value == "applicant":
+        if parse_job.applicant_id != current_user.applicant_id:
+            raise HTTPException(status_code=403, detail="Not authorized to view this parse job")
+    
+    return parse_job
+
+@router.get("/", response_model=List[schemas.ApplicantSummary])
 def list_applicants(
     skip: int = 0, 
     limit: int = 100,
@@ -75,11 +215,31 @@ def list_applicants(
         return crud.get_applicants(db, skip=skip, limit=limit)
     elif current_user.role.value == "applicant":
         # Return only the current user's applicant profile
-        applicant = crud.get_applicant_by_user_id(db, user_id=current_user.id)
+        if current_user.applicant_id is None:
+            return []
+        applicant = crud.get_applicant(db, applicant_id=current_user.applicant_id)
         return [applicant] if applicant else []
     else:
         raise HTTPException(status_code=403, detail="Not authorized")
 
+@router.get("/search")
+def search_applicant_resumes(
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(require_role("company")),
+    db: Session = Depends(get_db)
+):
+    """Full-text search over applicant names and resumes, best matches first"""
+    results, total = search_applicants(db, q, skip=skip, limit=limit)
+    return {
+        "query": q,
+        "total": total,
+        "skip": skip,
+        "limit": limit,
+        "results": results
+    }
+
 @router.get("/{applicant_id}", response_model=schemas.Applicant)
 def get_applicant(
     applicant_id: int,
@@ -87,12 +247,12 @@ def get_applicant(
     db: Session = Depends(get_db)
 ):
     """Get applicant details"""
-    applicant = crud.get_applicant(db, applicant_id=applicant_id)
+    applicant = crud.get_applicant_details(db, applicant_id=applicant_id)
     if applicant is None:
         raise HTTPException(status_code=404, detail="Applicant not found")
     
     # Applicants can only view their own profile, companies can view all
-    if current_user.role.value == "applicant" and applicant.user_id != current_user.id:
+    if current_user.role.value == "applicant" and applicant.id != current_user.applicant_id:
         raise HTTPException(status_code=403, detail="Not authorized to view this profile")
     
     return applicant
@@ -109,7 +269,7 @@ def delete_applicant(
         raise HTTPException(status_code=404, detail="Applicant not found")
     
     # Check permissions - companies can delete any applicant, applicants can only delete their own
-    if current_user.role.value == "applicant" and applicant.user_id != current_user.id:
+    if current_user.role.value == "applicant" and applicant.id != current_user.applicant_id:
         raise HTTPException(status_code=403, detail="Not authorized to delete this profile")
     
     # Delete the applicant
@@ -1,11 +1,26 @@
 from pydantic import BaseModel
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Dict
 from datetime import datetime
+from applicants.models import ParseJobStatus
 
 class ApplicantCreate(BaseModel):
     name: str
     email: str
 
+class ApplicantSummary(BaseModel):
+    """List view of an applicant, without the resume text and parsed details"""
+    id: int
+    user_id: int
+    name: str
+    email: str
+    skills: Optional[List[str]]
+    phone: Optional[str]
+    total_experience: Optional[float]
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
 class Applicant(BaseModel):
     id: int
     user_id: int
@@ -24,4 +39,29 @@ class Applicant(BaseModel):
     created_at: Optional[datetime] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class ResumeParseJob(BaseModel):
+    id: str
+    applicant_id: int
+    status: ParseJobStatus
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class BulkImportJob(BaseModel):
+    id: str
+    source_name: Optional[str] = None
+    status: ParseJobStatus
+    report: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
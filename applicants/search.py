@@ -0,0 +1,125 @@
+import re
+from typing import Any, Dict, Iterable, List, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from applicants.models import Applicant
+
+# Full-text search over applicant names and resume text.
+# SQLite: an FTS5 table (rowid = applicant id) that applicants.crud keeps in step
+# with the applicants table. PostgreSQL: a GIN expression index over the tsvector
+# of the same columns, which needs no syncing. Without either, search falls back
+# to an unranked LIKE scan.
+
+# Skill names such as C++ and C# keep their "+" and "#" as part of the token
+FTS_TOKENIZE = "porter unicode61 tokenchars '+#'"
+
+FTS_TABLE = "applicants_fts"
+PG_TSVECTOR = "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(resume_text, ''))"
+
+_backend = None  # "fts5", "postgres" or None
+
+def ensure_search_index(engine: Engine):
+    """Create the full-text index for the engine's dialect and add any applicants it is missing"""
+    global _backend
+    with engine.begin() as conn:
+        if engine.dialect.name == "sqlite":
+            # An index built with an older tokenizer is dropped and rebuilt below
+            existing = conn.execute(text("SELECT sql FROM sqlite_master WHERE name = :name"), {"name": FTS_TABLE}).scalar()
+            if existing is not None and FTS_TOKENIZE not in existing:
+                conn.execute(text(f"DROP TABLE {FTS_TABLE}"))
+            try:
+                conn.execute(text(f'CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(name, resume_text, tokenize="{FTS_TOKENIZE}")'))
+            except OperationalError:
+                print("Warning: SQLite was built without FTS5, resume search uses LIKE")
+                _backend = None
+                return
+            # Pick up rows written while the index was not maintained (e.g. by older scripts)
+            conn.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid NOT IN (SELECT id FROM applicants)"))
+            conn.execute(text(
+                f"INSERT INTO {FTS_TABLE}(rowid, name, resume_text) "
+                f"SELECT id, coalesce(name, ''), coalesce(resume_text, '') FROM applicants WHERE id NOT IN (SELECT rowid FROM {FTS_TABLE})"
+            ))
+            _backend = "fts5"
+        elif engine.dialect.name == "postgresql":
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_applicants_search ON applicants USING GIN ({PG_TSVECTOR})"))
+            _backend = "postgres"
+
+def index_applicants(db: Session, applicants: Iterable[Applicant]):
+    """(Re)index flushed applicants in the caller's transaction"""
+    if _backend != "fts5":
+        return
+    rows = [{"id": applicant.id, "name": applicant.name or "", "resume_text": applicant.resume_text or ""} for applicant in applicants]
+    if rows:
+        db.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :id"), rows)
+        db.execute(text(f"INSERT INTO {FTS_TABLE}(rowid, name, resume_text) VALUES (:id, :name, :resume_text)"), rows)
+
+def index_applicant(db: Session, applicant: Applicant):
+    index_applicants(db, [applicant])
+
+def remove_applicant(db: Session, applicant_id: int):
+    if _backend == "fts5":
+        db.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :id"), {"id": applicant_id})
+
+def fts_query(query: str) -> str:
+    """Turn user input into an FTS5 query: "quoted phrases" stay phrases, other words are ANDed terms.
+
+    Every term is passed as a quoted string, so punctuation in it (c++, node.js)
+    is left to the tokenizer instead of being read as FTS5 syntax.
+    """
+    terms = []
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', query):
+        term = phrase or word
+        if re.search(r"[\w+#]", term):
+            terms.append('"' + term.replace('"', '""') + '"')
+    return " ".join(terms)
+
+def search_applicants(db: Session, query: str, skip: int = 0, limit: int = 20) -> Tuple[List[Dict[str, Any]], int]:
+    """Best-matching applicants first, with a highlighted snippet; returns (page, total hits)"""
+    if _backend == "fts5":
+        match = fts_query(query)
+        if not match:
+            return [], 0
+        total = db.execute(text(f"SELECT count(*) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :q"), {"q": match}).scalar()
+        rows = db.execute(text(
+            f"SELECT rowid AS id, bm25({FTS_TABLE}) AS rank, snippet({FTS_TABLE}, 1, '[', ']', '...', 12) AS snippet "
+            f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :q ORDER BY rank, rowid LIMIT :limit OFFSET :skip"
+        ), {"q": match, "limit": limit, "skip": skip}).all()
+        # bm25 is lower-is-better, report it as a positive score
+        hits = [(row.id, -row.rank, row.snippet) for row in rows]
+    elif _backend == "postgres":
+        params = {"q": query, "limit": limit, "skip": skip}
+        total = db.execute(text(f"SELECT count(*) FROM applicants WHERE {PG_TSVECTOR} @@ websearch_to_tsquery('english', :q)"), params).scalar()
+        rows = db.execute(text(
+            f"SELECT id, ts_rank({PG_TSVECTOR}, websearch_to_tsquery('english', :q)) AS rank, "
+            f"ts_headline('english', coalesce(resume_text, ''), websearch_to_tsquery('english', :q), "
+            f"'StartSel=[, StopSel=], MaxFragments=1, MaxWords=24') AS snippet "
+            f"FROM applicants WHERE {PG_TSVECTOR} @@ websearch_to_tsquery('english', :q) "
+            f"ORDER BY rank DESC, id LIMIT :limit OFFSET :skip"
+        ), params).all()
+        hits = [(row.id, float(row.rank), row.snippet) for row in rows]
+    else:
+        pattern = f"%{query.strip()}%"
+        matches = db.query(Applicant.id).filter(Applicant.resume_text.ilike(pattern) | Applicant.name.ilike(pattern))
+        total = matches.count()
+        hits = [(applicant_id, None, None) for (applicant_id,) in matches.order_by(Applicant.id).offset(skip).limit(limit)]
+
+    applicants = {
+        row.id: row for row in
+        db.query(Applicant.id, Applicant.name, Applicant.email, Applicant.skills).filter(Applicant.id.in_([hit[0] for hit in hits]))
+    }
+    results = []
+    for applicant_id, score, snippet in hits:
+        applicant = applicants.get(applicant_id)
+        if applicant is None:
+            continue
+        results.append({
+            "applicant_id": applicant_id,
+            "name": applicant.name,
+            "email": applicant.email,
+            "skills": applicant.skills,
+            "score": score,
+            "snippet": snippet
+        })
+    return results, total
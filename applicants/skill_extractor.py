@@ -0,0 +1,123 @@
+import os
+import re
+from collections import deque
+from typing import Dict, List, Optional
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Skills this short are common letter pairs, so punctuation that joins words
+# ("R&D", "go-getter", "C++") also counts as part of a word next to them
+SHORT_SKILL_LENGTH = 2
+_JOINING_PUNCTUATION = "&-+#"
+
+def load_skill_dictionary(path: str) -> List[str]:
+    """Read one skill per line, skipping blank lines and # comments"""
+    skills = []
+    seen = set()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.lstrip().startswith("#"):
+                continue
+            skill = _WHITESPACE.sub(" ", line.strip().lower())
+            if skill and skill not in seen:
+                seen.add(skill)
+                skills.append(skill)
+    return skills
+
+class SkillExtractor:
+    """Aho-Corasick automaton over the skill dictionary.
+
+    The text is scanned once regardless of dictionary size, and a match only
+    counts when it starts and ends on a token boundary, so "r" does not match
+    inside "recruiter" or "R&D" and "java" does not match inside "javascript".
+    Overlapping matches resolve to the leftmost, then longest, so "sql server"
+    does not also yield "sql".
+    """
+
+    def __init__(self, skills: List[str]):
+        self.skills = [_WHITESPACE.sub(" ", skill.strip().lower()) for skill in skills if skill.strip()]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        for skill_id, skill in enumerate(self.skills):
+            self._insert(skill, skill_id)
+        self._build_failure_links()
+
+    def _insert(self, skill: str, skill_id: int):
+        node = 0
+        for char in skill:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append(skill_id)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                # Inherit the matches of the longest proper suffix
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def _joins(self, text: str, position: int, outward: int, skill_id: int) -> bool:
+        """Whether text[position], just outside a match, continues the matched word"""
+        if position < 0 or position >= len(text):
+            return False
+        char = text[position]
+        if char.isalnum():
+            return text[position - outward].isalnum()
+        if len(self.skills[skill_id]) > SHORT_SKILL_LENGTH:
+            return False
+        if char in _JOINING_PUNCTUATION:
+            return True
+        # "go.dev" continues the word, a full stop ending "... and Go." does not
+        beyond = position + outward
+        return char == "." and 0 <= beyond < len(text) and text[beyond].isalnum()
+
+    def extract(self, text: str) -> List[str]:
+        """Dictionary skills found in the text, in order of first occurrence"""
+        text = _WHITESPACE.sub(" ", text.lower())
+        matches = []
+        node = 0
+        for end, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for skill_id in self._output[node]:
+                start = end - len(self.skills[skill_id]) + 1
+                if self._joins(text, start - 1, -1, skill_id) or self._joins(text, end + 1, 1, skill_id):
+                    continue
+                matches.append((start, -end, skill_id))
+
+        found: List[int] = []
+        seen = set()
+        covered_until = -1
+        for start, negative_end, skill_id in sorted(matches):
+            if start <= covered_until:
+                continue
+            covered_until = -negative_end
+            if skill_id not in seen:
+                seen.add(skill_id)
+                found.append(skill_id)
+        return [self.skills[skill_id] for skill_id in found]
+
+DEFAULT_SKILL_DICTIONARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "skills.txt")
+
+_extractor: Optional[SkillExtractor] = None
+
+def get_skill_extractor(path: Optional[str] = None) -> SkillExtractor:
+    """Compile the configured dictionary once per process"""
+    global _extractor
+    if _extractor is None:
+        _extractor = SkillExtractor(load_skill_dictionary(path or DEFAULT_SKILL_DICTIONARY_PATH))
+    return _extractor
@@ -0,0 +1,57 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from applications.models import JobApplication
+from applications.schemas import JobApplicationCreate
+from applications import crud
+from applicants.models import Applicant
+from jobs.models import JobPosition
+
+async def create_application(db: AsyncSession, application: JobApplicationCreate, applicant_id: int):
+    """Create a new job application"""
+    if await check_application_exists(db, applicant_id, application.job_id):
+        return None  # Application already exists
+    
+    db_application = JobApplication(
+        applicant_id=applicant_id,
+        job_id=application.job_id
+    )
+    db.add(db_application)
+    await db.commit()
+    await db.refresh(db_application)
+    return db_application
+
+async def get_applications_by_applicant(db: AsyncSession, applicant_id: int):
+    """Get all applications by a specific applicant"""
+    result = await db.execute(select(JobApplication).filter(JobApplication.applicant_id == applicant_id))
+    return result.scalars().all()
+
+async def get_applications_by_job(db: AsyncSession, job_id: int):
+    """Get all applications for a specific job"""
+    result = await db.execute(select(JobApplication).filter(JobApplication.job_id == job_id))
+    return result.scalars().all()
+
+async def get_all_applications_with_details(db: AsyncSession):
+    """Get all applications with applicant and job details"""
+    result = await db.execute(select(
+        JobApplication.id,
+        JobApplication.applicant_id,
+        JobApplication.job_id,
+        JobApplication.status,
+        JobApplication.applied_at,
+        Applicant.name.label('applicant_name'),
+        Applicant.email.label('applicant_email'),
+        JobPosition.title.label('job_title')
+    ).join(Applicant).join(JobPosition))
+    return result.all()
+
+async def update_application_status(db: AsyncSession, application_id: int, status):
+    """Update application status (the enum conversion is shared with the sync version)"""
+    return await db.run_sync(lambda session: crud.update_application_status(session, application_id, status))
+
+async def check_application_exists(db: AsyncSession, applicant_id: int, job_id: int):
+    """Check if an application already exists"""
+    result = await db.execute(select(JobApplication.id).filter(
+        JobApplication.applicant_id == applicant_id,
+        JobApplication.job_id == job_id
+    ).limit(1))
+    return result.first() is not None
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from database import get_async_db
+from auth.router import get_current_user
+from auth.models import User
+from applications import schemas, async_crud
+from applications.router import details_response
+
+# Routes migrated to the async data path, mounted ahead of applications.router when USE_ASYNC_DB is on
+router = APIRouter()
+
+@router.get("/my-applications", response_model=List[schemas.JobApplication])
+async def get_my_applications(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get all applications by the current applicant"""
+    if current_user.role.value != "applicant":
+        raise HTTPException(status_code=403, detail="Only applicants can view their applications")
+    
+    if current_user.applicant_id is None:
+        raise HTTPException(status_code=404, detail="Applicant profile not found")
+    
+    return await async_crud.get_applications_by_applicant(db, current_user.applicant_id)
+
+@router.get("/all", response_model=List[schemas.JobApplicationWithDetails])
+async def get_all_applications(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get all applications with details (company users only)"""
+    if current_user.role.value != "company":
+        raise HTTPException(status_code=403, detail="Only company users can view all applications")
+    
+    return details_response(await async_crud.get_all_applications_with_details(db))
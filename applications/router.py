@@ -4,13 +4,44 @@ from sqlalchemy.orm import Session
 from typing import List
 
 from database import get_db
-from auth.router import get_current_user
+from auth.router import get_current_user, get_read_db_for_user
 from auth.models import User
 from applications import schemas, crud
 from applicants.models import Applicant
 
 router = APIRouter()
 
+def details_response(applications) -> List[schemas.JobApplicationWithDetails]:
+    """Build the /all response from get_all_applications_with_details rows"""
+    result = []
+    for app in applications:
+        # Convert status to proper enum value
+        status_value = app.status
+        if hasattr(status_value, 'value'):
+            status_value = status_value.value
+        
+        # Ensure status is uppercase
+        if isinstance(status_value, str):
+            status_value = status_value.upper()
+        
+        # Convert to enum
+        try:
+            status_enum = schemas.ApplicationStatus(status_value)
+        except ValueError:
+            status_enum = schemas.ApplicationStatus.PENDING
+        
+        result.append(schemas.JobApplicationWithDetails(
+            id=app.id,
+            applicant_id=app.applicant_id,
+            job_id=app.job_id,
+            status=status_enum,
+            applied_at=app.applied_at,
+            applicant_name=app.applicant_name,
+            applicant_email=app.applicant_email,
+            job_title=app.job_title
+        ))
+    return result
+
 @router.post("/", response_model=schemas.JobApplication)
 def create_application(
     application: schemas.JobApplicationCreate,
@@ -21,14 +52,11 @@ def create_application(
     if current_user.role.value != "applicant":
         raise HTTPException(status_code=403, detail="Only applicants can apply for jobs")
     
-    # Find the applicant profile for the current user
-    applicant = db.query(Applicant).filter(Applicant.user_id == current_user.id).first()
-    if not applicant:
+    # Use the current user's applicant profile, regardless of what was sent in the request
+    actual_applicant_id = current_user.applicant_id
+    if actual_applicant_id is None:
         raise HTTPException(status_code=404, detail="Please create your applicant profile first before applying for jobs.")
     
-    # Use the found applicant's ID, regardless of what was sent in the request
-    actual_applicant_id = applicant.id
-    
     # Check if application already exists
     if crud.check_application_exists(db, actual_applicant_id, application.job_id):
         raise HTTPException(status_code=400, detail="You have already applied for this job")
@@ -48,12 +76,10 @@ def get_my_applications(
     if current_user.role.value != "applicant":
         raise HTTPException(status_code=403, detail="Only applicants can view their applications")
     
-    # Get the applicant profile for this user
-    applicant = db.query(Applicant).filter(Applicant.user_id == current_user.id).first()
-    if not applicant:
+    if current_user.applicant_id is None:
         raise HTTPException(status_code=404, detail="Applicant profile not found")
     
-    return crud.get_applications_by_applicant(db, applicant.id)
+    return crud.get_applications_by_applicant(db, current_user.applicant_id)
 
 @router.get("/job/{job_id}", response_model=List[schemas.JobApplication])
 def get_applications_for_job(
@@ -70,41 +96,13 @@ def get_applications_for_job(
 @router.get("/all", response_model=List[schemas.JobApplicationWithDetails])
 def get_all_applications(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db_for_user)
 ):
     """Get all applications with details (company users only)"""
     if current_user.role.value != "company":
         raise HTTPException(status_code=403, detail="Only company users can view all applications")
     
-    applications = crud.get_all_applications_with_details(db)
-    result = []
-    for app in applications:
-        # Convert status to proper enum value
-        status_value = app.status
-        if hasattr(status_value, 'value'):
-            status_value = status_value.value
-        
-        # Ensure status is uppercase
-        if isinstance(status_value, str):
-            status_value = status_value.upper()
-        
-        # Convert to enum
-        try:
-            status_enum = schemas.ApplicationStatus(status_value)
-        except ValueError:
-            status_enum = schemas.ApplicationStatus.PENDING
-        
-        result.append(schemas.JobApplicationWithDetails(
-            id=app.id,
-            applicant_id=app.applicant_id,
-            job_id=app.job_id,
-            status=status_enum,
-            applied_at=app.applied_at,
-            applicant_name=app.applicant_name,
-            applicant_email=app.applicant_email,
-            job_title=app.job_title
-        ))
-    return result
+    return details_response(crud.get_all_applications_with_details(db))
 
 @router.put("/{application_id}/status", response_model=schemas.JobApplication)
 def update_application_status(
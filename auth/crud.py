@@ -1,7 +1,7 @@
 
 from sqlalchemy.orm import Session
 from auth import models, schemas
-from bcrypt import hashpw, gensalt, checkpw
+from auth.hashing import hash_password, verify_password
 
 def get_user(db: Session, user_id: int):
     return db.query(models.User).filter(models.User.id == user_id).first()
@@ -12,8 +12,8 @@ def get_user_by_username(db: Session, username: str):
 def get_user_by_email(db: Session, email: str):
     return db.query(models.User).filter(models.User.email == email).first()
 
-def create_user(db: Session, user: schemas.UserCreate):
-    hashed_password = hashpw(user.password.encode('utf-8'), gensalt()).decode('utf-8')
+def create_user(db: Session, user: schemas.UserCreate, hashed_password: str = None):
+    hashed_password = hashed_password or hash_password(user.password)
     db_user = models.User(
         username=user.username,
         email=user.email,
@@ -29,6 +29,6 @@ def authenticate_user(db: Session, username: str, password: str):
     user = get_user_by_username(db, username)
     if not user:
         return False
-    if not checkpw(password.encode('utf-8'), user.hashed_password.encode('utf-8')):
+    if not verify_password(password, user.hashed_password):
         return False
     return user
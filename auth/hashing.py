@@ -0,0 +1,117 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+from bcrypt import hashpw, gensalt, checkpw
+from core.config import settings
+
+# bcrypt runs on a small dedicated pool (the bcrypt library releases the GIL
+# while hashing), so a login storm uses at most PASSWORD_HASH_WORKERS cores.
+# At most PASSWORD_HASH_MAX_QUEUE calls may wait for a worker; beyond that
+# callers get PasswordHashingBusy straight away instead of queueing. Async
+# handlers await the pool's future, so a waiting request holds no thread.
+
+class PasswordHashingBusy(Exception):
+    """Raised when the hashing queue is full"""
+
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+_admitted = 0
+_running = 0
+_rejected = 0
+_completed = 0
+_failed = 0
+# (seconds waiting for a worker, seconds hashing) of recent calls
+_latencies: deque = deque(maxlen=1000)
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+        return _executor
+
+def _submit(fn, *args) -> Future:
+    global _admitted, _rejected
+    with _lock:
+        if _admitted >= settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_MAX_QUEUE:
+            _rejected += 1
+            raise PasswordHashingBusy("Too many password operations in progress")
+        _admitted += 1
+    submitted = time.perf_counter()
+
+    def timed():
+        global _running
+        started = time.perf_counter()
+        with _lock:
+            _running += 1
+        try:
+            return fn(*args)
+        finally:
+            finished = time.perf_counter()
+            with _lock:
+                _running -= 1
+                _latencies.append((started - submitted, finished - started))
+
+    def on_done(future: Future):
+        global _admitted, _completed, _failed
+        with _lock:
+            _admitted -= 1
+            if future.cancelled() or future.exception() is not None:
+                _failed += 1
+            else:
+                _completed += 1
+
+    future = get_executor().submit(timed)
+    future.add_done_callback(on_done)
+    return future
+
+def _run(fn, *args):
+    return _submit(fn, *args).result()
+
+async def _run_async(fn, *args):
+    return await asyncio.wrap_future(_submit(fn, *args))
+
+def _hash(password: str) -> str:
+    return hashpw(password.encode('utf-8'), gensalt(rounds=settings.BCRYPT_ROUNDS)).decode('utf-8')
+
+def _check(password: str, hashed_password: str) -> bool:
+    return checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+def hash_password(password: str) -> str:
+    return _run(_hash, password)
+
+def verify_password(password: str, hashed_password: str) -> bool:
+    return _run(_check, password, hashed_password)
+
+async def hash_password_async(password: str) -> str:
+    return await _run_async(_hash, password)
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    return await _run_async(_check, password, hashed_password)
+
+def _percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+def metrics() -> Dict[str, Any]:
+    with _lock:
+        waits = [wait for wait, _ in _latencies]
+        hashes = [duration for _, duration in _latencies]
+        running = _running
+        return {
+            "workers": settings.PASSWORD_HASH_WORKERS,
+            "max_queue": settings.PASSWORD_HASH_MAX_QUEUE,
+            "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+            "running": running,
+            "queue_depth": _admitted - running,
+            "completed": _completed,
+            "failed": _failed,
+            "rejected": _rejected,
+            "wait_ms_p50": round(_percentile(waits, 0.5) * 1000, 2),
+            "wait_ms_p99": round(_percentile(waits, 0.99) * 1000, 2),
+            "hash_ms_p50": round(_percentile(hashes, 0.5) * 1000, 2),
+            "hash_ms_p99": round(_percentile(hashes, 0.99) * 1000, 2),
+        }
@@ -0,0 +1,99 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from sqlalchemy.orm import Session
+from core.config import settings
+from auth.models import User, UserRole
+
+class Principal:
+    """The authenticated caller as seen by the route handlers.
+
+    Carries the User attributes handlers read (id, username, email, role,
+    is_active) plus the caller's applicant profile id, detached from any
+    session so it can be cached and shared between requests.
+    """
+
+    __slots__ = ("id", "username", "email", "role", "is_active", "applicant_id")
+
+    def __init__(self, id: int, username: str, email: str, role: UserRole, is_active: bool, applicant_id: Optional[int] = None):
+        self.id = id
+        self.username = username
+        self.email = email
+        self.role = role
+        self.is_active = is_active
+        self.applicant_id = applicant_id
+
+    @classmethod
+    def from_user(cls, db: Session, user: User) -> "Principal":
+        applicant_id = None
+        if user.role == UserRole.applicant:
+            from applicants.models import Applicant
+            applicant_id = db.query(Applicant.id).filter(Applicant.user_id == user.id).order_by(Applicant.id).limit(1).scalar()
+        return cls(user.id, user.username, user.email, user.role, bool(user.is_active), applicant_id)
+
+    def claims(self) -> Dict[str, Any]:
+        """JWT claims identifying this principal"""
+        # No applicant id: a profile created after login would leave the token stale
+        return {"sub": self.username, "uid": self.id, "role": self.role.value}
+
+class PrincipalCache:
+    """Bounded LRU/TTL cache of user id -> Principal.
+
+    Writes that change what a Principal holds (the user row or the user's
+    applicant profile) call invalidate(); the TTL bounds staleness for
+    changes made by other processes. Applicants without a profile yet are
+    never cached, so a profile created through another worker is picked up
+    on the next request.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Optional[Principal]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(user_id, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, principal: Principal):
+        if self.max_entries <= 0:
+            return
+        if principal.role == UserRole.applicant and principal.applicant_id is None:
+            return
+        with self._lock:
+            self._entries[principal.id] = (time.monotonic() + self.ttl_seconds, principal)
+            self._entries.move_to_end(principal.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+principal_cache = PrincipalCache(settings.PRINCIPAL_CACHE_MAX_ENTRIES, settings.PRINCIPAL_CACHE_TTL_SECONDS)
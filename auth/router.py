@@ -1,13 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Form
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
 
-from database import get_db
+from database import get_db, open_read_session
 from core.config import settings
-from auth import schemas, crud
+from auth import schemas, crud, hashing
+from auth.hashing import PasswordHashingBusy
 from auth.models import User
+from auth.principal import Principal, principal_cache
 
 router = APIRouter()
 security = HTTPBearer()
@@ -19,7 +22,7 @@ def create_access_token(data: dict):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)):
+def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)) -> Principal:
     try:
         # Remove quotes if present in token
         token = credentials.credentials.strip('"')
@@ -30,50 +33,86 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid authentication credentials")
 
-    user = crud.get_user_by_username(db, username=username)
-    if user is None:
-        raise HTTPException(status_code=401, detail="User not found")
-    return user
+    # Tokens carry the user id, so the principal usually comes from the cache without a query
+    user_id = payload.get("uid")
+    principal = principal_cache.get(user_id) if user_id is not None else None
+    if principal is None:
+        user = crud.get_user(db, user_id=user_id) if user_id is not None else crud.get_user_by_username(db, username=username)
+        if user is None:
+            raise HTTPException(status_code=401, detail="User not found")
+        principal = Principal.from_user(db, user)
+        principal_cache.set(principal)
+
+    # A token issued before the user's role changed no longer describes the caller
+    if principal.username != username or ("role" in payload and payload["role"] != principal.role.value):
+        raise HTTPException(status_code=401, detail="Invalid authentication credentials")
+    # Commits on this request's session start the user's sticky-to-primary window
+    db.info["user_id"] = principal.id
+    return principal
+
+def get_read_db_for_user(current_user: Principal = Depends(get_current_user)):
+    """Read-only session for a signed-in caller, on the primary while their own write may not have replicated"""
+    db = open_read_session(current_user.id)
+    try:
+        yield db
+    finally:
+        db.close()
 
 def require_role(role: str):
-    def role_checker(current_user: User = Depends(get_current_user)):
+    def role_checker(current_user: Principal = Depends(get_current_user)):
         if current_user.role.value != role:
             raise HTTPException(status_code=403, detail="Operation not permitted")
         return current_user
     return role_checker
 
 @router.post("/register", response_model=schemas.User)
-def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
+async def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
     """Register a new user (company or applicant)"""
-    db_user = crud.get_user_by_username(db, username=user.username)
+    db_user = await run_in_threadpool(crud.get_user_by_username, db, user.username)
     if db_user:
         raise HTTPException(status_code=400, detail="Username already registered")
     
-    db_user_email = crud.get_user_by_email(db, email=user.email)
+    db_user_email = await run_in_threadpool(crud.get_user_by_email, db, user.email)
     if db_user_email:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    return crud.create_user(db=db, user=user)
+    # Awaiting the bcrypt pool holds no threadpool thread while the hash runs
+    try:
+        hashed_password = await hashing.hash_password_async(user.password)
+    except PasswordHashingBusy:
+        raise HTTPException(status_code=503, detail="Server is busy, please try again shortly", headers={"Retry-After": "1"})
+    return await run_in_threadpool(crud.create_user, db, user, hashed_password)
 
 @router.post("/token", response_model=schemas.Token)
-def login_for_access_token(username: str = Form(...), password: str = Form(...), db: Session = Depends(get_db)):
+async def login_for_access_token(username: str = Form(...), password: str = Form(...), db: Session = Depends(get_db)):
     """Login user and return access token"""
-    authenticated_user = crud.authenticate_user(db, username, password)
-    if not authenticated_user:
+    user = await run_in_threadpool(crud.get_user_by_username, db, username)
+    try:
+        password_ok = user is not None and await hashing.verify_password_async(password, user.hashed_password)
+    except PasswordHashingBusy:
+        raise HTTPException(status_code=503, detail="Server is busy, please try again shortly", headers={"Retry-After": "1"})
+    if not password_ok:
         raise HTTPException(status_code=401, detail="Incorrect username or password")
 
-    access_token = create_access_token(data={"sub": authenticated_user.username})
+    principal = await run_in_threadpool(Principal.from_user, db, user)
+    principal_cache.set(principal)
+    access_token = create_access_token(data=principal.claims())
     return {
         "access_token": access_token,
         "token_type": "bearer",
         "user": {
-            "id": authenticated_user.id,
-            "username": authenticated_user.username,
-            "role": authenticated_user.role.value
+            "id": user.id,
+            "username": user.username,
+            "role": user.role.value
         }
     }
 
 @router.get("/me", response_model=schemas.User)
 def read_users_me(current_user: User = Depends(get_current_user)):
     """Get current user information"""
-    return current_user
\ No newline at end of file
+    return current_user
+
+@router.get("/metrics/password-hashing")
+def get_password_hashing_metrics(current_user: Principal = Depends(require_role("company"))):
+    """Queue depth, rejections and latency of the password hashing pool"""
+    return hashing.metrics()
@@ -0,0 +1,152 @@
+"""
+Re-extract applicant skills after the skill dictionary or the parser changed.
+
+Applicants are read in id order, BATCH_SIZE at a time; each batch is re-extracted
+in parallel worker processes and written back in one transaction together with
+the derived matching data. The last finished id is checkpointed after every
+batch, so an interrupted run continues where it stopped when started again.
+
+    python backfill_skills.py [--reparse] [--batch-size N] [--workers N] [--restart]
+
+The API can keep running: match scores are recomputed from the stored skills in
+the database, and the version counters bumped with each batch make running API
+workers drop cached results and reload their in-memory skill index.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+# Add the current directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy.orm import load_only
+from database import SessionLocal, engine, Base
+from applicants.models import Applicant
+from applicants import search
+from matching import sync as matching_sync
+from matching.scores import ensure_match_scores
+from matching.versions import ensure_versions
+import auth.models, jobs.models, interviews.models, offers.models, applications.models  # noqa: F401
+
+DEFAULT_CHECKPOINT_PATH = "backfill_skills.checkpoint.json"
+
+def _init_worker():
+    from core.config import settings
+    # Each backfill worker is already a separate process, don't start parser pools inside it
+    settings.RESUME_PARSER_POOL_SIZE = 0
+
+def reextract(row: Tuple[int, Optional[str], Optional[str]], reparse: bool = False) -> Tuple[int, Optional[List[str]], Optional[str]]:
+    """Fresh (skills, resume_text) for one applicant; resume_text is only set when the PDF was re-parsed"""
+    from applicants.parser import parse_resume, extract_skills_from_text_basic
+    applicant_id, resume_text, resume_path = row
+    if resume_text and not reparse:
+        return applicant_id, extract_skills_from_text_basic(resume_text), None
+    if resume_path and os.path.exists(resume_path):
+        try:
+            text, skills, _ = parse_resume(resume_path)
+            return applicant_id, skills, text
+        except Exception as e:
+            print(f"⚠️  Could not parse resume of applicant {applicant_id}: {e}")
+    if resume_text:
+        return applicant_id, extract_skills_from_text_basic(resume_text), None
+    return applicant_id, None, None
+
+def _reextract_batch(rows, reparse: bool):
+    return [reextract(row, reparse) for row in rows]
+
+def load_checkpoint(path: str) -> dict:
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            return json.load(f)
+    return {"last_id": 0, "processed": 0, "updated": 0}
+
+def save_checkpoint(path: str, checkpoint: dict):
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(temp_path, path)
+
+def backfill_skills(batch_size: int = 500, workers: int = 0, reparse: bool = False,
+                    checkpoint_path: str = DEFAULT_CHECKPOINT_PATH, restart: bool = False):
+    Base.metadata.create_all(bind=engine)
+    checkpoint = {"last_id": 0, "processed": 0, "updated": 0} if restart else load_checkpoint(checkpoint_path)
+    if checkpoint["last_id"]:
+        print(f"ℹ️  Resuming after applicant {checkpoint['last_id']} ({checkpoint['processed']} processed so far)")
+
+    workers = workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=_init_worker)
+    db = SessionLocal()
+    started = time.monotonic()
+    try:
+        search.ensure_search_index(engine)
+        ensure_versions(db)
+        # Batches score against skill_postings, so those must be complete first
+        ensure_match_scores(db)
+        while True:
+            applicants = (
+                db.query(Applicant)
+                .options(load_only(Applicant.id, Applicant.name, Applicant.resume_text, Applicant.resume_path, Applicant.skills))
+                .filter(Applicant.id > checkpoint["last_id"])
+                .order_by(Applicant.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not applicants:
+                break
+
+            rows = [(applicant.id, applicant.resume_text, applicant.resume_path) for applicant in applicants]
+            chunk_size = max(1, -(-len(rows) // workers))
+            chunks = [rows[start:start + chunk_size] for start in range(0, len(rows), chunk_size)]
+            results = {}
+            for chunk_results in pool.map(_reextract_batch, chunks, [reparse] * len(chunks)):
+                for applicant_id, skills, resume_text in chunk_results:
+                    results[applicant_id] = (skills, resume_text)
+
+            changed = []
+            for applicant in applicants:
+                skills, resume_text = results[applicant.id]
+                if skills is None:
+                    continue
+                if resume_text is not None:
+                    applicant.resume_text = resume_text
+                if sorted(skills) != sorted(applicant.skills or []) or resume_text is not None:
+                    applicant.skills = skills
+                    changed.append(applicant)
+
+            # One transaction per batch: skills, search index, match scores and signatures move together
+            last_id = applicants[-1].id
+            # An unchanged batch bumps no versions, so running API workers keep their state
+            if changed:
+                search.index_applicants(db, [applicant for applicant in changed if results[applicant.id][1] is not None])
+                matching_sync.applicants_changed(db, changed)
+            db.expunge_all()
+
+            checkpoint["last_id"] = last_id
+            checkpoint["processed"] += len(applicants)
+            checkpoint["updated"] += len(changed)
+            save_checkpoint(checkpoint_path, checkpoint)
+            rate = checkpoint["processed"] / max(time.monotonic() - started, 1e-9)
+            print(f"   {checkpoint['processed']} applicants processed, {checkpoint['updated']} updated (up to id {checkpoint['last_id']}, {rate:.0f}/s)")
+    finally:
+        db.close()
+        pool.shutdown()
+
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    print(f"✅ Backfill complete: {checkpoint['processed']} applicants processed, {checkpoint['updated']} updated")
+    return checkpoint
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Re-extract applicant skills from stored resumes")
+    arg_parser.add_argument("--batch-size", type=int, default=500, help="applicants per batch and checkpoint")
+    arg_parser.add_argument("--workers", type=int, default=0, help="worker processes (default: CPU count)")
+    arg_parser.add_argument("--reparse", action="store_true", help="re-parse the stored PDFs instead of the stored resume text")
+    arg_parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT_PATH, help="checkpoint file")
+    arg_parser.add_argument("--restart", action="store_true", help="ignore an existing checkpoint")
+    args = arg_parser.parse_args()
+    backfill_skills(args.batch_size, args.workers, args.reparse, args.checkpoint, args.restart)
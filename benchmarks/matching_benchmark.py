@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Matching benchmark: runs get_matched_applicants_for_job and
+get_matched_jobs_for_applicant against an in-memory SQLite database filled
+with synthetic data at several sizes, and prints machine-readable JSON.
+
+    python benchmarks/matching_benchmark.py --sizes 10000,100000 --output bench.json
+
+Preparing a size includes building match_scores, which holds one row per
+(job, applicant) pair sharing a skill; the 1M size therefore takes a while
+and several GB of RAM.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+# Add the project root to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database import Base
+from auth.models import User, UserRole
+from jobs.models import JobPosition
+from applicants.models import Applicant
+from interviews.models import Interview
+from offers.models import OfferLetter
+from applications.models import JobApplication
+from matching.models import MatchScore, SkillSignature
+from matching.index import skill_index
+from matching.scores import rebuild_match_scores
+from matching.approx import build_lsh
+from matching.utils import get_matched_applicants_for_job, get_matched_jobs_for_applicant
+from benchmarks.synthetic import SyntheticDataGenerator
+
+INSERT_BATCH_SIZE = 10000
+
+class RowCounter:
+    """Counts ORM rows materialized from the database (our 'rows scanned' proxy)"""
+
+    def __init__(self):
+        self.rows = 0
+        for model in (Applicant, JobPosition, MatchScore):
+            event.listen(model, "load", self._on_load)
+
+    def _on_load(self, target, context):
+        self.rows += 1
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+def create_database(size: int, job_count: int, seed: int):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    company = User(username="bench_company", email="bench@example.com", hashed_password="-", role=UserRole.company)
+    applicant_user = User(username="bench_applicant", email="applicant@example.com", hashed_password="-", role=UserRole.applicant)
+    db.add_all([company, applicant_user])
+    db.commit()
+
+    generator = SyntheticDataGenerator(seed)
+    db.execute(insert(JobPosition), list(generator.jobs(job_count, company.id)))
+    batch = []
+    for row in generator.applicants(size, applicant_user.id):
+        batch.append(row)
+        if len(batch) >= INSERT_BATCH_SIZE:
+            db.execute(insert(Applicant), batch)
+            batch = []
+    if batch:
+        db.execute(insert(Applicant), batch)
+    db.commit()
+
+    # Derived matching state, as main.py prepares it at startup
+    started = time.perf_counter()
+    skill_index.build(db)
+    rebuild_match_scores(db)
+    build_lsh(db)
+    return db, time.perf_counter() - started
+
+def measure(db, counter: RowCounter, name: str, fn, ids, repeats: int):
+    latencies, rows = [], []
+    for _ in range(repeats):
+        for item_id in ids:
+            db.expunge_all()  # every request starts with an empty identity map
+            counter.rows = 0
+            started = time.perf_counter()
+            fn(db, item_id)
+            latencies.append((time.perf_counter() - started) * 1000)
+            rows.append(counter.rows)
+
+    # Peak memory is measured in a separate pass so tracing does not skew latency
+    db.expunge_all()
+    tracemalloc.start()
+    fn(db, ids[0])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "function": name,
+        "calls": len(latencies),
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "rows_scanned_mean": round(statistics.fmean(rows), 1),
+        "rows_scanned_max": max(rows),
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+def run(sizes, job_count: int, samples: int, repeats: int, seed: int):
+    counter = RowCounter()
+    report = {
+        "benchmark": "matching",
+        "commit": git_commit(),
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "python": platform.python_version(),
+        "seed": seed,
+        "jobs": job_count,
+        "results": [],
+    }
+    for size in sizes:
+        db, prepare_seconds = create_database(size, job_count, seed)
+        rng = random.Random(seed)
+        job_ids = [job_id for (job_id,) in db.query(JobPosition.id)]
+        applicant_ids = rng.sample(range(1, size + 1), min(samples, size))
+        job_sample = rng.sample(job_ids, min(samples, len(job_ids)))
+
+        for name, fn, ids in (
+            ("get_matched_applicants_for_job", get_matched_applicants_for_job, job_sample),
+            ("get_matched_applicants_for_job[limit=20]", lambda db, job_id: get_matched_applicants_for_job(db, job_id, limit=20), job_sample),
+            ("get_matched_jobs_for_applicant", get_matched_jobs_for_applicant, applicant_ids),
+            ("get_matched_jobs_for_applicant[limit=20]", lambda db, applicant_id: get_matched_jobs_for_applicant(db, applicant_id, limit=20), applicant_ids),
+        ):
+            result = measure(db, counter, name, fn, ids, repeats)
+            result.update({"applicants": size, "prepare_seconds": round(prepare_seconds, 3)})
+            report["results"].append(result)
+            print(f"{name} @ {size}: p50={result['p50_ms']}ms p99={result['p99_ms']}ms rows={result['rows_scanned_mean']}", file=sys.stderr)
+        db.close()
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark candidate/job matching on synthetic data")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="comma-separated applicant counts")
+    parser.add_argument("--jobs", type=int, default=50, help="number of synthetic jobs")
+    parser.add_argument("--samples", type=int, default=20, help="distinct jobs/applicants queried per size")
+    parser.add_argument("--repeats", type=int, default=5, help="passes over the sampled ids")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    report = run(sizes, args.jobs, args.samples, args.repeats, args.seed)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import random
+from typing import Dict, Iterator, List
+
+from applicants.parser import SKILL_KEYWORDS
+
+# Skill popularity follows a Zipf-like curve: a handful of skills (Python, SQL,
+# Communication, ...) appear on most profiles while the long tail is rare.
+ZIPF_EXPONENT = 1.1
+
+class SyntheticDataGenerator:
+    """Deterministic generator of applicants and jobs with realistic skill distributions"""
+
+    def __init__(self, seed: int = 42):
+        self.seed = seed
+        self.skills = [skill.title() for skill in SKILL_KEYWORDS]
+        popularity = random.Random(seed).sample(range(len(self.skills)), len(self.skills))
+        self.weights = [1.0 / ((rank + 1) ** ZIPF_EXPONENT) for rank in popularity]
+
+    def _skill_set(self, rng: random.Random, low: int, high: int) -> List[str]:
+        size = rng.randint(low, high)
+        chosen = set()
+        while len(chosen) < size:
+            chosen.update(rng.choices(self.skills, weights=self.weights, k=size - len(chosen)))
+        return sorted(chosen)
+
+    def applicants(self, count: int, user_id: int) -> Iterator[Dict]:
+        rng = random.Random(f"{self.seed}-applicants")
+        for n in range(count):
+            yield {
+                "user_id": user_id,
+                "name": f"Applicant {n}",
+                "email": f"applicant{n}@example.com",
+                "skills": self._skill_set(rng, 3, 15),
+            }
+
+    def jobs(self, count: int, company_id: int) -> Iterator[Dict]:
+        rng = random.Random(f"{self.seed}-jobs")
+        for n in range(count):
+            yield {
+                "title": f"Job {n}",
+                "description": "Synthetic benchmark job",
+                "skills": self._skill_set(rng, 3, 8),
+                "company_id": company_id,
+            }
@@ -18,5 +18,47 @@ class Settings:
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-here-change-in-production")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    PASSWORD_HASH_MAX_QUEUE: int = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "16"))
+    DB_PROFILE: str = os.getenv("DB_PROFILE", "auto")  # auto, sqlite, server or basic
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_RECYCLE_SECONDS: int = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+    DB_POOL_TIMEOUT_SECONDS: float = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_CACHE_SIZE_KB: int = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+    SQLITE_MMAP_SIZE_BYTES: int = int(os.getenv("SQLITE_MMAP_SIZE_BYTES", str(256 * 1024 * 1024)))
+    DATABASE_REPLICA_URLS: str = os.getenv("DATABASE_REPLICA_URLS", "")  # comma-separated read replicas
+    SQLITE_REPLICA_PATH: Optional[str] = os.getenv("SQLITE_REPLICA_PATH")  # local stand-in replica file
+    SQLITE_REPLICA_SYNC_SECONDS: float = float(os.getenv("SQLITE_REPLICA_SYNC_SECONDS", "0.5"))
+    REPLICA_STICKY_SECONDS: float = float(os.getenv("REPLICA_STICKY_SECONDS", "5"))  # a user's reads stay on the primary this long after their write
+    USE_ASYNC_DB: bool = os.getenv("USE_ASYNC_DB", "false").lower() == "true"
+    ASYNC_DATABASE_URL: Optional[str] = os.getenv("ASYNC_DATABASE_URL")  # derived from DATABASE_URL when unset
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "10000"))
+    PRINCIPAL_CACHE_TTL_SECONDS: float = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+    SKILL_SYNONYMS_PATH: Optional[str] = os.getenv("SKILL_SYNONYMS_PATH")
+    SKILL_DICTIONARY_PATH: Optional[str] = os.getenv("SKILL_DICTIONARY_PATH")  # defaults to applicants/skills.txt
+    MAX_RESUME_UPLOAD_BYTES: int = int(os.getenv("MAX_RESUME_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+    BULK_IMPORT_MAX_BYTES: int = int(os.getenv("BULK_IMPORT_MAX_BYTES", str(500 * 1024 * 1024)))
+    BULK_IMPORT_STALE_SECONDS: float = float(os.getenv("BULK_IMPORT_STALE_SECONDS", "600"))  # an import silent this long is taken as dead
+    UPLOAD_CHUNK_SIZE: int = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+    PDF_MAX_PAGES: int = int(os.getenv("PDF_MAX_PAGES", "30"))  # 0 = no limit
+    PDF_MAX_CHARS: int = int(os.getenv("PDF_MAX_CHARS", "200000"))  # 0 = no limit
+    RESUME_PARSE_WORKERS: int = int(os.getenv("RESUME_PARSE_WORKERS", "2"))
+    RESUME_PARSE_MAX_PENDING: int = int(os.getenv("RESUME_PARSE_MAX_PENDING", "100"))
+    RESUME_PARSER_POOL_SIZE: int = int(os.getenv("RESUME_PARSER_POOL_SIZE", "1"))  # 0 runs pyresparser in-process
+    RESUME_PARSER_TIMEOUT_SECONDS: float = float(os.getenv("RESUME_PARSER_TIMEOUT_SECONDS", "120"))
+    RESUME_PARSE_CACHE_MAX_ENTRIES: int = int(os.getenv("RESUME_PARSE_CACHE_MAX_ENTRIES", "10000"))  # 0 disables the cache
+    MATCH_CACHE_MAX_ENTRIES: int = int(os.getenv("MATCH_CACHE_MAX_ENTRIES", "1024"))
+    MATCH_CACHE_TTL_SECONDS: float = float(os.getenv("MATCH_CACHE_TTL_SECONDS", "60"))
+    MATCH_CHANGE_LOG_VERSIONS: int = int(os.getenv("MATCH_CHANGE_LOG_VERSIONS", "10000"))  # versions of changed ids kept for catch-up
+    MATCH_REBUILD_MIN_INTERVAL_SECONDS: float = float(os.getenv("MATCH_REBUILD_MIN_INTERVAL_SECONDS", "30"))
+    MATCHING_POOL_SIZE: int = int(os.getenv("MATCHING_POOL_SIZE", "0"))  # 0 keeps matching in-process
+    MATCHING_SHARD_SIZE: int = int(os.getenv("MATCHING_SHARD_SIZE", "250000"))
+    MATCHING_SHARD_TTL_SECONDS: float = float(os.getenv("MATCHING_SHARD_TTL_SECONDS", "300"))
+    APPROX_MIN_CONTAINMENT: float = float(os.getenv("APPROX_MIN_CONTAINMENT", "0.5"))  # mode=approx recall applies from this match share up
 
 settings = Settings()
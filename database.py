@@ -1,23 +1,382 @@
-
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, select, update, Table, Column, Integer, DDL
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from typing import Any, Dict, List, Optional
+import itertools
+import sqlite3
+import threading
+import time
 import os
 
+from core.config import settings
+
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./recruitment_tracker.db")
 
-engine = create_engine(
-    DATABASE_URL, 
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
+# Engine profiles (DB_PROFILE): "sqlite" applies the WAL/pragma tuning below,
+# "server" sizes the connection pool for PostgreSQL and other server databases,
+# "basic" keeps SQLAlchemy's defaults; "auto" picks by the URL's dialect.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": settings.SQLITE_SYNCHRONOUS,
+    "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+    "cache_size": -settings.SQLITE_CACHE_SIZE_KB,  # negative = KiB rather than pages
+    "mmap_size": settings.SQLITE_MMAP_SIZE_BYTES,
+    "temp_store": "MEMORY",
+}
+
+def engine_profile(url: str) -> str:
+    if settings.DB_PROFILE != "auto":
+        return settings.DB_PROFILE
+    return "sqlite" if url.startswith("sqlite") else "server"
+
+def _is_memory_sqlite(url: str) -> bool:
+    return url.startswith("sqlite") and (url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in url)
+
+def _engine_kwargs(url: str) -> Dict[str, Any]:
+    kwargs: Dict[str, Any] = {}
+    if url.startswith("sqlite"):
+        kwargs["connect_args"] = {"check_same_thread": False}
+    if engine_profile(url) != "basic" and not _is_memory_sqlite(url):
+        kwargs.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        )
+    return kwargs
+
+def _install_sqlite_pragmas(sync_engine: Engine, url: str):
+    @event.listens_for(sync_engine, "connect")
+    def apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in SQLITE_PRAGMAS.items():
+            if name == "journal_mode" and _is_memory_sqlite(url):
+                continue
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+def make_engine(url: str) -> Engine:
+    """Create an engine for url with the configured profile's pool settings and pragmas"""
+    new_engine = create_engine(url, **_engine_kwargs(url))
+    if engine_profile(url) == "sqlite" and url.startswith("sqlite"):
+        _install_sqlite_pragmas(new_engine, url)
+    _track_pool(new_engine)
+    return new_engine
+
+# Pool checkout statistics per engine, see pool_stats()
+_pool_counters: Dict[int, Dict[str, int]] = {}
+_pool_counters_lock = threading.Lock()
+
+def _track_pool(tracked_engine: Engine):
+    counters = {"connects": 0, "checkouts": 0, "checkins": 0, "checked_out": 0, "peak_checked_out": 0, "invalidations": 0}
+    _pool_counters[id(tracked_engine)] = counters
+
+    @event.listens_for(tracked_engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        with _pool_counters_lock:
+            counters["connects"] += 1
+
+    @event.listens_for(tracked_engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        with _pool_counters_lock:
+            counters["checkouts"] += 1
+            counters["checked_out"] += 1
+            counters["peak_checked_out"] = max(counters["peak_checked_out"], counters["checked_out"])
+
+    @event.listens_for(tracked_engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        with _pool_counters_lock:
+            counters["checkins"] += 1
+            counters["checked_out"] -= 1
+
+    @event.listens_for(tracked_engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        with _pool_counters_lock:
+            counters["invalidations"] += 1
+
+def pool_stats(stats_engine: Engine = None) -> Dict[str, Any]:
+    """Pool configuration and checkout counters of an engine (the main engine by default)"""
+    stats_engine = stats_engine or engine
+    pool = stats_engine.pool
+    with _pool_counters_lock:
+        stats: Dict[str, Any] = dict(_pool_counters.get(id(stats_engine), {}))
+    stats.update({
+        "profile": engine_profile(str(stats_engine.url)),
+        "pool_class": type(pool).__name__,
+        "status": pool.status(),
+    })
+    for name in ("size", "checkedin", "overflow"):
+        if hasattr(pool, name):
+            stats[f"pool_{name}"] = getattr(pool, name)()
+    return stats
+
+engine = make_engine(DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# Read/write routing: writes and most reads use the primary engine above, read-only
+# handlers opt into replicas with get_read_db. Every transaction that writes also
+# bumps the one-row write_watermark table, so the primary's sequence counts commits
+# from every process (API workers, the parse threads and the CLI scripts) and each
+# replica reports how far it has replayed by reading the same row. A replica serves
+# a read only when it has applied every commit the primary had when the session was
+# opened. A user's own reads stay on the primary for REPLICA_STICKY_SECONDS after
+# they commit a write, without consulting the replicas at all.
+
+write_watermark = Table(
+    "write_watermark", Base.metadata,
+    Column("id", Integer, primary_key=True),
+    Column("sequence", Integer, nullable=False),
+)
+event.listen(write_watermark, "after_create", DDL("INSERT INTO write_watermark (id, sequence) VALUES (1, 0)"))
+
+def commit_sequence(connection) -> Optional[int]:
+    """The write_watermark sequence as seen through connection, None when the table is missing"""
+    try:
+        return connection.execute(select(write_watermark.c.sequence).where(write_watermark.c.id == 1)).scalar()
+    except DBAPIError:
+        return None
+
+def primary_sequence() -> int:
+    with engine.connect() as connection:
+        return commit_sequence(connection) or 0
+
+class Replica:
+    """A read replica, which replicates write_watermark along with everything else"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.engine = make_engine(url)
+        # Highest sequence seen on the replica; it only moves forward
+        self.sequence = 0
+
+    def caught_up(self, sequence: int) -> bool:
+        """Whether the replica has applied every commit up to sequence"""
+        if self.sequence >= sequence:
+            return True
+        try:
+            with self.engine.connect() as connection:
+                applied = commit_sequence(connection)
+        except DBAPIError:
+            return False
+        if applied is not None:
+            self.sequence = max(self.sequence, applied)
+        return self.sequence >= sequence
+
+    def stats(self) -> Dict[str, Any]:
+        return {"url": self.engine.url.render_as_string(hide_password=True), "sequence": self.sequence, **pool_stats(self.engine)}
+
+class SqliteFileReplica(Replica):
+    """Stand-in replica for local SQLite: a second database file refreshed from the
+    primary with the sqlite backup API whenever the primary's sequence moves on"""
+
+    def __init__(self, source: Engine, path: str, interval: float):
+        super().__init__(f"sqlite:///{path}")
+        self.source = source
+        self.path = path
+        self.interval = interval
+        self.syncs = 0
+        self._pending = threading.Event()
+        self._sync_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def sync(self):
+        """Copy the primary database into the replica file"""
+        with self._sync_lock:
+            source_connection = self.source.raw_connection()
+            try:
+                target = sqlite3.connect(self.path, timeout=settings.SQLITE_BUSY_TIMEOUT_MS / 1000)
+                try:
+                    source_connection.driver_connection.backup(target)
+                    row = target.execute("SELECT sequence FROM write_watermark WHERE id = 1").fetchone()
+                finally:
+                    target.close()
+            finally:
+                source_connection.close()
+            if row is not None:
+                self.sequence = max(self.sequence, row[0])
+            self.syncs += 1
+
+    def notify(self):
+        self._pending.set()
+
+    def start(self):
+        """Bring the replica up to date, then keep refreshing it in the background"""
+        self.sync()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="sqlite-replica-sync", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            # Local commits wake the thread early; commits from other processes are
+            # noticed by polling the primary's sequence every interval
+            if self._pending.wait(self.interval):
+                # Let a burst of commits settle so one copy covers all of them
+                time.sleep(self.interval)
+                self._pending.clear()
+            try:
+                if primary_sequence() > self.sequence:
+                    self.sync()
+            except Exception as e:
+                print(f"Error syncing SQLite replica: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats["syncs"] = self.syncs
+        return stats
+
+replicas: List[Replica] = [Replica(url.strip()) for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+sqlite_replica: Optional[SqliteFileReplica] = None
+if settings.SQLITE_REPLICA_PATH:
+    if DATABASE_URL.startswith("sqlite") and not _is_memory_sqlite(DATABASE_URL):
+        sqlite_replica = SqliteFileReplica(engine, settings.SQLITE_REPLICA_PATH, settings.SQLITE_REPLICA_SYNC_SECONDS)
+        replicas.append(sqlite_replica)
+    else:
+        print("Warning: SQLITE_REPLICA_PATH needs a file-backed SQLite primary, replica disabled")
+
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False)
+_replica_cycle = itertools.cycle(replicas) if replicas else None
+
+# user id -> monotonic time until which that user's reads stay on the primary
+_sticky_until: Dict[int, float] = {}
+_sticky_lock = threading.Lock()
+_STICKY_PRUNE_SIZE = 1024
+
+@event.listens_for(Session, "after_flush")
+def _note_session_write(session, flush_context):
+    session.info["wrote"] = True
+
+@event.listens_for(Session, "do_orm_execute")
+def _note_statement_write(orm_execute_state):
+    # Core and bulk DML through the session (e.g. the matching hooks) flush nothing
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote"] = True
+
+@event.listens_for(Session, "before_commit")
+def _bump_watermark(session):
+    if "replica" in session.info:
+        return
+    session.flush()
+    if session.info.get("wrote"):
+        result = session.connection().execute(
+            update(write_watermark).where(write_watermark.c.id == 1).values(sequence=write_watermark.c.sequence + 1)
+        )
+        if result.rowcount == 0:
+            session.connection().execute(write_watermark.insert().values(id=1, sequence=1))
+
+@event.listens_for(Session, "after_commit")
+def _record_commit(session):
+    if not session.info.pop("wrote", False) or "replica" in session.info:
+        return
+    user_id = session.info.get("user_id")
+    if user_id is not None and settings.REPLICA_STICKY_SECONDS > 0:
+        now = time.monotonic()
+        with _sticky_lock:
+            if len(_sticky_until) >= _STICKY_PRUNE_SIZE:
+                for expired in [key for key, until in _sticky_until.items() if until < now]:
+                    del _sticky_until[expired]
+            _sticky_until[user_id] = now + settings.REPLICA_STICKY_SECONDS
+    if sqlite_replica is not None:
+        sqlite_replica.notify()
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_write(session):
+    session.info.pop("wrote", None)
+
+def _is_sticky(user_id: Optional[int]) -> bool:
+    if user_id is None:
+        return False
+    with _sticky_lock:
+        return _sticky_until.get(user_id, 0.0) > time.monotonic()
+
+def choose_replica(user_id: Optional[int] = None) -> Optional[Replica]:
+    """A replica that has applied every commit so far, or None when the read should go to the primary"""
+    if _replica_cycle is None or _is_sticky(user_id):
+        return None
+    sequence = primary_sequence()
+    for _ in range(len(replicas)):
+        replica = next(_replica_cycle)
+        if replica.caught_up(sequence):
+            return replica
+    return None
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+def open_read_session(user_id: Optional[int] = None) -> Session:
+    """Session on a caught-up replica, or on the primary; user_id identifies the caller for the sticky window"""
+    replica = choose_replica(user_id)
+    if replica is None:
+        db = SessionLocal()
+    else:
+        db = ReadSessionLocal(bind=replica.engine)
+        db.info["replica"] = replica
+    db.info["user_id"] = user_id
+    return db
+
+def get_read_db():
+    """Session for anonymous read-only handlers, see auth.router.get_read_db_for_user for signed-in ones"""
+    db = open_read_session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def replication_stats() -> List[Dict[str, Any]]:
+    return [replica.stats() for replica in replicas]
+
+# Optional async data path (USE_ASYNC_DB). Routes migrated to it live in each
+# package's async_router and use get_async_db; main.py mounts them ahead of the
+# sync routers, so a migrated route replaces its sync version only when enabled.
+
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+def async_database_url(url: str) -> str:
+    """The async-driver form of a sync database URL (sqlite+aiosqlite, postgresql+asyncpg)"""
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    scheme, rest = url.split("://", 1)
+    dialect = scheme.split("+", 1)[0]
+    driver = ASYNC_DRIVERS.get(dialect)
+    if driver is None:
+        raise ValueError(f"No async driver known for {dialect} databases")
+    return f"{dialect}+{driver}://{rest}"
+
+def make_async_engine(url: str):
+    """Create an AsyncEngine with the same profile as make_engine"""
+    from sqlalchemy.ext.asyncio import create_async_engine
+    new_engine = create_async_engine(url, **_engine_kwargs(url))
+    if engine_profile(url) == "sqlite" and url.startswith("sqlite"):
+        _install_sqlite_pragmas(new_engine.sync_engine, url)
+    _track_pool(new_engine.sync_engine)
+    return new_engine
+
+async_engine = None
+AsyncSessionLocal = None
+if settings.USE_ASYNC_DB:
+    try:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+        async_engine = make_async_engine(async_database_url(DATABASE_URL))
+        # Async sessions cannot lazy-load after commit, keep loaded state instead
+        AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    except (ImportError, ValueError) as e:
+        print(f"Warning: async database path not available ({e}), using the sync path")
+
+def async_db_enabled() -> bool:
+    return AsyncSessionLocal is not None
+
+async def get_async_db():
+    if AsyncSessionLocal is None:
+        raise RuntimeError("The async database path is not enabled (USE_ASYNC_DB)")
+    async with AsyncSessionLocal() as db:
+        yield db
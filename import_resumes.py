@@ -0,0 +1,67 @@
+"""
+Bulk-import resume PDFs from a ZIP archive or a directory as applicant profiles.
+
+    python import_resumes.py resumes.zip --username company_hr [--workers N] [--report report.json]
+
+The profiles are owned by the given (company) account, the same as imports made
+through POST /applicants/bulk-import. The API can keep running: each batch
+commits with a match_versions bump and the ids it added, so API workers load just
+those applicants on their next matching request, and reads move back to a replica
+only once it has replayed the import's commits (the database write watermark).
+The run takes the same single import slot as the API, so it refuses to start
+while another import is queued or running.
+"""
+import argparse
+import json
+import os
+import sys
+
+# Add the current directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from database import SessionLocal, engine, Base
+from auth.models import User
+from applicants.bulk_import import create_import_job, run_import_job, ImportInProgress
+from applicants.search import ensure_search_index
+import jobs.models, applicants.models, interviews.models, offers.models, applications.models, matching.models  # noqa: F401
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Bulk-import resume PDFs as applicant profiles")
+    arg_parser.add_argument("source", help="ZIP archive or directory of PDF resumes")
+    arg_parser.add_argument("--username", required=True, help="account that will own the imported profiles")
+    arg_parser.add_argument("--workers", type=int, default=0, help="parser processes (default: CPU count)")
+    arg_parser.add_argument("--report", help="write the per-file report to this JSON file")
+    args = arg_parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    ensure_search_index(engine)
+    os.makedirs("uploads", exist_ok=True)
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.username == args.username).first()
+        if user is None:
+            print(f"❌ User {args.username} not found")
+            sys.exit(1)
+
+        job = create_import_job(db, user.id, os.path.basename(args.source))
+        result = run_import_job(job.id, args.source, workers=args.workers)
+    except ImportInProgress:
+        print("❌ Another bulk import is in progress, try again once it has finished")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    for entry in result["files"]:
+        if entry["status"] != "imported":
+            print(f"   {entry['status']}: {entry['file']} ({entry['error']})")
+    print(f"✅ Imported {result['imported']} of {result['total_files']} files ({result['failed']} failed, {result['skipped']} skipped)")
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(result, f, indent=2)
+        print(f"ℹ️  Report written to {args.report}")
+
+if __name__ == "__main__":
+    main()
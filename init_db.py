@@ -8,11 +8,12 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from database import engine, Base
 from auth.models import User
-from applicants.models import Applicant
+from applicants.models import Applicant, ResumeParseJob, ResumeParseCache
 from jobs.models import JobPosition
 from interviews.models import Interview
 from offers.models import OfferLetter
 from applications.models import JobApplication
+from matching.models import MatchScore, SkillSignature
 
 def create_tables():
     # Drop all tables first to ensure clean schema
@@ -0,0 +1,47 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from interviews.models import Interview
+from interviews.schemas import InterviewCreate, InterviewUpdate
+
+async def create_interview(db: AsyncSession, interview: InterviewCreate):
+    from datetime import datetime
+    db_interview = Interview(
+        applicant_id=interview.applicant_id,
+        position_id=interview.position_id,
+        date_time=interview.date_time,
+        created_at=datetime.now()
+    )
+    db.add(db_interview)
+    await db.commit()
+    await db.refresh(db_interview)
+    return db_interview
+
+async def get_interviews(db: AsyncSession, skip: int = 0, limit: int = 100):
+    result = await db.execute(select(Interview).offset(skip).limit(limit))
+    return result.scalars().all()
+
+async def get_interview(db: AsyncSession, interview_id: int):
+    return await db.get(Interview, interview_id)
+
+async def update_interview(db: AsyncSession, interview_id: int, interview_update: InterviewUpdate):
+    db_interview = await db.get(Interview, interview_id)
+    if db_interview:
+        update_data = interview_update.dict(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(db_interview, field, value)
+        await db.commit()
+        await db.refresh(db_interview)
+    return db_interview
+
+async def get_interviews_by_company(db: AsyncSession, company_id: int):
+    from jobs.models import JobPosition
+    result = await db.execute(select(Interview).join(JobPosition, Interview.position_id == JobPosition.id).filter(JobPosition.company_id == company_id))
+    return result.scalars().all()
+
+async def delete_interview(db: AsyncSession, interview_id: int):
+    db_interview = await db.get(Interview, interview_id)
+    if db_interview:
+        await db.delete(db_interview)
+        await db.commit()
+        return {"message": "Interview deleted successfully"}
+    return None
@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from database import get_async_db
+from auth.router import get_current_user
+from auth.models import User
+from interviews import schemas, async_crud
+from interviews.models import Interview
+
+# Routes migrated to the async data path, mounted ahead of interviews.router when USE_ASYNC_DB is on
+router = APIRouter()
+
+@router.get("/", response_model=List[schemas.Interview])
+async def list_interviews(
+    skip: int = 0,
+    limit: int = 100,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """List interviews"""
+    if current_user.role.value == "company":
+        # Companies see interviews for their job positions - filter out null applicant_id
+        interviews = await async_crud.get_interviews_by_company(db, company_id=current_user.id)
+        return [interview for interview in interviews if interview.applicant_id is not None]
+    else:
+        # Applicants see their own interviews
+        if current_user.applicant_id is None:
+            return []
+        result = await db.execute(select(Interview).filter(
+            Interview.applicant_id == current_user.applicant_id,
+            Interview.applicant_id.isnot(None)
+        ))
+        return result.scalars().all()
@@ -5,7 +5,6 @@ from typing import List
 from database import get_db
 from auth.router import get_current_user, require_role
 from auth.models import User
-from applicants.models import Applicant
 from interviews import schemas, crud
 from interviews.models import Interview
 from jobs.crud import get_job
@@ -46,11 +45,10 @@ def list_interviews(
         return [interview for interview in interviews if interview.applicant_id is not None]
     else:
         # Applicants see their own interviews
-        applicant = db.query(Applicant).filter(Applicant.user_id == current_user.id).first()
-        if not applicant:
+        if current_user.applicant_id is None:
             return []
         return db.query(Interview).filter(
-            Interview.applicant_id == applicant.id,
+            Interview.applicant_id == current_user.applicant_id,
             Interview.applicant_id.isnot(None)
         ).all()
 
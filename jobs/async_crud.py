@@ -0,0 +1,24 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from jobs.models import JobPosition
+from jobs import schemas
+from jobs import crud
+
+# Async versions of jobs.crud. Writes run the sync functions through run_sync so
+# the matching index/score hooks stay in one place.
+
+async def create_job(db: AsyncSession, job: schemas.JobPositionCreate, company_id: int):
+    return await db.run_sync(lambda session: crud.create_job(session, job, company_id))
+
+async def get_jobs(db: AsyncSession, skip: int = 0, limit: int = 100):
+    result = await db.execute(select(JobPosition).offset(skip).limit(limit))
+    return result.scalars().all()
+
+async def get_job(db: AsyncSession, job_id: int):
+    return await db.get(JobPosition, job_id)
+
+async def update_job(db: AsyncSession, job_id: int, job_update: schemas.JobPositionUpdate):
+    return await db.run_sync(lambda session: crud.update_job(session, job_id, job_update))
+
+async def delete_job(db: AsyncSession, job_id: int):
+    return await db.run_sync(lambda session: crud.delete_job(session, job_id))
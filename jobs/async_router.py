@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from database import get_async_db
+from jobs import schemas, async_crud
+
+# Routes migrated to the async data path, mounted ahead of jobs.router when USE_ASYNC_DB is on
+router = APIRouter()
+
+@router.get("/", response_model=List[schemas.JobPosition])
+async def list_jobs(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_db)):
+    """List all job postings"""
+    return await async_crud.get_jobs(db, skip=skip, limit=limit)
+
+@router.get("/{job_id}", response_model=schemas.JobPosition)
+async def get_job(job_id: int, db: AsyncSession = Depends(get_async_db)):
+    """Get specific job details"""
+    job = await async_crud.get_job(db, job_id=job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from jobs.models import JobPosition
 from jobs import schemas
+from matching import sync as matching_sync
 
 def create_job(db: Session, job: schemas.JobPositionCreate, company_id: int):
     db_job = JobPosition(
@@ -14,6 +15,7 @@ def create_job(db: Session, job: schemas.JobPositionCreate, company_id: int):
     db.add(db_job)
     db.commit()
     db.refresh(db_job)
+    matching_sync.job_changed(db, db_job)
     return db_job
 
 def get_jobs(db: Session, skip: int = 0, limit: int = 100):
@@ -37,11 +39,13 @@ def update_job(db: Session, job_id: int, job_update: schemas.JobPositionUpdate):
             db_job.location = job_update.location
         db.commit()
         db.refresh(db_job)
+        matching_sync.job_changed(db, db_job, skills_changed=job_update.skills is not None)
     return db_job
 
 def delete_job(db: Session, job_id: int):
     db_job = db.query(JobPosition).filter(JobPosition.id == job_id).first()
     if db_job:
+        matching_sync.job_deleted(db, job_id)
         db.delete(db_job)
         db.commit()
     return db_job
\ No newline at end of file
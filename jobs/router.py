@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
 
-from database import get_db
+from database import get_db, get_read_db
 from auth.router import get_current_user, require_role
 from auth.models import User
 from jobs import schemas, crud
@@ -20,7 +20,7 @@ def create_job(
     return crud.create_job(db=db, job=job, company_id=current_user.id)
 
 @router.get("/", response_model=List[schemas.JobPosition])
-def list_jobs(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def list_jobs(skip: int = 0, limit: int = 100, db: Session = Depends(get_read_db)):
     """List all job postings"""
     return crud.get_jobs(db, skip=skip, limit=limit)
 
@@ -1,12 +1,13 @@
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 import os
 import uvicorn
 
-from database import engine, Base
+from database import engine, Base, SessionLocal, pool_stats, async_db_enabled, sqlite_replica, replication_stats
+from auth.router import require_role
 from auth.router import router as auth_router
 from jobs.router import router as jobs_router
 from applicants.router import router as applicants_router
@@ -21,10 +22,11 @@ os.makedirs("offer_letters", exist_ok=True)
 
 # Import all models to ensure they're registered
 from auth.models import User, UserRole
-from applicants.models import Applicant
+from applicants.models import Applicant, ResumeParseJob, ResumeParseCache
 from interviews.models import Interview, InterviewStatus
 from offers.models import OfferLetter
 from applications.models import JobApplication
+from matching.models import MatchScore, SkillSignature, SkillPosting, MatchVersion, MatchChange
 
 # Create database tables
 try:
@@ -33,6 +35,50 @@ try:
 except Exception as e:
     print(f"Error creating database tables: {e}")
 
+# Full-text search index over resumes
+from applicants.search import ensure_search_index
+try:
+    ensure_search_index(engine)
+except Exception as e:
+    print(f"Error preparing resume search index: {e}")
+
+# Backfill stored match scores and signatures, then build the in-memory skill index
+from matching.versions import ensure_versions
+from matching.scores import ensure_match_scores
+from matching.approx import backfill_signatures
+from matching.sync import load_memory_state
+try:
+    with SessionLocal() as db:
+        ensure_versions(db)
+        ensure_match_scores(db)
+        backfill_signatures(db)
+        load_memory_state(db)
+except Exception as e:
+    print(f"Error preparing matching data: {e}")
+
+# Copy the prepared database into the local stand-in replica and keep it in sync
+if sqlite_replica is not None:
+    try:
+        sqlite_replica.start()
+    except Exception as e:
+        print(f"Error starting SQLite replica: {e}")
+
+# Start the resume parser workers loading their models in the background
+from applicants import parser_pool
+from applicants.parser import PYRESPARSER_AVAILABLE
+if PYRESPARSER_AVAILABLE and parser_pool.pool_enabled():
+    try:
+        parser_pool.warm_up()
+    except Exception as e:
+        print(f"Error warming up resume parser pool: {e}")
+
+# Pick up resume parsing jobs interrupted by a restart
+from applicants.pipeline import resume_pending_jobs
+try:
+    resume_pending_jobs()
+except Exception as e:
+    print(f"Error resuming parse jobs: {e}")
+
 app = FastAPI(
     title="Recruitment Tracker System",
     description="A complete hiring management system with job postings, resume uploads, skill matching, interview scheduling, and offer letter generation.",
@@ -60,6 +106,19 @@ async def get_styles():
 async def get_script():
     return FileResponse("static/script.js", media_type="text/javascript")
 
+# Routes migrated to the async data path take precedence over their sync versions
+if async_db_enabled():
+    from jobs.async_router import router as jobs_async_router
+    from applicants.async_router import router as applicants_async_router
+    from interviews.async_router import router as interviews_async_router
+    from offers.async_router import router as offers_async_router
+    from applications.async_router import router as applications_async_router
+    app.include_router(jobs_async_router, prefix="/jobs", tags=["Jobs"])
+    app.include_router(applicants_async_router, prefix="/applicants", tags=["Applicants"])
+    app.include_router(interviews_async_router, prefix="/interviews", tags=["Interviews"])
+    app.include_router(offers_async_router, prefix="/offers", tags=["Offers"])
+    app.include_router(applications_async_router, prefix="/applications", tags=["Applications"])
+
 # Include routers
 app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
 app.include_router(jobs_router, prefix="/jobs", tags=["Jobs"])
@@ -77,5 +136,12 @@ async def root():
 async def api_root():
     return {"message": "Welcome to Recruitment Tracker System", "docs": "/docs"}
 
+@app.get("/api/db/pool")
+def get_db_pool_stats(current_user: User = Depends(require_role("company"))):
+    """Database engine profile, connection pool checkout statistics and read replicas"""
+    stats = pool_stats()
+    stats["replicas"] = replication_stats()
+    return stats
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=5000, reload=True)
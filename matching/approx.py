@@ -0,0 +1,88 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from jobs.models import JobPosition
+from applicants.models import Applicant
+from sqlalchemy import delete, func
+from matching.models import SkillSignature, SkillPosting
+from matching.minhash import compute_signature, applicant_lsh, job_lsh, LSHIndex
+
+JOB = "job"
+APPLICANT = "applicant"
+
+# Rows per executemany() and ids per IN (...) clause when (re)writing signatures
+INSERT_BATCH_SIZE = 1000
+IN_CLAUSE_BATCH_SIZE = 500
+
+def _lsh_for(entity_type: str) -> LSHIndex:
+    return job_lsh if entity_type == JOB else applicant_lsh
+
+def store_signatures(db: Session, entity_type: str, items: Iterable[Tuple[int, Optional[List[str]]]]) -> Dict[int, Optional[List[int]]]:
+    """Recompute and persist the signatures of (id, skills) pairs (caller commits, then buckets them)"""
+    signatures = {entity_id: compute_signature(skills) for entity_id, skills in items}
+    ids = list(signatures)
+    for start in range(0, len(ids), IN_CLAUSE_BATCH_SIZE):
+        db.execute(delete(SkillSignature).where(
+            SkillSignature.entity_type == entity_type,
+            SkillSignature.entity_id.in_(ids[start:start + IN_CLAUSE_BATCH_SIZE])
+        ))
+    # Core executemany, the ORM unit of work costs several times more per row
+    rows = [
+        {"entity_type": entity_type, "entity_id": entity_id, "signature": signature}
+        for entity_id, signature in signatures.items() if signature is not None
+    ]
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        db.execute(SkillSignature.__table__.insert(), rows[start:start + INSERT_BATCH_SIZE])
+    return signatures
+
+def store_signature(db: Session, entity_type: str, entity_id: int, skills: Optional[List[str]]) -> Optional[List[int]]:
+    """Recompute and persist one row's signature (caller commits, then buckets it)"""
+    return store_signatures(db, entity_type, [(entity_id, skills)])[entity_id]
+
+def delete_signature(db: Session, entity_type: str, entity_id: int):
+    db.query(SkillSignature).filter(
+        SkillSignature.entity_type == entity_type,
+        SkillSignature.entity_id == entity_id
+    ).delete(synchronize_session=False)
+
+def bucket(entity_type: str, entity_id: int, signature: Optional[List[int]], size: int):
+    _lsh_for(entity_type).add(entity_id, signature, size)
+
+def unbucket(entity_type: str, entity_id: int):
+    _lsh_for(entity_type).remove(entity_id)
+
+def load_lsh(db: Session, batch_size: int = 1000):
+    """Rebuild the LSH buckets from the stored signatures and skill counts (read-only)"""
+    sizes = {
+        (entity_type, entity_id): size
+        for entity_type, entity_id, size in db.query(
+            SkillPosting.entity_type, SkillPosting.entity_id, func.count()
+        ).group_by(SkillPosting.entity_type, SkillPosting.entity_id)
+    }
+    loaded = {JOB: [], APPLICANT: []}
+    for entity_type, entity_id, signature in db.query(
+        SkillSignature.entity_type, SkillSignature.entity_id, SkillSignature.signature
+    ).yield_per(batch_size):
+        loaded[entity_type].append((entity_id, signature, sizes.get((entity_type, entity_id), 0)))
+    for entity_type, items in loaded.items():
+        _lsh_for(entity_type).load(items)
+
+def backfill_signatures(db: Session, batch_size: int = 1000):
+    """Compute and store the signatures of rows that have none"""
+    stored = {JOB: set(), APPLICANT: set()}
+    for entity_type, entity_id in db.query(SkillSignature.entity_type, SkillSignature.entity_id).yield_per(batch_size):
+        stored[entity_type].add(entity_id)
+
+    for entity_type, model in ((JOB, JobPosition), (APPLICANT, Applicant)):
+        missing = [
+            (entity_id, skills)
+            for entity_id, skills in db.query(model.id, model.skills).filter(model.skills.isnot(None))
+            if entity_id not in stored[entity_type]
+        ]
+        for start in range(0, len(missing), batch_size):
+            store_signatures(db, entity_type, missing[start:start + batch_size])
+    db.commit()
+
+def build_lsh(db: Session, batch_size: int = 1000):
+    """Compute and store any missing signatures, then load the LSH buckets"""
+    backfill_signatures(db, batch_size)
+    load_lsh(db, batch_size)
@@ -0,0 +1,121 @@
+from typing import List, Dict, Optional, Sequence
+from sqlalchemy.orm import Session
+from jobs.models import JobPosition
+from applicants.models import Applicant
+from matching.vocabulary import skill_vocabulary
+from matching.utils import APPLICANT_FETCH_BATCH_SIZE
+from matching.pagination import select_top_k
+
+# Try to import numpy/scipy, batch matching is disabled if not available
+try:
+    import numpy as np
+    from scipy import sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    print("Warning: numpy/scipy not available, batch matching disabled")
+
+# Number of applicants encoded and multiplied at once, bounds peak memory
+APPLICANT_CHUNK_SIZE = 50000
+
+def encode_skill_matrix(skill_lists: Sequence[Optional[List[str]]], width: int):
+    """Encode skill lists as a sparse binary (rows x width) CSR matrix over the shared skill vocabulary.
+
+    Skills the vocabulary has not interned, or whose id falls outside the width,
+    cannot match any column and are dropped.
+    """
+    indptr = [0]
+    indices = []
+    for skills in skill_lists:
+        columns = {skill_id for skill_id in (skill_vocabulary.lookup(skill) for skill in skills or []) if skill_id is not None and skill_id < width}
+        indices.extend(sorted(columns))
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.int32)
+    return sparse.csr_matrix(
+        (data, np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+        shape=(len(skill_lists), width)
+    )
+
+def compute_overlap_matrix(job_matrix, applicant_matrix):
+    """Shared-skill counts for every (job, applicant) pair in one sparse product"""
+    overlaps = (job_matrix @ applicant_matrix.T).tocsr()
+    overlaps.sort_indices()
+    return overlaps
+
+def get_top_candidates_for_jobs(db: Session, jobs: List[JobPosition], top_k: int = 10, min_match_percentage: float = 0.0) -> Dict[int, List[Dict]]:
+    """Score every applicant against every given job and keep the top-K per job"""
+    if not SCIPY_AVAILABLE:
+        raise RuntimeError("Batch matching requires numpy and scipy")
+
+    jobs = [job for job in jobs if job.skills]
+    results: Dict[int, List[tuple]] = {job.id: [] for job in jobs}
+    if not jobs or top_k <= 0:
+        return {job_id: [] for job_id in results}
+
+    job_skill_lists = [job.skills for job in jobs]
+    for skills in job_skill_lists:
+        skill_vocabulary.to_bitset(skills)
+    width = len(skill_vocabulary)
+    job_matrix = encode_skill_matrix(job_skill_lists, width)
+    # Percentages are relative to the job's distinct canonical skills, as in calculate_skill_match_percentage
+    job_lengths = np.asarray(job_matrix.getnnz(axis=1), dtype=np.float64)
+
+    applicant_rows = db.query(Applicant.id, Applicant.skills).filter(Applicant.skills.isnot(None)).order_by(Applicant.id).yield_per(APPLICANT_CHUNK_SIZE)
+    chunk_ids: List[int] = []
+    chunk_skills: List[List[str]] = []
+
+    def score_chunk():
+        applicant_ids = np.asarray(chunk_ids, dtype=np.int64)
+        overlaps = compute_overlap_matrix(job_matrix, encode_skill_matrix(chunk_skills, width))
+        for row, job in enumerate(jobs):
+            start, end = overlaps.indptr[row], overlaps.indptr[row + 1]
+            if start == end:
+                continue
+            percentages = np.round(overlaps.data[start:end] / job_lengths[row] * 100, 2)
+            ids = applicant_ids[overlaps.indices[start:end]]
+            keep = percentages >= min_match_percentage
+            percentages, ids = percentages[keep], ids[keep]
+            if len(percentages) > top_k:
+                # Only the top-K of each chunk survive; ids are ascending, so a stable sort breaks ties by id
+                top = np.argsort(-percentages, kind="stable")[:top_k]
+                percentages, ids = percentages[top], ids[top]
+            results[job.id].extend(zip(percentages.tolist(), ids.tolist()))
+
+    for applicant_id, skills in applicant_rows:
+        if not skills:
+            continue
+        chunk_ids.append(applicant_id)
+        chunk_skills.append(skills)
+        if len(chunk_ids) >= APPLICANT_CHUNK_SIZE:
+            score_chunk()
+            chunk_ids, chunk_skills = [], []
+    if chunk_ids:
+        score_chunk()
+
+    ranked_by_job = {job_id: select_top_k(matches, top_k) for job_id, matches in results.items()}
+
+    # Hydrate only the applicants that made it into some job's top-K
+    winner_ids = list({applicant_id for ranked in ranked_by_job.values() for _, applicant_id in ranked})
+    applicants = {}
+    for start in range(0, len(winner_ids), APPLICANT_FETCH_BATCH_SIZE):
+        batch_ids = winner_ids[start:start + APPLICANT_FETCH_BATCH_SIZE]
+        rows = db.query(Applicant.id, Applicant.name, Applicant.email, Applicant.skills).filter(Applicant.id.in_(batch_ids))
+        for row in rows:
+            applicants[row.id] = row
+
+    top_candidates: Dict[int, List[Dict]] = {}
+    for job in jobs:
+        job_bits = skill_vocabulary.to_bitset(job.skills)
+        top_candidates[job.id] = []
+        for percentage, applicant_id in ranked_by_job[job.id]:
+            applicant = applicants.get(applicant_id)
+            if applicant is None:
+                continue
+            top_candidates[job.id].append({
+                "applicant_id": applicant_id,
+                "name": applicant.name,
+                "email": applicant.email,
+                "match_percentage": percentage,
+                "matched_skills": skill_vocabulary.names(job_bits & skill_vocabulary.to_bitset(applicant.skills))
+            })
+    return top_candidates
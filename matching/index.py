@@ -0,0 +1,145 @@
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy.orm import Session
+from jobs.models import JobPosition
+from applicants.models import Applicant
+from matching.vocabulary import skill_vocabulary, popcount
+
+class SkillIndex:
+    """Process-wide inverted index: skill id -> posting list of applicant ids.
+
+    Applicant and job skill sets are cached as integer bitsets over the shared
+    skill vocabulary, so the overlap of two sets is popcount(a & b). Posting
+    list lengths double as per-skill document frequencies for IDF scoring and
+    are maintained by the same add/remove calls.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings: Dict[int, Set[int]] = {}
+        self._applicant_bits: Dict[int, int] = {}
+        self._job_bits: Dict[int, int] = {}
+        self._built = False
+        self.version = 0
+
+    def build(self, db: Session, batch_size: int = 1000, id_range: Optional[Tuple[int, int]] = None):
+        """(Re)build the index from every applicant and job that has skills.
+
+        id_range=(lo, hi) restricts the applicants to lo <= id < hi, for shard-local indexes.
+        """
+        postings: Dict[int, Set[int]] = {}
+        applicant_bits: Dict[int, int] = {}
+        job_bits: Dict[int, int] = {}
+
+        query = db.query(Applicant.id, Applicant.skills).filter(Applicant.skills.isnot(None))
+        if id_range is not None:
+            query = query.filter(Applicant.id >= id_range[0], Applicant.id < id_range[1])
+        for applicant_id, skills in query.yield_per(batch_size):
+            bits = skill_vocabulary.to_bitset(skills)
+            if not bits:
+                continue
+            applicant_bits[applicant_id] = bits
+            for skill_id in skill_vocabulary.ids(bits):
+                postings.setdefault(skill_id, set()).add(applicant_id)
+
+        if id_range is None:
+            for job_id, skills in db.query(JobPosition.id, JobPosition.skills).filter(JobPosition.skills.isnot(None)):
+                bits = skill_vocabulary.to_bitset(skills)
+                if bits:
+                    job_bits[job_id] = bits
+
+        with self._lock:
+            self._postings = postings
+            self._applicant_bits = applicant_bits
+            self._job_bits = job_bits
+            self._built = True
+            self.version += 1
+
+    def ensure_built(self, db: Session):
+        if not self._built:
+            self.build(db)
+
+    def add_applicant(self, applicant_id: int, skills: Optional[Iterable[str]]):
+        """Insert or replace an applicant's skills in the index"""
+        bits = skill_vocabulary.to_bitset(skills)
+        with self._lock:
+            self.version += 1
+            self._remove_locked(applicant_id)
+            if bits:
+                self._applicant_bits[applicant_id] = bits
+                for skill_id in skill_vocabulary.ids(bits):
+                    self._postings.setdefault(skill_id, set()).add(applicant_id)
+
+    def remove_applicant(self, applicant_id: int):
+        with self._lock:
+            self.version += 1
+            self._remove_locked(applicant_id)
+
+    def _remove_locked(self, applicant_id: int):
+        previous = self._applicant_bits.pop(applicant_id, 0)
+        for skill_id in skill_vocabulary.ids(previous):
+            posting = self._postings.get(skill_id)
+            if posting is not None:
+                posting.discard(applicant_id)
+                if not posting:
+                    del self._postings[skill_id]
+
+    def set_job(self, job_id: int, skills: Optional[Iterable[str]]):
+        bits = skill_vocabulary.to_bitset(skills)
+        with self._lock:
+            if bits:
+                self._job_bits[job_id] = bits
+            else:
+                self._job_bits.pop(job_id, None)
+
+    def remove_job(self, job_id: int):
+        with self._lock:
+            self._job_bits.pop(job_id, None)
+
+    def skill_count(self, applicant_id: int) -> int:
+        return popcount(self._applicant_bits.get(applicant_id, 0))
+
+    def applicant_bits(self, applicant_id: int) -> int:
+        return self._applicant_bits.get(applicant_id, 0)
+
+    def job_bits(self) -> Dict[int, int]:
+        """Snapshot of job id -> skill bitset"""
+        with self._lock:
+            return dict(self._job_bits)
+
+    @property
+    def applicant_count(self) -> int:
+        return len(self._applicant_bits)
+
+    def document_frequency(self, skill_id: int) -> int:
+        """Number of applicants listing the skill (the length of its posting list)"""
+        return len(self._postings.get(skill_id, ()))
+
+    def idf(self, skill_id: int) -> float:
+        """Smoothed inverse document frequency, always > 0"""
+        return math.log((1 + self.applicant_count) / (1 + self.document_frequency(skill_id))) + 1.0
+
+    def weighted_overlaps(self, job_bits: int, weights: Optional[Dict[int, float]] = None) -> Dict[int, float]:
+        """Sum of the weights (IDF unless given) of the shared skills per applicant"""
+        scores: Dict[int, float] = {}
+        with self._lock:
+            for skill_id in skill_vocabulary.ids(job_bits):
+                weight = weights[skill_id] if weights is not None else self.idf(skill_id)
+                for applicant_id in self._postings.get(skill_id, ()):
+                    scores[applicant_id] = scores.get(applicant_id, 0.0) + weight
+        return scores
+
+    def count_overlaps(self, job_skills: Iterable[str]) -> Dict[int, int]:
+        """Count shared skills per applicant, touching only the job skills' posting lists"""
+        overlaps: Dict[int, int] = {}
+        with self._lock:
+            for skill_id in skill_vocabulary.ids(skill_vocabulary.to_bitset(job_skills)):
+                for applicant_id in self._postings.get(skill_id, ()):
+                    overlaps[applicant_id] = overlaps.get(applicant_id, 0) + 1
+        return overlaps
+
+    def matched_skills(self, applicant_id: int, job_skills: Iterable[str]) -> List[str]:
+        return skill_vocabulary.names(skill_vocabulary.to_bitset(job_skills) & self.applicant_bits(applicant_id))
+
+skill_index = SkillIndex()
@@ -0,0 +1,170 @@
+import hashlib
+import math
+import random
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from matching.vocabulary import skill_vocabulary
+
+# Ranking uses containment (the share of a job's skills an applicant covers), which
+# MinHash does not estimate: a 5-skill job fully covered by a 15-skill resume has a
+# Jaccard similarity of only 1/3. As in LSH Ensemble, items are therefore partitioned
+# by skill count (powers of two). Within a partition, a containment threshold bounds
+# the Jaccard similarity of every qualifying pair from below, and a query probes that
+# partition with the widest bands (4, 2 or 1 rows over 64 permutations) whose
+# collision probability at the bound still meets the requested recall. Partitions no
+# banding can serve are scanned in full. Only one-row buckets are stored; a wider band
+# is the intersection of its rows' buckets.
+NUM_PERMUTATIONS = 64
+ROW_OPTIONS = (4, 2, 1)
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_rng = random.Random(1729)
+_PERMUTATIONS = [(_rng.randint(1, _MERSENNE_PRIME - 1), _rng.randint(0, _MERSENNE_PRIME - 1)) for _ in range(NUM_PERMUTATIONS)]
+
+def _skill_hash(skill: str) -> int:
+    # Stable across processes and restarts, unlike hash()
+    return int.from_bytes(hashlib.blake2b(skill.encode("utf-8"), digest_size=4).digest(), "big")
+
+def compute_signature(skills: Optional[Iterable[str]]) -> Optional[List[int]]:
+    """MinHash signature of the canonical skill set, or None for an empty set"""
+    hashes = {_skill_hash(skill_vocabulary.canonicalize(skill)) for skill in skills or []}
+    if not hashes:
+        return None
+    return [
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+def skill_count(skills: Optional[Iterable[str]]) -> int:
+    """Number of distinct canonical skills, the set size the signature was computed over"""
+    return len({skill_vocabulary.canonicalize(skill) for skill in skills or []})
+
+def _partition(size: int) -> int:
+    return size.bit_length() - 1
+
+def _partition_bounds(partition: int) -> Tuple[int, int]:
+    return 1 << partition, (1 << (partition + 1)) - 1
+
+def jaccard_floor(query_size: int, lo: int, hi: int, threshold: float, query_is_job: bool) -> Optional[float]:
+    """Lowest Jaccard similarity of a query with any item of size lo..hi at containment >= threshold.
+
+    Containment is measured against the job side, so the query is the job when
+    ranking applicants and the item is the job when ranking jobs. None means no
+    item of those sizes can reach the threshold.
+    """
+    floor = None
+    for size in range(lo, hi + 1):
+        job_size, other_size = (query_size, size) if query_is_job else (size, query_size)
+        shared = max(1, math.ceil(threshold * job_size - 1e-9))
+        if shared > other_size:
+            continue
+        similarity = shared / (query_size + size - shared)
+        floor = similarity if floor is None else min(floor, similarity)
+    return floor
+
+def choose_banding(similarity: float, recall: float) -> Optional[Tuple[int, int]]:
+    """(rows, bands) of the widest banding that finds pairs at this similarity with the given recall"""
+    if recall >= 1.0:
+        return None
+    for rows in ROW_OPTIONS:
+        hit = similarity ** rows
+        if hit >= 1.0:
+            return rows, 1
+        if hit <= 0.0:
+            continue
+        bands = max(1, math.ceil(math.log(1.0 - recall) / math.log(1.0 - hit)))
+        if bands <= NUM_PERMUTATIONS // rows:
+            return rows, bands
+    return None
+
+class LSHIndex:
+    """MinHash buckets partitioned by skill count, for containment queries"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # partition -> permutation -> min-hash value -> ids
+        self._buckets: Dict[int, List[Dict[int, Set[int]]]] = {}
+        self._items: Dict[int, Tuple[List[int], int]] = {}
+        self._partition_items: Dict[int, Set[int]] = {}
+
+    def clear(self):
+        with self._lock:
+            self._buckets = {}
+            self._items = {}
+            self._partition_items = {}
+
+    def load(self, items: Iterable[tuple]):
+        """Replace the contents with (item id, signature, skill count) triples, swapping them in at once"""
+        loaded = LSHIndex()
+        for item_id, signature, size in items:
+            loaded.add(item_id, signature, size)
+        with self._lock:
+            self._buckets = loaded._buckets
+            self._items = loaded._items
+            self._partition_items = loaded._partition_items
+
+    def add(self, item_id: int, signature: Optional[List[int]], size: int):
+        with self._lock:
+            self.remove(item_id)
+            if not signature or size <= 0:
+                return
+            partition = _partition(size)
+            self._items[item_id] = (signature, partition)
+            self._partition_items.setdefault(partition, set()).add(item_id)
+            buckets = self._buckets.setdefault(partition, [{} for _ in range(NUM_PERMUTATIONS)])
+            for row, value in enumerate(signature):
+                buckets[row].setdefault(value, set()).add(item_id)
+
+    def remove(self, item_id: int):
+        with self._lock:
+            entry = self._items.pop(item_id, None)
+            if entry is None:
+                return
+            signature, partition = entry
+            self._partition_items[partition].discard(item_id)
+            buckets = self._buckets[partition]
+            for row, value in enumerate(signature):
+                bucket = buckets[row].get(value)
+                if bucket is not None:
+                    bucket.discard(item_id)
+                    if not bucket:
+                        del buckets[row][value]
+
+    def query(self, signature: Optional[List[int]], size: int, threshold: float,
+              recall: float = 1.0, query_is_job: bool = True) -> Set[int]:
+        """Ids likely to reach the containment threshold with the query.
+
+        Each qualifying item is found with probability >= recall (exactly, when
+        recall is 1 or its partition is scanned); items below the threshold may
+        or may not be returned.
+        """
+        if not signature or size <= 0:
+            return set()
+        candidates: Set[int] = set()
+        with self._lock:
+            for partition, buckets in self._buckets.items():
+                lo, hi = _partition_bounds(partition)
+                floor = jaccard_floor(size, lo, hi, threshold, query_is_job)
+                if floor is None:
+                    continue
+                banding = choose_banding(floor, recall)
+                if banding is None:
+                    candidates |= self._partition_items[partition]
+                    continue
+                rows, bands = banding
+                for band in range(bands):
+                    hits = None
+                    for row in range(band * rows, (band + 1) * rows):
+                        bucket = buckets[row].get(signature[row], set())
+                        hits = set(bucket) if hits is None else hits & bucket
+                        if not hits:
+                            break
+                    candidates |= hits
+        return candidates
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+applicant_lsh = LSHIndex()
+job_lsh = LSHIndex()
@@ -0,0 +1,70 @@
+from sqlalchemy import Column, Integer, Float, String, JSON, ForeignKey, DateTime, Index
+from sqlalchemy.sql import func
+from database import Base
+
+class MatchScore(Base):
+    __tablename__ = "match_scores"
+
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    applicant_id = Column(Integer, ForeignKey("applicants.id", ondelete="CASCADE"), primary_key=True)
+    match_percentage = Column(Float, nullable=False)
+    matched_skills = Column(JSON, default=list)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_match_scores_job_percentage", "job_id", "match_percentage"),
+        Index("ix_match_scores_applicant_percentage", "applicant_id", "match_percentage"),
+    )
+
+class SkillSignature(Base):
+    """MinHash signature of a job's or applicant's skills, for approximate retrieval"""
+    __tablename__ = "skill_signatures"
+
+    entity_type = Column(String(16), primary_key=True)  # "job" or "applicant"
+    entity_id = Column(Integer, primary_key=True)
+    signature = Column(JSON, nullable=False)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+class SkillPosting(Base):
+    """One canonical skill of a job or applicant: the database side of the skill index.
+
+    Stored match scores are computed from these rows rather than from the
+    in-memory index, which is only current in the process that made a write.
+    """
+    __tablename__ = "skill_postings"
+
+    entity_type = Column(String(16), primary_key=True)  # "job" or "applicant"
+    skill = Column(String(255), primary_key=True)
+    entity_id = Column(Integer, primary_key=True)
+
+    __table_args__ = (
+        Index("ix_skill_postings_entity", "entity_type", "entity_id"),
+    )
+
+class MatchVersion(Base):
+    """Named counter bumped inside every write that changes matching data.
+
+    Readers in any process compare these against the versions their caches
+    were built at, so a write in one worker invalidates results in all of them.
+    """
+    __tablename__ = "match_versions"
+
+    name = Column(String(64), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+class MatchChange(Base):
+    """Ids written under one version of the applicants or jobs counter.
+
+    Workers whose in-memory state is a few versions behind read the ids
+    changed since and reload just those rows instead of rebuilding.
+    """
+    __tablename__ = "match_changes"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(64), nullable=False)  # versions.APPLICANTS or versions.JOBS
+    version = Column(Integer, nullable=False)
+    entity_id = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("ix_match_changes_name_version", "name", "version"),
+    )
@@ -0,0 +1,34 @@
+import base64
+import heapq
+import json
+from typing import Iterable, List, Optional, Tuple
+
+# A cursor marks the last (match_percentage, id) pair a client has seen.
+# Results are ordered by percentage descending, then id ascending, so the
+# pair is a stable position even while new scores are being written.
+
+def encode_cursor(match_percentage: float, item_id: int) -> str:
+    raw = json.dumps([match_percentage, item_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[float, int]:
+    """Decode a cursor, raising ValueError if it is malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        match_percentage, item_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return float(match_percentage), int(item_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def is_after_cursor(match_percentage: float, item_id: int, cursor: Optional[Tuple[float, int]]) -> bool:
+    if cursor is None:
+        return True
+    cursor_percentage, cursor_id = cursor
+    return match_percentage < cursor_percentage or (match_percentage == cursor_percentage and item_id > cursor_id)
+
+def select_top_k(scored: Iterable[tuple], limit: Optional[int], cursor: Optional[Tuple[float, int]] = None) -> List[tuple]:
+    """Pick the best (percentage, id, ...) tuples after the cursor with a bounded heap"""
+    remaining = (item for item in scored if is_after_cursor(item[0], item[1], cursor))
+    if limit is None:
+        return sorted(remaining, key=lambda item: (-item[0], item[1]))
+    return heapq.nsmallest(limit, remaining, key=lambda item: (-item[0], item[1]))
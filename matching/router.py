@@ -1,23 +1,84 @@
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import List, Any
+from typing import List, Any, Optional
 
-from database import get_db
-from auth.router import get_current_user, require_role
+from auth.router import get_current_user, get_read_db_for_user, require_role
 from auth.models import User
-from matching.utils import get_matched_applicants_for_job, get_matched_jobs_for_applicant
+from matching.utils import (
+    get_matched_applicants_for_job, get_matched_jobs_for_applicant,
+    count_matched_applicants_for_job, count_matched_jobs_for_applicant,
+    idf_scores_for_applicant, rank_applicants_for_job, rank_jobs,
+    approx_rank_applicants_for_job, approx_scores_for_applicant
+)
+from matching.pagination import encode_cursor, decode_cursor
+from matching.cache import match_cache
+from matching import versions as match_versions
+from matching import sync as matching_sync
+from matching.batch import get_top_candidates_for_jobs, SCIPY_AVAILABLE
 from jobs.crud import get_job
+from jobs.models import JobPosition
 from applicants.crud import get_applicant
 
 router = APIRouter()
 
+def _parse_cursor(cursor: Optional[str]):
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def _count_or_len(count, result: list, limit: Optional[int], after) -> int:
+    """Full result size: the page length when unpaginated, otherwise an indexed COUNT"""
+    if limit is None and after is None:
+        return len(result)
+    return count()
+
+@router.get("/cache/stats")
+def get_match_cache_stats(current_user: User = Depends(require_role("company"))):
+    """Hit/miss counters of the match result cache"""
+    return match_cache.stats()
+
+@router.get("/jobs/top-candidates")
+def get_top_candidates_for_all_jobs(
+    top_k: int = Query(10, ge=1, le=500),
+    min_match_percentage: float = 0.0,
+    current_user: User = Depends(require_role("company")),
+    db: Session = Depends(get_read_db_for_user)
+):
+    """Score all of the company's jobs against all applicants and return the top-K candidates per job"""
+    if not SCIPY_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Batch matching is not available on this server")
+    
+    jobs = db.query(JobPosition).filter(JobPosition.company_id == current_user.id).all()
+    top_candidates = get_top_candidates_for_jobs(db, jobs, top_k=top_k, min_match_percentage=min_match_percentage)
+    
+    return {
+        "total_jobs": len(jobs),
+        "top_k": top_k,
+        "jobs": [
+            {
+                "job_id": job.id,
+                "job_title": job.title,
+                "candidates": top_candidates.get(job.id, [])
+            }
+            for job in jobs
+        ]
+    }
+
 @router.get("/jobs/{job_id}/candidates")
 def get_candidates_for_job(
     job_id: int,
     min_match_percentage: float = 0.0,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = None,
+    scoring: str = Query("overlap", pattern="^(overlap|idf)$"),
+    mode: str = Query("exact", pattern="^(exact|approx)$"),
+    recall: float = Query(1.0, gt=0.0, le=1.0),
     current_user: User = Depends(require_role("company")),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db_for_user)
 ):
     """Get matched applicants for a specific job"""
     job = get_job(db, job_id=job_id)
@@ -27,7 +88,21 @@ def get_candidates_for_job(
     if job.company_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to view candidates for this job")
     
-    matched_applicants = get_matched_applicants_for_job(db, job_id, min_match_percentage)
+    after = _parse_cursor(cursor)
+    current = match_versions.read(db, [match_versions.job_key(job_id), match_versions.APPLICANTS])
+    cache_key = match_cache.candidates_key(job_id, current[match_versions.job_key(job_id)], current[match_versions.APPLICANTS],
+                                           scoring, mode, recall, min_match_percentage, limit, after)
+    cached = match_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    if mode == "approx":
+        matched_applicants, total = approx_rank_applicants_for_job(db, job, scoring, recall, min_match_percentage, limit=limit, cursor=after)
+    elif scoring == "idf":
+        matched_applicants, total = rank_applicants_for_job(db, job, "idf", min_match_percentage, limit=limit, cursor=after)
+    else:
+        matched_applicants = get_matched_applicants_for_job(db, job_id, min_match_percentage, limit=limit, cursor=after)
+        total = None
     
     # Format response
     result = []
@@ -40,19 +115,33 @@ def get_candidates_for_job(
             "matched_skills": match["matched_skills"]
         })
     
-    return {
+    next_cursor = None
+    if limit is not None and len(result) == limit:
+        next_cursor = encode_cursor(result[-1]["match_percentage"], result[-1]["applicant_id"])
+    
+    response = {
         "job_id": job_id,
         "job_title": job.title,
-        "total_candidates": len(result),
-        "candidates": result
+        "total_candidates": total if total is not None else _count_or_len(lambda: count_matched_applicants_for_job(db, job_id, min_match_percentage), result, limit, after),
+        "candidates": result,
+        "next_cursor": next_cursor
     }
+    # idf and approx results come from the in-memory index, which may still be waiting for a rebuild
+    if (mode == "exact" and scoring == "overlap") or matching_sync.memory_reflects(current):
+        match_cache.set(cache_key, response)
+    return response
 
 @router.get("/applicants/{applicant_id}/matches")
 def get_matches_for_applicant(
     applicant_id: int,
     min_match_percentage: float = 0.0,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = None,
+    scoring: str = Query("overlap", pattern="^(overlap|idf)$"),
+    mode: str = Query("exact", pattern="^(exact|approx)$"),
+    recall: float = Query(1.0, gt=0.0, le=1.0),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db_for_user)
 ):
     """Get matching jobs for a specific applicant"""
     applicant = get_applicant(db, applicant_id=applicant_id)
@@ -60,10 +149,17 @@ def get_matches_for_applicant(
         raise HTTPException(status_code=404, detail="Applicant not found")
     
     # Applicants can only view their own matches
-    if current_user.role.value == "applicant" and applicant.user_id != current_user.id:
+    if current_user.role.value == "applicant" and applicant.id != current_user.applicant_id:
         raise HTTPException(status_code=403, detail="Not authorized to view matches for this applicant")
     
-    matched_jobs = get_matched_jobs_for_applicant(db, applicant_id, min_match_percentage)
+    after = _parse_cursor(cursor)
+    if mode == "approx":
+        matched_jobs, total = rank_jobs(db, applicant, approx_scores_for_applicant(db, applicant, scoring, recall, min_match_percentage), min_match_percentage, limit=limit, cursor=after)
+    elif scoring == "idf":
+        matched_jobs, total = rank_jobs(db, applicant, idf_scores_for_applicant(db, applicant), min_match_percentage, limit=limit, cursor=after)
+    else:
+        matched_jobs = get_matched_jobs_for_applicant(db, applicant_id, min_match_percentage, limit=limit, cursor=after)
+        total = None
     
     # Format response
     result = []
@@ -77,9 +173,14 @@ def get_matches_for_applicant(
             "matched_skills": match["matched_skills"]
         })
     
+    next_cursor = None
+    if limit is not None and len(result) == limit:
+        next_cursor = encode_cursor(result[-1]["match_percentage"], result[-1]["job_id"])
+    
     return {
         "applicant_id": applicant_id,
         "applicant_name": applicant.name,
-        "total_matches": len(result),
-        "job_matches": result
+        "total_matches": total if total is not None else _count_or_len(lambda: count_matched_jobs_for_applicant(db, applicant_id, min_match_percentage), result, limit, after),
+        "job_matches": result,
+        "next_cursor": next_cursor
     }
@@ -0,0 +1,162 @@
+from typing import Dict, Iterable, List, Optional, Set
+from sqlalchemy import delete, func
+from sqlalchemy.orm import Session, aliased
+from jobs.models import JobPosition
+from applicants.models import Applicant
+from matching.models import MatchScore, SkillPosting
+from matching.vocabulary import skill_vocabulary
+from matching.approx import JOB, APPLICANT
+from matching import versions
+
+# Stored scores are derived from skill_postings inside the writing transaction, so
+# they are correct whichever process made the write; the in-memory skill index
+# is not consulted here.
+
+# Rows per executemany() when (re)writing postings and scores
+INSERT_BATCH_SIZE = 1000
+# Maximum number of values bound into a single IN (...) clause
+IN_CLAUSE_BATCH_SIZE = 500
+
+def canonical_skills(skills: Optional[Iterable[str]]) -> List[str]:
+    """Distinct canonical names of a skill list, in vocabulary order"""
+    return skill_vocabulary.names(skill_vocabulary.to_bitset(skills))
+
+def _insert_rows(db: Session, model, rows: list):
+    # Core executemany, the ORM bulk insert path costs several times more per row
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        db.execute(model.__table__.insert(), rows[start:start + INSERT_BATCH_SIZE])
+
+def store_postings(db: Session, entity_type: str, entity_id: int, skills: Optional[Iterable[str]]):
+    """Replace the stored canonical skills of one job or applicant (caller commits)"""
+    delete_postings(db, entity_type, entity_id)
+    _insert_rows(db, SkillPosting, [
+        {"entity_type": entity_type, "entity_id": entity_id, "skill": skill}
+        for skill in canonical_skills(skills)
+    ])
+
+def delete_postings(db: Session, entity_type: str, entity_id: int):
+    db.execute(delete(SkillPosting).where(SkillPosting.entity_type == entity_type, SkillPosting.entity_id == entity_id))
+
+def _entities_with_skills(db: Session, entity_type: str, skills: List[str]) -> Dict[int, Set[str]]:
+    """entity id -> which of the given canonical skills it lists"""
+    matched: Dict[int, Set[str]] = {}
+    for start in range(0, len(skills), IN_CLAUSE_BATCH_SIZE):
+        for entity_id, skill in db.query(SkillPosting.entity_id, SkillPosting.skill).filter(
+            SkillPosting.entity_type == entity_type,
+            SkillPosting.skill.in_(skills[start:start + IN_CLAUSE_BATCH_SIZE])
+        ):
+            matched.setdefault(entity_id, set()).add(skill)
+    return matched
+
+def _skill_counts(db: Session, entity_type: str, entity_ids: List[int]) -> Dict[int, int]:
+    counts: Dict[int, int] = {}
+    for start in range(0, len(entity_ids), IN_CLAUSE_BATCH_SIZE):
+        counts.update(db.query(SkillPosting.entity_id, func.count()).filter(
+            SkillPosting.entity_type == entity_type,
+            SkillPosting.entity_id.in_(entity_ids[start:start + IN_CLAUSE_BATCH_SIZE])
+        ).group_by(SkillPosting.entity_id))
+    return counts
+
+def refresh_job_scores(db: Session, job: JobPosition):
+    """Recompute the stored scores of one job against all applicants"""
+    db.execute(delete(MatchScore).where(MatchScore.job_id == job.id))
+    job_skills = canonical_skills(job.skills)
+    if not job_skills:
+        return
+    _insert_rows(db, MatchScore, [
+        {
+            "job_id": job.id,
+            "applicant_id": applicant_id,
+            "match_percentage": round((len(matched) / len(job_skills)) * 100, 2),
+            "matched_skills": [skill for skill in job_skills if skill in matched]
+        }
+        for applicant_id, matched in _entities_with_skills(db, APPLICANT, job_skills).items()
+    ])
+
+def refresh_applicant_scores(db: Session, applicant: Applicant):
+    """Recompute the stored scores of one applicant against all jobs (the jobs' postings must be current)"""
+    db.execute(delete(MatchScore).where(MatchScore.applicant_id == applicant.id))
+    applicant_skills = canonical_skills(applicant.skills)
+    if not applicant_skills:
+        return
+    matched_by_job = _entities_with_skills(db, JOB, applicant_skills)
+    job_skill_counts = _skill_counts(db, JOB, list(matched_by_job))
+    _insert_rows(db, MatchScore, [
+        {
+            "job_id": job_id,
+            "applicant_id": applicant.id,
+            "match_percentage": round((len(matched) / job_skill_counts[job_id]) * 100, 2),
+            "matched_skills": [skill for skill in applicant_skills if skill in matched]
+        }
+        for job_id, matched in matched_by_job.items()
+    ])
+
+def _source_skills(db: Session, model, batch_size: int = 1000) -> Dict[int, Set[str]]:
+    skills_by_id = {}
+    for entity_id, skills in db.query(model.id, model.skills).filter(model.skills.isnot(None)).yield_per(batch_size):
+        canonical = set(canonical_skills(skills))
+        if canonical:
+            skills_by_id[entity_id] = canonical
+    return skills_by_id
+
+def rebuild_match_scores(db: Session):
+    """Recompute skill_postings and the whole match_scores table from the stored skills"""
+    db.execute(delete(MatchScore))
+    db.execute(delete(SkillPosting))
+    sources = {JOB: _source_skills(db, JobPosition), APPLICANT: _source_skills(db, Applicant)}
+    for entity_type, skills_by_id in sources.items():
+        _insert_rows(db, SkillPosting, [
+            {"entity_type": entity_type, "entity_id": entity_id, "skill": skill}
+            for entity_id, skills in skills_by_id.items()
+            for skill in skills
+        ])
+
+    # Same scores as refresh_job_scores, from the skills already in memory
+    applicants_by_skill: Dict[str, List[int]] = {}
+    for applicant_id, skills in sources[APPLICANT].items():
+        for skill in skills:
+            applicants_by_skill.setdefault(skill, []).append(applicant_id)
+    for job_id, skills in sources[JOB].items():
+        job_skills = canonical_skills(skills)
+        matched_by_applicant: Dict[int, Set[str]] = {}
+        for skill in job_skills:
+            for applicant_id in applicants_by_skill.get(skill, ()):
+                matched_by_applicant.setdefault(applicant_id, set()).add(skill)
+        _insert_rows(db, MatchScore, [
+            {
+                "job_id": job_id,
+                "applicant_id": applicant_id,
+                "match_percentage": round((len(matched) / len(job_skills)) * 100, 2),
+                "matched_skills": [skill for skill in job_skills if skill in matched]
+            }
+            for applicant_id, matched in matched_by_applicant.items()
+        ])
+    # Running API workers drop cached results and reload their in-memory index
+    versions.bump(db, versions.APPLICANTS)
+    versions.bump(db, versions.JOBS)
+    db.commit()
+
+def match_scores_consistent(db: Session) -> bool:
+    """Whether skill_postings mirrors the stored skills and match_scores holds exactly one row per
+    (job, applicant) pair sharing a skill"""
+    for entity_type, model in ((JOB, JobPosition), (APPLICANT, Applicant)):
+        posted: Dict[int, Set[str]] = {}
+        for entity_id, skill in db.query(SkillPosting.entity_id, SkillPosting.skill).filter(SkillPosting.entity_type == entity_type).yield_per(1000):
+            posted.setdefault(entity_id, set()).add(skill)
+        if posted != _source_skills(db, model):
+            return False
+
+    job_posting, applicant_posting = aliased(SkillPosting), aliased(SkillPosting)
+    pairs = db.query(job_posting.entity_id, applicant_posting.entity_id).join(
+        applicant_posting,
+        (applicant_posting.skill == job_posting.skill) & (applicant_posting.entity_type == APPLICANT)
+    ).filter(job_posting.entity_type == JOB).distinct().subquery()
+    expected_rows = db.query(func.count()).select_from(pairs).scalar()
+    stored_rows = db.query(func.count()).select_from(MatchScore).scalar()
+    return expected_rows == stored_rows
+
+def ensure_match_scores(db: Session):
+    """Rebuild match_scores when it is empty or out of step with the stored skills"""
+    if not match_scores_consistent(db):
+        print("Rebuilding stored match scores...")
+        rebuild_match_scores(db)
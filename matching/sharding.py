@@ -0,0 +1,121 @@
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from core.config import settings
+from applicants.models import Applicant
+from matching.index import SkillIndex
+from matching.vocabulary import skill_vocabulary, popcount
+from matching.pagination import select_top_k
+from matching import versions
+
+# Applicants are split into fixed-width id ranges ([n * width, (n + 1) * width)), so shard
+# boundaries stay put as the table grows and each worker's cached shard data stays valid.
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+# Worker-side state: shard id range -> (shard version, loaded at, shard-local index).
+# Shard versions are the per-range match_versions counters, so a write reloads only
+# the shard holding the changed applicant.
+_worker_shards: Dict[Tuple[int, int], Tuple[int, float, SkillIndex]] = {}
+
+def sharding_enabled() -> bool:
+    return settings.MATCHING_POOL_SIZE > 0
+
+def _init_worker():
+    # Register every mapped class so the worker can query Applicant on its own connection
+    import auth.models, jobs.models, applicants.models, interviews.models, offers.models, applications.models  # noqa: F401
+    from database import engine
+    engine.dispose(close=False)
+
+def get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.MATCHING_POOL_SIZE,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            )
+        return _pool
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(cancel_futures=True)
+            _pool = None
+
+def shard_ranges(db: Session) -> List[Tuple[int, int]]:
+    min_id, max_id = db.query(func.min(Applicant.id), func.max(Applicant.id)).one()
+    if min_id is None:
+        return []
+    width = settings.MATCHING_SHARD_SIZE
+    return [(n * width, (n + 1) * width) for n in range(min_id // width, max_id // width + 1)]
+
+def _load_shard(id_range: Tuple[int, int], version: int) -> SkillIndex:
+    cached = _worker_shards.get(id_range)
+    if cached is not None:
+        cached_version, loaded_at, index = cached
+        if cached_version == version and time.monotonic() - loaded_at < settings.MATCHING_SHARD_TTL_SECONDS:
+            return index
+
+    from database import SessionLocal
+    index = SkillIndex()
+    with SessionLocal() as db:
+        index.build(db, id_range=id_range)
+    _worker_shards[id_range] = (version, time.monotonic(), index)
+    return index
+
+def _score_shard(id_range: Tuple[int, int], version: int, job_skills: List[str], weights: Optional[Dict[str, float]],
+                 min_match_percentage: float, limit: Optional[int], cursor: Optional[Tuple[float, int]]):
+    """Runs in a worker: score one shard and return its partial top-K plus the shard's passing count"""
+    index = _load_shard(id_range, version)
+    job_bits = skill_vocabulary.to_bitset(job_skills)
+    if weights is None:
+        job_skill_count = popcount(job_bits)
+        percentages = {
+            applicant_id: round((overlap / job_skill_count) * 100, 2)
+            for applicant_id, overlap in index.count_overlaps(job_skills).items()
+        }
+    else:
+        skill_weights = {skill_vocabulary.intern(name): weight for name, weight in weights.items()}
+        total_weight = sum(skill_weights.values())
+        percentages = {
+            applicant_id: round((weight / total_weight) * 100, 2)
+            for applicant_id, weight in index.weighted_overlaps(job_bits, skill_weights).items()
+        }
+
+    passing = [(percentage, applicant_id) for applicant_id, percentage in percentages.items() if percentage >= min_match_percentage]
+    top = select_top_k(passing, limit, cursor)
+    return [
+        (percentage, applicant_id, skill_vocabulary.names(job_bits & index.applicant_bits(applicant_id)))
+        for percentage, applicant_id in top
+    ], len(passing)
+
+def sharded_top_applicants(db: Session, job_skills: List[str], weights: Optional[Dict[str, float]] = None,
+                           min_match_percentage: float = 0.0, limit: Optional[int] = None,
+                           cursor: Optional[Tuple[float, int]] = None) -> Tuple[List[Tuple[float, int, List[str]]], int]:
+    """Fan a job out over the applicant shards and merge the partial top-K results.
+
+    weights maps canonical skill names to global weights (for IDF scoring); shards
+    must not derive IDF from their local document frequencies.
+    """
+    ranges = shard_ranges(db)
+    shard_versions = versions.read(db, [versions.applicant_shard_key(lo) for lo, _ in ranges])
+    pool = get_pool()
+    futures = [
+        pool.submit(_score_shard, (lo, hi), shard_versions[versions.applicant_shard_key(lo)], list(job_skills), weights,
+                    min_match_percentage, limit, cursor)
+        for lo, hi in ranges
+    ]
+    partials, total = [], 0
+    for future in futures:
+        top, passing = future.result()
+        partials.extend(top)
+        total += passing
+    return select_top_k(partials, limit), total
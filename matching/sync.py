@@ -0,0 +1,224 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from core.config import settings
+from database import SessionLocal
+from jobs.models import JobPosition
+from applicants.models import Applicant
+from matching.models import MatchScore, SkillSignature
+from matching.index import skill_index
+from matching.minhash import skill_count
+from matching import approx, versions
+from matching.scores import refresh_job_scores, refresh_applicant_scores, store_postings, delete_postings
+
+# Called by jobs.crud and applicants.crud to keep derived matching state in step with writes.
+# The *_changed hooks run after the row is committed; the *_deleted hooks run inside the
+# deleting transaction, before the row itself is removed.
+
+# Every hook bumps the match_versions counters in the same transaction as its writes
+# and logs the ids it changed under the new version, so readers in any process see
+# new versions together with the new data. The in-memory skill index and LSH buckets
+# record the versions they reflect: a process applies its own write after commit when
+# nothing else was committed in between, and ensure_current reloads the rows other
+# workers or scripts changed since. Only when the log cannot say what changed (e.g.
+# after rebuild_match_scores) is the whole state rebuilt, in a background thread and
+# at most once per MATCH_REBUILD_MIN_INTERVAL_SECONDS; requests keep the previous
+# state until it is swapped in.
+
+_memory_lock = threading.Lock()
+_memory_versions: Dict[str, Optional[int]] = {versions.APPLICANTS: None, versions.JOBS: None}
+
+_rebuild_requested = threading.Event()
+_rebuild_thread: Optional[threading.Thread] = None
+
+# Maximum number of ids bound into a single IN (...) clause
+RELOAD_BATCH_SIZE = 500
+
+# Callbacks wait in session.info for the transaction's outcome: they run once it
+# commits and are dropped if it rolls back, so a failed write never reaches memory
+_PENDING_KEY = "matching_after_commit"
+
+def _after_commit(db: Session, callback):
+    db.info.setdefault(_PENDING_KEY, []).append(callback)
+
+@event.listens_for(Session, "after_commit")
+def _run_pending(session: Session):
+    for callback in session.info.pop(_PENDING_KEY, []):
+        callback()
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending(session: Session):
+    session.info.pop(_PENDING_KEY, None)
+
+def _apply_local(name: str, version: int, apply: Callable[[], None]):
+    with _memory_lock:
+        if _memory_versions[name] == version - 1:
+            apply()
+            _memory_versions[name] = version
+
+def _is_stale(current: Dict[str, int]) -> bool:
+    return any(
+        _memory_versions[name] is None or _memory_versions[name] < version
+        for name, version in current.items() if name in _memory_versions
+    )
+
+def memory_reflects(current: Dict[str, int]) -> bool:
+    """Whether the in-memory state is at least as new as the given counters"""
+    return not _is_stale(current)
+
+def load_memory_state(db: Session) -> Dict[str, int]:
+    """Rebuild the in-memory skill index and LSH buckets and record the versions they reflect"""
+    current = versions.read(db, [versions.APPLICANTS, versions.JOBS])
+    skill_index.build(db)
+    approx.load_lsh(db)
+    with _memory_lock:
+        _memory_versions.update(current)
+    return current
+
+def _reload_applicants(db: Session, applicant_ids: Set[int]):
+    ids = sorted(applicant_ids)
+    for start in range(0, len(ids), RELOAD_BATCH_SIZE):
+        batch = ids[start:start + RELOAD_BATCH_SIZE]
+        skills = dict(db.query(Applicant.id, Applicant.skills).filter(Applicant.id.in_(batch)))
+        signatures = dict(db.query(SkillSignature.entity_id, SkillSignature.signature).filter(
+            SkillSignature.entity_type == approx.APPLICANT, SkillSignature.entity_id.in_(batch)
+        ))
+        for applicant_id in batch:
+            if applicant_id in skills:
+                skill_index.add_applicant(applicant_id, skills[applicant_id])
+                approx.bucket(approx.APPLICANT, applicant_id, signatures.get(applicant_id), skill_count(skills[applicant_id]))
+            else:
+                skill_index.remove_applicant(applicant_id)
+                approx.unbucket(approx.APPLICANT, applicant_id)
+
+def _reload_jobs(db: Session, job_ids: Set[int]):
+    ids = sorted(job_ids)
+    for start in range(0, len(ids), RELOAD_BATCH_SIZE):
+        batch = ids[start:start + RELOAD_BATCH_SIZE]
+        skills = dict(db.query(JobPosition.id, JobPosition.skills).filter(JobPosition.id.in_(batch)))
+        signatures = dict(db.query(SkillSignature.entity_id, SkillSignature.signature).filter(
+            SkillSignature.entity_type == approx.JOB, SkillSignature.entity_id.in_(batch)
+        ))
+        for job_id in batch:
+            if job_id in skills:
+                skill_index.set_job(job_id, skills[job_id])
+                approx.bucket(approx.JOB, job_id, signatures.get(job_id), skill_count(skills[job_id]))
+            else:
+                skill_index.remove_job(job_id)
+                approx.unbucket(approx.JOB, job_id)
+
+_RELOADERS = {versions.APPLICANTS: _reload_applicants, versions.JOBS: _reload_jobs}
+
+def _rebuild_loop():
+    last_started = 0.0
+    while True:
+        _rebuild_requested.wait()
+        delay = last_started + settings.MATCH_REBUILD_MIN_INTERVAL_SECONDS - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        last_started = time.monotonic()
+        try:
+            with SessionLocal() as db:
+                load_memory_state(db)
+        except Exception as e:
+            print(f"Error rebuilding in-memory matching state: {e}")
+        # Requests made while the rebuild ran are covered by it; later gaps ask again
+        _rebuild_requested.clear()
+
+def _request_rebuild():
+    global _rebuild_thread
+    _rebuild_requested.set()
+    if _rebuild_thread is None:
+        _rebuild_thread = threading.Thread(target=_rebuild_loop, name="matching-rebuild", daemon=True)
+        _rebuild_thread.start()
+
+def ensure_current(db: Session) -> Dict[str, int]:
+    """Bring the in-memory state up to the database's versions where the change log allows,
+    otherwise schedule a background rebuild; returns the versions read"""
+    current = versions.read(db, [versions.APPLICANTS, versions.JOBS])
+    if not _is_stale(current):
+        return current
+    if any(_memory_versions[name] is None for name in current):
+        # Nothing to serve from yet (startup preparation failed), build in line
+        return load_memory_state(db)
+    with _memory_lock:
+        for name, version in current.items():
+            loaded = _memory_versions[name]
+            if loaded >= version:
+                continue
+            changed = versions.changed_since(db, name, loaded, version)
+            if changed is None:
+                _request_rebuild()
+                continue
+            _RELOADERS[name](db, changed)
+            _memory_versions[name] = version
+    return current
+
+def job_changed(db: Session, job: JobPosition, skills_changed: bool = True):
+    job_id, skills = job.id, job.skills
+    versions.bump(db, versions.job_key(job_id))
+    if skills_changed:
+        store_postings(db, approx.JOB, job_id, skills)
+        refresh_job_scores(db, job)
+        signature = approx.store_signature(db, approx.JOB, job_id, skills)
+        version = versions.bump(db, versions.JOBS)
+        versions.log_changes(db, versions.JOBS, version, [job_id])
+
+        def apply():
+            skill_index.set_job(job_id, skills)
+            approx.bucket(approx.JOB, job_id, signature, skill_count(skills))
+        _after_commit(db, lambda: _apply_local(versions.JOBS, version, apply))
+    db.commit()
+
+def job_deleted(db: Session, job_id: int):
+    approx.delete_signature(db, approx.JOB, job_id)
+    delete_postings(db, approx.JOB, job_id)
+    db.query(MatchScore).filter(MatchScore.job_id == job_id).delete(synchronize_session=False)
+    versions.bump(db, versions.job_key(job_id))
+    version = versions.bump(db, versions.JOBS)
+    versions.log_changes(db, versions.JOBS, version, [job_id])
+
+    def apply():
+        skill_index.remove_job(job_id)
+        approx.unbucket(approx.JOB, job_id)
+    _after_commit(db, lambda: _apply_local(versions.JOBS, version, apply))
+
+def applicant_changed(db: Session, applicant: Applicant):
+    applicants_changed(db, [applicant])
+
+def applicants_changed(db: Session, applicants: List[Applicant]):
+    """applicant_changed for a batch of pending applicant writes, committed together"""
+    if not applicants:
+        db.commit()
+        return
+    for applicant in applicants:
+        store_postings(db, approx.APPLICANT, applicant.id, applicant.skills)
+        refresh_applicant_scores(db, applicant)
+    signatures = approx.store_signatures(db, approx.APPLICANT, [(applicant.id, applicant.skills) for applicant in applicants])
+    changes = [(applicant.id, applicant.skills, signatures[applicant.id]) for applicant in applicants]
+    for shard_key in {versions.applicant_shard_key(applicant_id) for applicant_id, _, _ in changes}:
+        versions.bump(db, shard_key)
+    version = versions.bump(db, versions.APPLICANTS)
+    versions.log_changes(db, versions.APPLICANTS, version, [applicant_id for applicant_id, _, _ in changes])
+
+    def apply():
+        for applicant_id, skills, signature in changes:
+            skill_index.add_applicant(applicant_id, skills)
+            approx.bucket(approx.APPLICANT, applicant_id, signature, skill_count(skills))
+    _after_commit(db, lambda: _apply_local(versions.APPLICANTS, version, apply))
+    db.commit()
+
+def applicant_deleted(db: Session, applicant_id: int):
+    approx.delete_signature(db, approx.APPLICANT, applicant_id)
+    delete_postings(db, approx.APPLICANT, applicant_id)
+    db.query(MatchScore).filter(MatchScore.applicant_id == applicant_id).delete(synchronize_session=False)
+    versions.bump(db, versions.applicant_shard_key(applicant_id))
+    version = versions.bump(db, versions.APPLICANTS)
+    versions.log_changes(db, versions.APPLICANTS, version, [applicant_id])
+
+    def apply():
+        skill_index.remove_applicant(applicant_id)
+        approx.unbucket(approx.APPLICANT, applicant_id)
+    _after_commit(db, lambda: _apply_local(versions.APPLICANTS, version, apply))
@@ -1,69 +1,286 @@
 
-from typing import List, Dict, Tuple
-from sqlalchemy.orm import Session
+from typing import List, Dict, Tuple, Optional
+from core.config import settings
+from sqlalchemy import or_, and_
+from sqlalchemy.orm import Session, load_only
 from jobs.models import JobPosition
 from applicants.models import Applicant
+from matching.index import skill_index
+from matching.sync import ensure_current
+from matching.vocabulary import skill_vocabulary, popcount
+from matching.models import MatchScore
+from matching.pagination import select_top_k
+from matching.sharding import sharding_enabled, sharded_top_applicants
+from matching.minhash import compute_signature, applicant_lsh, job_lsh
+
+# Maximum number of ids bound into a single IN (...) clause
+APPLICANT_FETCH_BATCH_SIZE = 500
 
 def calculate_skill_match_percentage(job_skills: List[str], applicant_skills: List[str]) -> float:
     """Calculate match percentage based on skill overlap"""
     if not job_skills or not applicant_skills:
         return 0.0
     
-    # Convert to lowercase for case-insensitive matching
-    job_skills_lower = [skill.lower() for skill in job_skills]
-    applicant_skills_lower = [skill.lower() for skill in applicant_skills]
+    # Canonical skill bitsets fold case, whitespace and synonyms
+    job_bits = skill_vocabulary.to_bitset(job_skills)
+    applicant_bits = skill_vocabulary.to_bitset(applicant_skills)
+    
+    # Calculate percentage based on (distinct) job requirements
+    return percentage_from_bits(job_bits, applicant_bits)
+
+def percentage_from_bits(job_bits: int, applicant_bits: int) -> float:
+    if not job_bits:
+        return 0.0
+    return round((popcount(job_bits & applicant_bits) / popcount(job_bits)) * 100, 2)
+
+def score_applicants_for_job(db: Session, job: JobPosition) -> List[Tuple[int, float, List[str]]]:
+    """Score every applicant sharing at least one skill with the job, using the inverted index"""
+    job_bits = skill_vocabulary.to_bitset(job.skills)
+    if not job_bits:
+        return []
     
-    # Calculate intersection
-    matched_skills = set(job_skills_lower) & set(applicant_skills_lower)
+    ensure_current(db)
+    if sharding_enabled():
+        scored, _ = sharded_top_applicants(db, job.skills)
+        return [(applicant_id, match_percentage, matched_skills) for match_percentage, applicant_id, matched_skills in scored]
     
-    # Calculate percentage based on job requirements
-    match_percentage = (len(matched_skills) / len(job_skills_lower)) * 100
-    return round(match_percentage, 2)
+    job_skill_count = popcount(job_bits)
+    scores = []
+    for applicant_id, overlap in skill_index.count_overlaps(job.skills).items():
+        match_percentage = round((overlap / job_skill_count) * 100, 2)
+        matched_skills = skill_vocabulary.names(job_bits & skill_index.applicant_bits(applicant_id))
+        scores.append((applicant_id, match_percentage, matched_skills))
+    return scores
+
+def _after_cursor(percentage_column, id_column, cursor: Optional[Tuple[float, int]]):
+    """Keyset predicate matching rows ordered after the cursor"""
+    cursor_percentage, cursor_id = cursor
+    return or_(
+        percentage_column < cursor_percentage,
+        and_(percentage_column == cursor_percentage, id_column > cursor_id)
+    )
+
+def count_matched_applicants_for_job(db: Session, job_id: int, min_match_percentage: float = 0.0) -> int:
+    return db.query(MatchScore).filter(
+        MatchScore.job_id == job_id,
+        MatchScore.match_percentage >= min_match_percentage
+    ).count()
 
-def get_matched_applicants_for_job(db: Session, job_id: int, min_match_percentage: float = 0.0) -> List[Dict]:
+def count_matched_jobs_for_applicant(db: Session, applicant_id: int, min_match_percentage: float = 0.0) -> int:
+    return db.query(MatchScore).filter(
+        MatchScore.applicant_id == applicant_id,
+        MatchScore.match_percentage >= min_match_percentage
+    ).count()
+
+def get_matched_applicants_for_job(db: Session, job_id: int, min_match_percentage: float = 0.0, limit: Optional[int] = None, cursor: Optional[Tuple[float, int]] = None) -> List[Dict]:
     """Get matched applicants for a specific job"""
-    job = db.query(JobPosition).filter(JobPosition.id == job_id).first()
-    if not job:
-        return []
+    query = db.query(MatchScore, Applicant).options(load_only(Applicant.id, Applicant.name, Applicant.email)).join(Applicant, Applicant.id == MatchScore.applicant_id).filter(
+        MatchScore.job_id == job_id,
+        MatchScore.match_percentage >= min_match_percentage
+    )
+    if cursor is not None:
+        query = query.filter(_after_cursor(MatchScore.match_percentage, MatchScore.applicant_id, cursor))
+    query = query.order_by(MatchScore.match_percentage.desc(), MatchScore.applicant_id)
+    if limit is not None:
+        query = query.limit(limit)
     
-    applicants = db.query(Applicant).filter(Applicant.skills.isnot(None)).all()
-    matched_applicants = []
-    
-    for applicant in applicants:
-        if applicant.skills:
-            match_percentage = calculate_skill_match_percentage(job.skills, applicant.skills)
-            if match_percentage >= min_match_percentage:
-                matched_applicants.append({
-                    "applicant": applicant,
-                    "match_percentage": match_percentage,
-                    "matched_skills": list(set([skill.lower() for skill in job.skills]) & 
-                                          set([skill.lower() for skill in applicant.skills]))
-                })
-    
-    # Sort by match percentage (highest first)
-    matched_applicants.sort(key=lambda x: x["match_percentage"], reverse=True)
-    return matched_applicants
-
-def get_matched_jobs_for_applicant(db: Session, applicant_id: int, min_match_percentage: float = 0.0) -> List[Dict]:
+    return [
+        {
+            "applicant": applicant,
+            "match_percentage": score.match_percentage,
+            "matched_skills": score.matched_skills or []
+        }
+        for score, applicant in query.all()
+    ]
+
+def get_matched_jobs_for_applicant(db: Session, applicant_id: int, min_match_percentage: float = 0.0, limit: Optional[int] = None, cursor: Optional[Tuple[float, int]] = None) -> List[Dict]:
     """Get matching jobs for a specific applicant"""
-    applicant = db.query(Applicant).filter(Applicant.id == applicant_id).first()
-    if not applicant or not applicant.skills:
-        return []
+    query = db.query(MatchScore, JobPosition).join(JobPosition, JobPosition.id == MatchScore.job_id).filter(
+        MatchScore.applicant_id == applicant_id,
+        MatchScore.match_percentage >= min_match_percentage
+    )
+    if cursor is not None:
+        query = query.filter(_after_cursor(MatchScore.match_percentage, MatchScore.job_id, cursor))
+    query = query.order_by(MatchScore.match_percentage.desc(), MatchScore.job_id)
+    if limit is not None:
+        query = query.limit(limit)
+    
+    return [
+        {
+            "job": job,
+            "match_percentage": score.match_percentage,
+            "matched_skills": score.matched_skills or []
+        }
+        for score, job in query.all()
+    ]
+
+def idf_percentage(job_bits: int, matched_weight: float) -> float:
+    total_weight = sum(skill_index.idf(skill_id) for skill_id in skill_vocabulary.ids(job_bits))
+    if not total_weight:
+        return 0.0
+    return round((matched_weight / total_weight) * 100, 2)
+
+def idf_scores_for_job(db: Session, job: JobPosition) -> Dict[int, float]:
+    """IDF-weighted percentage for every applicant sharing a skill with the job"""
+    job_bits = skill_vocabulary.to_bitset(job.skills)
+    if not job_bits:
+        return {}
+    
+    ensure_current(db)
+    total_weight = sum(skill_index.idf(skill_id) for skill_id in skill_vocabulary.ids(job_bits))
+    return {
+        applicant_id: round((weight / total_weight) * 100, 2)
+        for applicant_id, weight in skill_index.weighted_overlaps(job_bits).items()
+    }
+
+def idf_scores_for_applicant(db: Session, applicant: Applicant) -> Dict[int, float]:
+    """IDF-weighted percentage for every job sharing a skill with the applicant"""
+    applicant_bits = skill_vocabulary.to_bitset(applicant.skills)
+    if not applicant_bits:
+        return {}
+    
+    ensure_current(db)
+    scores = {}
+    for job_id, job_bits in skill_index.job_bits().items():
+        matched_bits = job_bits & applicant_bits
+        if matched_bits:
+            matched_weight = sum(skill_index.idf(skill_id) for skill_id in skill_vocabulary.ids(matched_bits))
+            scores[job_id] = idf_percentage(job_bits, matched_weight)
+    return scores
+
+def idf_weights_for_job(db: Session, job: JobPosition) -> Dict[str, float]:
+    """Global IDF weight of each of the job's canonical skills"""
+    ensure_current(db)
+    job_bits = skill_vocabulary.to_bitset(job.skills)
+    return {skill_vocabulary.name(skill_id): skill_index.idf(skill_id) for skill_id in skill_vocabulary.ids(job_bits)}
+
+def rank_applicants_for_job(db: Session, job: JobPosition, scoring: str = "overlap", min_match_percentage: float = 0.0, limit: Optional[int] = None, cursor: Optional[Tuple[float, int]] = None) -> Tuple[List[Dict], int]:
+    """Score applicants live and select a page; returns (page, total passing).
+    
+    Runs on the process pool when MATCHING_POOL_SIZE > 0, otherwise in-process.
+    """
+    job_bits = skill_vocabulary.to_bitset(job.skills)
+    if not job_bits:
+        return [], 0
+    
+    ensure_current(db)
+    if sharding_enabled():
+        weights = idf_weights_for_job(db, job) if scoring == "idf" else None
+        page, total = sharded_top_applicants(db, job.skills, weights, min_match_percentage, limit, cursor)
+    else:
+        if scoring == "idf":
+            percentages = idf_scores_for_job(db, job)
+        else:
+            percentages = {applicant_id: match_percentage for applicant_id, match_percentage, _ in score_applicants_for_job(db, job)}
+        passing = [(percentage, applicant_id) for applicant_id, percentage in percentages.items() if percentage >= min_match_percentage]
+        page = [
+            (percentage, applicant_id, skill_vocabulary.names(job_bits & skill_index.applicant_bits(applicant_id)))
+            for percentage, applicant_id in select_top_k(passing, limit, cursor)
+        ]
+        total = len(passing)
+    
+    return _hydrate_applicant_page(db, page), total
+
+def approx_threshold(min_match_percentage: float) -> float:
+    """Containment from which mode=approx honours the requested recall"""
+    return max(min_match_percentage / 100, settings.APPROX_MIN_CONTAINMENT)
+
+def approx_rank_applicants_for_job(db: Session, job: JobPosition, scoring: str = "overlap", recall: float = 1.0, min_match_percentage: float = 0.0, limit: Optional[int] = None, cursor: Optional[Tuple[float, int]] = None) -> Tuple[List[Dict], int]:
+    """Shortlist applicants through the MinHash LSH buckets and score only the shortlist exactly.
+    
+    Each applicant covering at least approx_threshold of the job's skills is
+    shortlisted with probability >= recall; recall 1 ranks every applicant.
+    """
+    if recall >= 1.0:
+        return rank_applicants_for_job(db, job, scoring, min_match_percentage, limit=limit, cursor=cursor)
+    
+    job_bits = skill_vocabulary.to_bitset(job.skills)
+    if not job_bits:
+        return [], 0
+    
+    ensure_current(db)
+    shortlist = applicant_lsh.query(compute_signature(job.skills), popcount(job_bits), approx_threshold(min_match_percentage), recall)
+    if scoring == "idf":
+        total_weight = sum(skill_index.idf(skill_id) for skill_id in skill_vocabulary.ids(job_bits))
+    
+    passing = []
+    for applicant_id in shortlist:
+        matched_bits = job_bits & skill_index.applicant_bits(applicant_id)
+        if not matched_bits:
+            continue
+        if scoring == "idf":
+            percentage = round((sum(skill_index.idf(skill_id) for skill_id in skill_vocabulary.ids(matched_bits)) / total_weight) * 100, 2)
+        else:
+            percentage = percentage_from_bits(job_bits, matched_bits)
+        if percentage >= min_match_percentage:
+            passing.append((percentage, applicant_id))
+    
+    page = [
+        (percentage, applicant_id, skill_vocabulary.names(job_bits & skill_index.applicant_bits(applicant_id)))
+        for percentage, applicant_id in select_top_k(passing, limit, cursor)
+    ]
+    return _hydrate_applicant_page(db, page), len(passing)
+
+def _hydrate_applicant_page(db: Session, page: List[Tuple[float, int, List[str]]]) -> List[Dict]:
+    applicants = {}
+    page_ids = [applicant_id for _, applicant_id, _ in page]
+    for start in range(0, len(page_ids), APPLICANT_FETCH_BATCH_SIZE):
+        batch_ids = page_ids[start:start + APPLICANT_FETCH_BATCH_SIZE]
+        for applicant in db.query(Applicant).options(load_only(Applicant.id, Applicant.name, Applicant.email)).filter(Applicant.id.in_(batch_ids)).all():
+            applicants[applicant.id] = applicant
+    
+    return [
+        {
+            "applicant": applicants[applicant_id],
+            "match_percentage": percentage,
+            "matched_skills": matched_skills
+        }
+        for percentage, applicant_id, matched_skills in page if applicant_id in applicants
+    ]
+
+def rank_jobs(db: Session, applicant: Applicant, percentages: Dict[int, float], min_match_percentage: float = 0.0, limit: Optional[int] = None, cursor: Optional[Tuple[float, int]] = None) -> Tuple[List[Dict], int]:
+    """Select a page of jobs from live-computed scores; returns (page, total passing)"""
+    passing = [(percentage, job_id) for job_id, percentage in percentages.items() if percentage >= min_match_percentage]
+    page = select_top_k(passing, limit, cursor)
+    
+    page_ids = [job_id for _, job_id in page]
+    jobs = {job.id: job for job in db.query(JobPosition).filter(JobPosition.id.in_(page_ids)).all()} if page_ids else {}
+    
+    applicant_bits = skill_vocabulary.to_bitset(applicant.skills)
+    matched_jobs = [
+        {
+            "job": jobs[job_id],
+            "match_percentage": percentage,
+            "matched_skills": skill_vocabulary.names(skill_vocabulary.to_bitset(jobs[job_id].skills) & applicant_bits)
+        }
+        for percentage, job_id in page if job_id in jobs
+    ]
+    return matched_jobs, len(passing)
+
+def approx_scores_for_applicant(db: Session, applicant: Applicant, scoring: str = "overlap", recall: float = 1.0, min_match_percentage: float = 0.0) -> Dict[int, float]:
+    """Exact percentages for the jobs shortlisted through the MinHash LSH buckets.
+    
+    Each job of which the applicant covers at least approx_threshold is
+    shortlisted with probability >= recall; recall 1 scores every job.
+    """
+    applicant_bits = skill_vocabulary.to_bitset(applicant.skills)
+    if not applicant_bits:
+        return {}
     
-    jobs = db.query(JobPosition).all()
-    matched_jobs = []
-    
-    for job in jobs:
-        if job.skills:
-            match_percentage = calculate_skill_match_percentage(job.skills, applicant.skills)
-            if match_percentage >= min_match_percentage:
-                matched_jobs.append({
-                    "job": job,
-                    "match_percentage": match_percentage,
-                    "matched_skills": list(set([skill.lower() for skill in job.skills]) & 
-                                          set([skill.lower() for skill in applicant.skills]))
-                })
-    
-    # Sort by match percentage (highest first)
-    matched_jobs.sort(key=lambda x: x["match_percentage"], reverse=True)
-    return matched_jobs
+    ensure_current(db)
+    job_bits_by_id = skill_index.job_bits()
+    if recall >= 1.0:
+        shortlist = job_bits_by_id.keys()
+    else:
+        shortlist = job_lsh.query(compute_signature(applicant.skills), popcount(applicant_bits), approx_threshold(min_match_percentage), recall, query_is_job=False)
+    scores = {}
+    for job_id in shortlist:
+        job_bits = job_bits_by_id.get(job_id, 0)
+        matched_bits = job_bits & applicant_bits
+        if not matched_bits:
+            continue
+        if scoring == "idf":
+            scores[job_id] = idf_percentage(job_bits, sum(skill_index.idf(skill_id) for skill_id in skill_vocabulary.ids(matched_bits)))
+        else:
+            scores[job_id] = percentage_from_bits(job_bits, applicant_bits)
+    return scores
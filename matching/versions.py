@@ -0,0 +1,64 @@
+from typing import Dict, Iterable, Optional, Set
+from sqlalchemy import delete, func, update
+from sqlalchemy.orm import Session
+from core.config import settings
+from matching.models import MatchVersion, MatchChange
+
+# Counter names: the applicant set, the job set, one per job for its own row and
+# one per fixed-width applicant id range, so a shard reloads only when it changed
+APPLICANTS = "applicants"
+JOBS = "jobs"
+
+def job_key(job_id: int) -> str:
+    return f"job:{job_id}"
+
+def applicant_shard_key(applicant_id: int) -> str:
+    width = settings.MATCHING_SHARD_SIZE
+    return f"applicant_shard:{width}:{applicant_id // width}"
+
+def ensure_versions(db: Session):
+    """Create the shared counters, so concurrent first bumps never race on the insert"""
+    existing = {name for (name,) in db.query(MatchVersion.name).filter(MatchVersion.name.in_([APPLICANTS, JOBS]))}
+    for name in (APPLICANTS, JOBS):
+        if name not in existing:
+            db.add(MatchVersion(name=name, version=0))
+    db.commit()
+
+def bump(db: Session, name: str) -> int:
+    """Increment a counter inside the caller's transaction and return its new value"""
+    result = db.execute(update(MatchVersion).where(MatchVersion.name == name).values(version=MatchVersion.version + 1))
+    if result.rowcount == 0:
+        db.add(MatchVersion(name=name, version=1))
+        db.flush()
+        return 1
+    return db.query(MatchVersion.version).filter(MatchVersion.name == name).scalar()
+
+def read(db: Session, names: Iterable[str]) -> Dict[str, int]:
+    """Current value of each counter (0 if never bumped)"""
+    names = list(names)
+    found = dict(db.query(MatchVersion.name, MatchVersion.version).filter(MatchVersion.name.in_(names)).all())
+    return {name: found.get(name, 0) for name in names}
+
+def log_changes(db: Session, name: str, version: int, entity_ids: Iterable[int]):
+    """Record which ids a bump of name to version covered (inside the caller's transaction)"""
+    rows = [{"name": name, "version": version, "entity_id": entity_id} for entity_id in set(entity_ids)]
+    if rows:
+        db.execute(MatchChange.__table__.insert(), rows)
+    # Trim the log now and then; workers further behind than this rebuild instead
+    if version % 100 == 0:
+        db.execute(delete(MatchChange).where(
+            MatchChange.name == name,
+            MatchChange.version <= version - settings.MATCH_CHANGE_LOG_VERSIONS
+        ))
+
+def changed_since(db: Session, name: str, after: int, upto: int) -> Optional[Set[int]]:
+    """Ids changed by the bumps of name in (after, upto], or None when the log cannot tell
+    (a bump without logged ids, such as a full rebuild, or versions already trimmed)"""
+    logged = db.query(func.count(func.distinct(MatchChange.version))).filter(
+        MatchChange.name == name, MatchChange.version > after, MatchChange.version <= upto
+    ).scalar()
+    if logged != upto - after:
+        return None
+    return {entity_id for (entity_id,) in db.query(MatchChange.entity_id).filter(
+        MatchChange.name == name, MatchChange.version > after, MatchChange.version <= upto
+    ).distinct()}
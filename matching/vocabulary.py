@@ -0,0 +1,103 @@
+import json
+import re
+import threading
+from typing import Dict, Iterable, List, Optional
+from core.config import settings
+
+# canonical skill -> spellings that should be treated as the same skill
+DEFAULT_SYNONYMS: Dict[str, List[str]] = {
+    "node.js": ["nodejs", "node js", "node"],
+    "postgresql": ["postgres", "postgre sql", "psql"],
+    "javascript": ["js", "java script", "ecmascript"],
+    "typescript": ["ts"],
+    "kubernetes": ["k8s"],
+    "go": ["golang"],
+    "c++": ["cpp"],
+    "c#": ["csharp", "c sharp"],
+    "react": ["react.js", "reactjs"],
+    "vue": ["vue.js", "vuejs"],
+    "express": ["express.js", "expressjs"],
+    "mongodb": ["mongo"],
+    "rest api": ["rest", "restful api", "rest apis"],
+    "ci/cd": ["cicd", "ci cd"],
+    "aws": ["amazon web services"],
+    "gcp": ["google cloud", "google cloud platform"],
+    "sql server": ["mssql", "ms sql"],
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+def load_synonyms(path: Optional[str] = None) -> Dict[str, str]:
+    """Build an alias -> canonical map from the defaults plus an optional JSON file"""
+    table = {canonical: list(aliases) for canonical, aliases in DEFAULT_SYNONYMS.items()}
+    if path:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for canonical, aliases in json.load(f).items():
+                    table.setdefault(canonical, []).extend(aliases)
+        except (OSError, ValueError) as e:
+            print(f"Warning: could not load skill synonyms from {path}: {e}")
+
+    aliases: Dict[str, str] = {}
+    for canonical, spellings in table.items():
+        canonical = _WHITESPACE.sub(" ", canonical.strip().lower())
+        for spelling in spellings:
+            aliases[_WHITESPACE.sub(" ", spelling.strip().lower())] = canonical
+    return aliases
+
+def popcount(bits: int) -> int:
+    return bits.bit_count()
+
+class SkillVocabulary:
+    """Interns canonical skill names to small integer ids so skill sets can be int bitsets"""
+
+    def __init__(self, synonyms: Optional[Dict[str, str]] = None):
+        self._lock = threading.Lock()
+        self._synonyms = synonyms or {}
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+
+    def canonicalize(self, skill) -> str:
+        name = _WHITESPACE.sub(" ", str(skill).strip().lower())
+        return self._synonyms.get(name, name)
+
+    def intern(self, skill) -> int:
+        name = self.canonicalize(skill)
+        skill_id = self._ids.get(name)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._ids.get(name)
+                if skill_id is None:
+                    skill_id = len(self._names)
+                    self._names.append(name)
+                    self._ids[name] = skill_id
+        return skill_id
+
+    def lookup(self, skill) -> Optional[int]:
+        """Id of an already interned skill, without adding new ones"""
+        return self._ids.get(self.canonicalize(skill))
+
+    def name(self, skill_id: int) -> str:
+        return self._names[skill_id]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def to_bitset(self, skills: Optional[Iterable[str]]) -> int:
+        bits = 0
+        for skill in skills or []:
+            bits |= 1 << self.intern(skill)
+        return bits
+
+    def ids(self, bits: int) -> List[int]:
+        skill_ids = []
+        while bits:
+            low = bits & -bits
+            skill_ids.append(low.bit_length() - 1)
+            bits ^= low
+        return skill_ids
+
+    def names(self, bits: int) -> List[str]:
+        return [self._names[skill_id] for skill_id in self.ids(bits)]
+
+skill_vocabulary = SkillVocabulary(load_synonyms(settings.SKILL_SYNONYMS_PATH))
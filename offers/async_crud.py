@@ -0,0 +1,37 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from offers.models import OfferLetter
+from offers.schemas import OfferLetterCreate
+from typing import List
+
+async def create_offer_letter(db: AsyncSession, offer: OfferLetterCreate, pdf_path: str):
+    db_offer = OfferLetter(
+        applicant_id=offer.applicant_id,
+        position_id=offer.position_id,
+        pdf_path=pdf_path,
+        salary=offer.salary,
+        start_date=offer.start_date
+    )
+    db.add(db_offer)
+    await db.commit()
+    await db.refresh(db_offer)
+    return db_offer
+
+async def get_offer_letter(db: AsyncSession, offer_id: int):
+    return await db.get(OfferLetter, offer_id)
+
+async def get_offers(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[OfferLetter]:
+    result = await db.execute(select(OfferLetter).offset(skip).limit(limit))
+    return result.scalars().all()
+
+async def get_offers_by_applicant_id(db: AsyncSession, applicant_id: int) -> List[OfferLetter]:
+    result = await db.execute(select(OfferLetter).filter(OfferLetter.applicant_id == applicant_id))
+    return result.scalars().all()
+
+async def delete_offer_letter(db: AsyncSession, offer_id: int):
+    db_offer = await db.get(OfferLetter, offer_id)
+    if db_offer:
+        await db.delete(db_offer)
+        await db.commit()
+        return True
+    return False
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from database import get_async_db
+from auth.router import get_current_user
+from auth.models import User
+from offers import schemas, async_crud
+
+# Routes migrated to the async data path, mounted ahead of offers.router when USE_ASYNC_DB is on
+router = APIRouter()
+
+@router.get("/", response_model=List[schemas.OfferLetter])
+async def list_offers(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """List offers - companies see all, applicants see their own"""
+    if current_user.role.value == "company":
+        offers = await async_crud.get_offers(db)
+        # Filter out offers with null applicant_id to prevent validation errors
+        return [offer for offer in offers if offer.applicant_id is not None]
+    elif current_user.applicant_id is not None:
+        offers = await async_crud.get_offers_by_applicant_id(db, applicant_id=current_user.applicant_id)
+        return [offer for offer in offers if offer.applicant_id is not None]
+    return []
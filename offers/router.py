@@ -24,14 +24,11 @@ def list_offers(
         offers = crud.get_offers(db)
         # Filter out offers with null applicant_id to prevent validation errors
         return [offer for offer in offers if offer.applicant_id is not None]
-    else:
+    elif current_user.applicant_id is not None:
         # For applicants, get offers for their applicant profile
-        from applicants.crud import get_applicant_by_user_id
-        applicant = get_applicant_by_user_id(db, user_id=current_user.id)
-        if applicant:
-            offers = crud.get_offers_by_applicant_id(db, applicant_id=applicant.id)
-            return [offer for offer in offers if offer.applicant_id is not None]
-        return []
+        offers = crud.get_offers_by_applicant_id(db, applicant_id=current_user.applicant_id)
+        return [offer for offer in offers if offer.applicant_id is not None]
+    return []
 
 @router.post("/", response_model=schemas.OfferLetter)
 def generate_offer_letter(
@@ -86,8 +83,7 @@ def download_offer_letter(
             raise HTTPException(status_code=403, detail="Not authorized to download this offer letter")
     else:
         # Applicants can download their own offers
-        applicant = get_applicant(db, applicant_id=offer.applicant_id)
-        if not applicant or applicant.user_id != current_user.id:
+        if offer.applicant_id is None or offer.applicant_id != current_user.applicant_id:
             raise HTTPException(status_code=403, detail="Not authorized to download this offer letter")
 
     # Check if file exists
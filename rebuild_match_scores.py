@@ -0,0 +1,35 @@
+"""
+Check or rebuild the stored matching data (skill_postings and match_scores).
+
+    python rebuild_match_scores.py [--check]
+
+The API checks this at startup and rebuilds when the tables are out of step with
+the stored skills, e.g. after rows were written without the matching hooks.
+"""
+import argparse
+import os
+import sys
+
+# Add the current directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from database import SessionLocal, engine, Base
+from matching.scores import match_scores_consistent, rebuild_match_scores
+import auth.models, jobs.models, applicants.models, interviews.models, offers.models, applications.models, matching.models  # noqa: F401
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Check or rebuild the stored match scores")
+    arg_parser.add_argument("--check", action="store_true", help="only report whether the stored scores are consistent")
+    args = arg_parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        consistent = match_scores_consistent(db)
+        if args.check:
+            print("✅ Stored match scores are consistent" if consistent else "❌ Stored match scores are out of date")
+            sys.exit(0 if consistent else 1)
+        rebuild_match_scores(db)
+    print("✅ Stored match scores rebuilt")
+
+if __name__ == "__main__":
+    main()
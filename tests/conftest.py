@@ -0,0 +1,78 @@
+import atexit
+import itertools
+import os
+import shutil
+import sys
+import tempfile
+
+# database.py creates its engine and main.py its upload directories at import
+# time, so point both at a scratch directory before any project module loads
+_workdir = tempfile.mkdtemp(prefix="recruitment-tracker-tests-")
+atexit.register(shutil.rmtree, _workdir, ignore_errors=True)
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_workdir, 'test.db')}"
+os.environ["BCRYPT_ROUNDS"] = "4"
+os.environ["MATCH_REBUILD_MIN_INTERVAL_SECONDS"] = "0"
+os.makedirs(os.path.join(_workdir, "static"), exist_ok=True)
+os.chdir(_workdir)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from database import SessionLocal
+from auth.models import UserRole
+from applicants import crud as applicant_crud
+from applicants.schemas import ApplicantCreate
+
+_names = itertools.count(1)
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+@pytest.fixture
+def db():
+    with SessionLocal() as session:
+        yield session
+
+@pytest.fixture
+def make_user(client):
+    """Register and sign in a new user; returns (user id, auth headers)"""
+    def make(role: str):
+        username = f"{role}{next(_names)}"
+        response = client.post("/auth/register", json={
+            "username": username, "email": f"{username}@example.com", "password": "secret", "role": role
+        })
+        assert response.status_code == 200, response.text
+        response = client.post("/auth/token", data={"username": username, "password": "secret"})
+        assert response.status_code == 200, response.text
+        return response.json()["user"]["id"], {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return make
+
+@pytest.fixture
+def make_applicant(db, make_user):
+    """Create an applicant profile with the given skills for a new applicant user"""
+    def make(skills, resume_text: str = ""):
+        user_id, headers = make_user(UserRole.applicant.value)
+        name = f"Applicant {next(_names)}"
+        applicant = applicant_crud.create_applicant(
+            db, ApplicantCreate(name=name, email=f"{name.replace(' ', '.').lower()}@example.com"),
+            user_id=user_id, resume_text=resume_text or ", ".join(skills), skills=skills
+        )
+        return applicant, headers
+    return make
+
+@pytest.fixture
+def make_pdf(tmp_path):
+    """Write a one-page resume PDF with the given lines and return its path"""
+    def make(lines, name: str = "resume.pdf"):
+        from reportlab.pdfgen import canvas
+        path = str(tmp_path / name)
+        pdf = canvas.Canvas(path)
+        for line_number, line in enumerate(lines):
+            pdf.drawString(72, 720 - 14 * line_number, line)
+        pdf.save()
+        return path
+    return make
@@ -0,0 +1,150 @@
+import io
+import os
+import time
+import zipfile
+import pytest
+from applicants import bulk_import, search
+from applicants.models import Applicant, BulkImportJob
+from applicants.parse_cache import content_hash, store_parse
+from applicants.parser import parse_resume
+from core.config import settings
+
+def _wait_for(client, url, headers, timeout: float = 15.0):
+    """Poll a job endpoint until it reports completed or failed"""
+    deadline = time.monotonic() + timeout
+    while True:
+        body = client.get(url, headers=headers).json()
+        if body["status"] in ("completed", "failed") or time.monotonic() > deadline:
+            return body
+        time.sleep(0.05)
+
+def _upload(client, headers, path):
+    with open(path, "rb") as resume:
+        return client.post("/applicants/", headers=headers, data={"name": "Uploaded", "email": "uploaded@example.com"},
+                           files={"resume": ("resume.pdf", resume, "application/pdf")})
+
+def _cache_parse(db, path):
+    # Imports of cached files never start the parser process pool
+    store_parse(db, content_hash(path), parse_resume(path))
+
+def test_uploaded_resume_is_parsed_in_the_background(client, make_user, make_pdf):
+    _, headers = make_user("applicant")
+    response = _upload(client, headers, make_pdf(["Jordan Lee", "jordan@example.com", "Skills: Python, Docker"]))
+    assert response.status_code == 202, response.text
+    job = _wait_for(client, f"/applicants/parse-jobs/{response.json()['id']}", headers)
+    assert job["status"] == "completed", job
+
+    profile = client.get(f"/applicants/{job['applicant_id']}", headers=headers).json()
+    assert {"python", "docker"} <= {skill.lower() for skill in profile["skills"]}
+
+    _, other = make_user("applicant")
+    assert client.get(f"/applicants/parse-jobs/{job['id']}", headers=other).status_code == 403
+
+def test_reuploaded_resume_is_applied_from_the_parse_cache(client, make_user, make_pdf):
+    path = make_pdf(["Sam Park", "Skills: Java, SQL"])
+    _, first = make_user("applicant")
+    job = _wait_for(client, f"/applicants/parse-jobs/{_upload(client, first, path).json()['id']}", first)
+    assert job["status"] == "completed"
+
+    _, second = make_user("applicant")
+    response = _upload(client, second, path)
+    assert response.status_code == 202
+    assert response.json()["status"] == "completed"
+
+def test_oversized_upload_is_rejected(client, make_user, make_pdf, monkeypatch):
+    _, headers = make_user("applicant")
+    monkeypatch.setattr(settings, "MAX_RESUME_UPLOAD_BYTES", 100)
+    stored = set(os.listdir("uploads"))
+    response = _upload(client, headers, make_pdf(["Skills: Python"]))
+    assert response.status_code == 413
+    assert set(os.listdir("uploads")) == stored
+    assert client.get("/applicants/", headers=headers).json() == []
+
+def test_search_matches_punctuated_skills_with_nonzero_scores(client, make_user, make_applicant):
+    applicant, _ = make_applicant(["C++"], resume_text="Systems programmer: C++, C# and node.js")
+    plain_c, _ = make_applicant(["C"], resume_text="Embedded C programmer")
+    _, company = make_user("company")
+    for query in ("c++", "C#", "node.js"):
+        body = client.get("/applicants/search", headers=company, params={"q": query, "limit": 100}).json()
+        hits = {result["applicant_id"]: result["score"] for result in body["results"]}
+        assert applicant.id in hits, query
+        assert plain_c.id not in hits, query
+        assert hits[applicant.id] > 0
+
+def test_search_query_syntax_is_escaped():
+    assert search.fts_query('c++ "machine learning" node.js') == '"c++" "machine learning" "node.js"'
+    assert search.fts_query('say"hi OR -') == '"say""hi" "OR"'
+
+def test_bulk_import_runs_as_a_job_with_a_report(client, db, make_user, make_pdf):
+    owner_id, company = make_user("company")
+    pdfs = [make_pdf(["Skills: Python"], "alpha.pdf"), make_pdf(["Skills: Java"], "beta.pdf")]
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        for path in pdfs:
+            _cache_parse(db, path)
+            zip_file.write(path, os.path.basename(path))
+        zip_file.writestr("notes.txt", "not a resume")
+
+    response = client.post("/applicants/bulk-import", headers=company,
+                           files={"archive": ("resumes.zip", archive.getvalue(), "application/zip")})
+    assert response.status_code == 202, response.text
+    job = _wait_for(client, f"/applicants/bulk-import/{response.json()['id']}", company)
+    assert job["status"] == "completed", job
+    assert (job["report"]["imported"], job["report"]["skipped"], job["report"]["failed"]) == (2, 1, 0)
+    imported = [entry["applicant_id"] for entry in job["report"]["files"] if entry["status"] == "imported"]
+    assert db.query(Applicant).filter(Applicant.id.in_(imported), Applicant.user_id == owner_id).count() == 2
+
+    _, other = make_user("company")
+    assert client.get(f"/applicants/bulk-import/{job['id']}", headers=other).status_code == 404
+
+def test_bulk_import_rejects_uploads_that_are_not_zip_archives(client, make_user):
+    _, company = make_user("company")
+    response = client.post("/applicants/bulk-import", headers=company,
+                           files={"archive": ("resumes.zip", b"not a zip", "application/zip")})
+    assert response.status_code == 400
+
+def test_only_one_bulk_import_holds_the_slot(client, db, make_user):
+    owner_id, company = make_user("company")
+    job = bulk_import.create_import_job(db, owner_id, "first.zip")
+    try:
+        with pytest.raises(bulk_import.ImportInProgress):
+            bulk_import.create_import_job(db, owner_id, "second.zip")
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zip_file:
+            zip_file.writestr("notes.txt", "empty")
+        response = client.post("/applicants/bulk-import", headers=company,
+                               files={"archive": ("resumes.zip", archive.getvalue(), "application/zip")})
+        assert response.status_code == 409
+
+        # A job whose process died stops heartbeating and gives the slot up
+        db.query(BulkImportJob).filter(BulkImportJob.id == job.id).update({BulkImportJob.heartbeat_at: job.created_at.replace(year=2000)})
+        db.commit()
+        takeover = bulk_import.create_import_job(db, owner_id, "third.zip")
+        db.refresh(job)
+        assert job.active is None and job.status.value == "failed"
+        takeover.active = None
+        db.commit()
+    finally:
+        db.query(BulkImportJob).filter(BulkImportJob.active.is_(True)).update({BulkImportJob.active: None})
+        db.commit()
+
+def test_failed_batch_is_retried_row_by_row(db, make_user, make_pdf, tmp_path, monkeypatch):
+    owner_id, _ = make_user("company")
+    source = tmp_path / "resumes"
+    source.mkdir()
+    for name, skills in (("Good", "Python"), ("Broken", "Java"), ("Fine", "SQL")):
+        path = make_pdf([f"Skills: {skills}"], f"{name}.pdf")
+        _cache_parse(db, path)
+        os.replace(path, source / f"{name}.pdf")
+
+    index_applicants = search.index_applicants
+    def failing_index(session, applicants):
+        if any(applicant.name == "Broken" for applicant in applicants):
+            raise ValueError("cannot index")
+        index_applicants(session, applicants)
+    monkeypatch.setattr(search, "index_applicants", failing_index)
+
+    report = bulk_import.import_resumes(db, str(source), owner_id, upload_dir="uploads")
+    statuses = {entry["file"]: entry["status"] for entry in report["files"]}
+    assert statuses == {"Broken.pdf": "failed", "Fine.pdf": "imported", "Good.pdf": "imported"}
+    assert db.query(Applicant).filter(Applicant.user_id == owner_id).count() == 2
@@ -0,0 +1,52 @@
+from applicants.models import Applicant
+from auth.models import User, UserRole
+from auth.principal import principal_cache
+from core.config import settings
+
+def test_applicant_cannot_view_another_applicants_profile(client, make_user, make_applicant):
+    own, own_headers = make_applicant(["Python"])
+    other, _ = make_applicant(["Java"])
+    _, company = make_user("company")
+
+    assert client.get(f"/applicants/{own.id}", headers=own_headers).status_code == 200
+    assert client.get(f"/applicants/{other.id}", headers=own_headers).status_code == 403
+    assert client.get(f"/matching/applicants/{other.id}/matches", headers=own_headers).status_code == 403
+    assert client.delete(f"/applicants/{other.id}", headers=own_headers).status_code == 403
+    assert client.get(f"/applicants/{other.id}", headers=company).status_code == 200
+
+def test_applicant_without_profile_is_not_cached(client, db, make_user):
+    user_id, headers = make_user("applicant")
+    assert client.get("/applicants/", headers=headers).json() == []
+    assert principal_cache.get(user_id) is None
+
+    # A profile written by another worker invalidates nothing in this process
+    applicant = Applicant(user_id=user_id, name="Elsewhere", email="elsewhere@example.com", skills=[])
+    db.add(applicant)
+    db.commit()
+    assert [row["id"] for row in client.get("/applicants/", headers=headers).json()] == [applicant.id]
+    assert client.get(f"/applicants/{applicant.id}", headers=headers).status_code == 200
+
+def test_principal_is_served_from_the_cache(client, make_applicant):
+    applicant, headers = make_applicant(["Go"])
+    assert client.get("/auth/me", headers=headers).status_code == 200
+    hits = principal_cache.hits
+    assert client.get(f"/applicants/{applicant.id}", headers=headers).status_code == 200
+    assert principal_cache.hits == hits + 1
+
+def test_token_is_rejected_after_a_role_change(client, db, make_user):
+    user_id, headers = make_user("company")
+    assert client.get("/auth/me", headers=headers).status_code == 200
+
+    db.query(User).filter(User.id == user_id).update({User.role: UserRole.applicant})
+    db.commit()
+    principal_cache.invalidate(user_id)
+    assert client.get("/auth/me", headers=headers).status_code == 401
+
+def test_registration_is_refused_while_the_hashing_queue_is_full(client, monkeypatch):
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 0)
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_QUEUE", 0)
+    response = client.post("/auth/register", json={
+        "username": "queued", "email": "queued@example.com", "password": "secret", "role": "company"
+    })
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
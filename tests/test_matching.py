@@ -0,0 +1,124 @@
+from matching import sync, versions
+from matching.cache import match_cache
+from matching.index import skill_index
+from matching.models import MatchChange
+from matching.scores import match_scores_consistent
+
+def _post_job(client, headers, skills):
+    response = client.post("/jobs/", headers=headers, json={"title": "Engineer", "description": "Build things", "skills": skills})
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+def _candidates(client, headers, job_id, **params):
+    response = client.get(f"/matching/jobs/{job_id}/candidates", headers=headers, params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def _ranking(body, applicant_ids=None):
+    """(id, percentage, matched skills) per candidate, limited to applicant_ids when given (other tests share the database)"""
+    return [
+        (candidate["applicant_id"], candidate["match_percentage"], sorted(candidate["matched_skills"]))
+        for candidate in body["candidates"] if applicant_ids is None or candidate["applicant_id"] in applicant_ids
+    ]
+
+def test_stored_scores_match_in_memory_index(client, db, make_user, make_applicant):
+    _, company = make_user("company")
+    job_id = _post_job(client, company, ["Python", "SQL", "Docker", "React"])
+    full, _ = make_applicant(["Python", "SQL", "Docker", "React"])
+    half, _ = make_applicant(["python", "sql", "Java"])
+    make_applicant(["Java"])
+
+    stored = _candidates(client, company, job_id)
+    live = _candidates(client, company, job_id, mode="approx", recall=1.0)
+    assert _ranking(stored) == _ranking(live)
+    percentages = {applicant_id: percentage for applicant_id, percentage, _ in _ranking(stored)}
+    assert percentages[full.id] == 100.0
+    assert percentages[half.id] == 50.0
+    assert match_scores_consistent(db)
+
+def test_scores_follow_updates_and_deletes(client, db, make_user, make_applicant):
+    _, company = make_user("company")
+    job_id = _post_job(client, company, ["Kubernetes", "Go"])
+    applicant, _ = make_applicant(["Go"])
+    assert _ranking(_candidates(client, company, job_id), [applicant.id]) == [(applicant.id, 50.0, ["go"])]
+
+    response = client.put(f"/jobs/{job_id}", headers=company, json={"skills": ["Go"]})
+    assert response.status_code == 200, response.text
+    assert _ranking(_candidates(client, company, job_id), [applicant.id]) == [(applicant.id, 100.0, ["go"])]
+    assert _ranking(_candidates(client, company, job_id, mode="approx", recall=1.0), [applicant.id]) == [(applicant.id, 100.0, ["go"])]
+
+    response = client.delete(f"/applicants/{applicant.id}", headers=company)
+    assert response.status_code == 200, response.text
+    assert _ranking(_candidates(client, company, job_id), [applicant.id]) == []
+    assert skill_index.applicant_bits(applicant.id) == 0
+    assert match_scores_consistent(db)
+
+def test_cursor_pages_cover_the_full_ranking(client, make_user, make_applicant):
+    _, company = make_user("company")
+    job_id = _post_job(client, company, ["Rust", "C++", "Linux"])
+    for skills in (["Rust"], ["Rust", "Linux"], ["C++"], ["Rust", "C++", "Linux"], ["Linux"]):
+        make_applicant(skills)
+
+    for params in ({}, {"mode": "approx", "recall": 1.0}):
+        full = _candidates(client, company, job_id, **params)
+        pages, cursor = [], None
+        while True:
+            page = _candidates(client, company, job_id, limit=2, **params, **({"cursor": cursor} if cursor else {}))
+            assert page["total_candidates"] == full["total_candidates"]
+            pages.extend(_ranking(page))
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        assert pages == _ranking(full)
+
+def test_invalid_cursor_is_rejected(client, make_user):
+    _, company = make_user("company")
+    job_id = _post_job(client, company, ["Python"])
+    response = client.get(f"/matching/jobs/{job_id}/candidates", headers=company, params={"limit": 1, "cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+def test_cached_candidates_are_invalidated_by_new_applicants(client, make_user, make_applicant):
+    _, company = make_user("company")
+    job_id = _post_job(client, company, ["Haskell"])
+    first, _ = make_applicant(["Haskell"])
+    before = _candidates(client, company, job_id)
+    assert first.id in [row[0] for row in _ranking(before)]
+    hits = match_cache.hits
+    assert _candidates(client, company, job_id) == before
+    assert match_cache.hits == hits + 1
+
+    second, _ = make_applicant(["Haskell"])
+    assert [row[0] for row in _ranking(_candidates(client, company, job_id), [first.id, second.id])] == [first.id, second.id]
+    assert match_cache.hits == hits + 1
+
+def test_other_process_writes_are_applied_from_the_change_log(db, make_applicant, monkeypatch):
+    applicant, _ = make_applicant(["Scala"])
+    # Make this process look like it missed the write, as if another worker made it
+    skill_index.remove_applicant(applicant.id)
+    sync._memory_versions[versions.APPLICANTS] -= 1
+
+    def no_rebuild(*args):
+        raise AssertionError("a logged change must not trigger a full rebuild")
+    monkeypatch.setattr(sync, "load_memory_state", no_rebuild)
+    monkeypatch.setattr(sync, "_request_rebuild", no_rebuild)
+
+    current = sync.ensure_current(db)
+    assert sync.memory_reflects(current)
+    assert skill_index.applicant_bits(applicant.id) != 0
+
+def test_unlogged_change_schedules_a_rebuild(db, make_applicant, monkeypatch):
+    applicant, _ = make_applicant(["Erlang"])
+    version = versions.read(db, [versions.APPLICANTS])[versions.APPLICANTS]
+    db.query(MatchChange).filter(MatchChange.name == versions.APPLICANTS, MatchChange.version == version).delete()
+    db.commit()
+    sync._memory_versions[versions.APPLICANTS] = version - 1
+
+    requested = []
+    monkeypatch.setattr(sync, "_request_rebuild", lambda: requested.append(True))
+    sync.ensure_current(db)
+    assert requested
+    assert not sync.memory_reflects({versions.APPLICANTS: version})
+
+    sync.load_memory_state(db)
+    assert sync.memory_reflects({versions.APPLICANTS: version})
+    assert skill_index.applicant_bits(applicant.id) != 0
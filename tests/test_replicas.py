@@ -0,0 +1,80 @@
+import itertools
+import time
+import pytest
+import database
+from database import SessionLocal, SqliteFileReplica, engine, primary_sequence, choose_replica
+from auth.models import User
+
+@pytest.fixture
+def replica(tmp_path, monkeypatch):
+    """A stand-in replica that only syncs when the test says so"""
+    replica = SqliteFileReplica(engine, str(tmp_path / "replica.db"), interval=60)
+    replica.sync()
+    monkeypatch.setattr(database, "replicas", [replica])
+    monkeypatch.setattr(database, "_replica_cycle", itertools.cycle([replica]))
+    yield replica
+    replica.engine.dispose()
+
+def _write(user_id=None):
+    with SessionLocal() as db:
+        db.info["user_id"] = user_id
+        db.add(User(username=f"watermark{primary_sequence()}", email=f"watermark{primary_sequence()}@example.com",
+                    hashed_password="x", role="company"))
+        db.commit()
+
+def test_only_writing_commits_advance_the_watermark():
+    before = primary_sequence()
+    _write()
+    assert primary_sequence() == before + 1
+
+    with SessionLocal() as db:
+        db.query(User).count()
+        db.commit()
+    with SessionLocal() as db:
+        db.query(User).filter(User.id == -1).update({User.is_active: False})
+        db.rollback()
+    assert primary_sequence() == before + 1
+
+def test_replica_serves_reads_only_once_caught_up(replica):
+    assert replica.caught_up(primary_sequence())
+    assert choose_replica() is replica
+
+    _write()
+    assert not replica.caught_up(primary_sequence())
+    assert choose_replica() is None
+
+    replica.sync()
+    assert replica.sequence == primary_sequence()
+    assert choose_replica() is replica
+
+def test_read_session_follows_the_replica(replica):
+    with database.open_read_session() as db:
+        assert db.info["replica"] is replica
+        assert db.get_bind() is replica.engine
+
+    _write()
+    with database.open_read_session() as db:
+        assert "replica" not in db.info
+        assert db.get_bind() is engine
+
+def test_writer_stays_on_the_primary_after_the_replica_catches_up(replica):
+    _write(user_id=4242)
+    replica.sync()
+    assert choose_replica(4242) is None
+    assert choose_replica(4343) is replica
+
+def test_sticky_window_expires(replica, monkeypatch):
+    monkeypatch.setattr(database.settings, "REPLICA_STICKY_SECONDS", 0.05)
+    _write(user_id=4444)
+    replica.sync()
+    assert choose_replica(4444) is None
+    time.sleep(0.1)
+    assert choose_replica(4444) is replica
+
+def test_api_writes_start_the_callers_sticky_window(client, make_user, replica):
+    user_id, headers = make_user("company")
+    assert not database._is_sticky(user_id)
+    response = client.post("/jobs/", headers=headers, json={"title": "Analyst", "description": "Numbers", "skills": ["SQL"]})
+    assert response.status_code == 200, response.text
+    assert database._is_sticky(user_id)
+    assert client.get("/applications/all", headers=headers).status_code == 200